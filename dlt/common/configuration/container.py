@@ -1,10 +1,13 @@
+import threading
 from contextlib import contextmanager
-from typing import Dict, Iterator, Type, TypeVar
+from typing import Callable, Dict, Iterator, Optional, Type, TypeVar
+from weakref import WeakKeyDictionary
 
 from dlt.common.configuration.specs.base_configuration import ContainerInjectableContext
 from dlt.common.configuration.exceptions import ContainerInjectableContextMangled, ContextDefaultCannotBeCreated
 
 TConfiguration = TypeVar("TConfiguration", bound=ContainerInjectableContext)
+TContexts = Dict[Type[ContainerInjectableContext], ContainerInjectableContext]
 
 
 class Container:
@@ -17,16 +20,22 @@ class Container:
 
     The `injectable_context` allows to set a context with a `with` keyword and then restore the previous one after it gets out of scope.
 
+    The `thread_isolated_contexts` makes a thread (and the thread pools it creates) use its own copy of the contexts so it may run concurrently with
+    a thread that injects contexts, ie. load running in the background while the next micro batch is extracted.
+
     """
 
     _INSTANCE: "Container" = None
 
-    contexts: Dict[Type[ContainerInjectableContext], ContainerInjectableContext]
+    contexts: TContexts
+    thread_contexts: "WeakKeyDictionary[threading.Thread, TContexts]"
+    """Contexts of the isolated threads. All other threads share `contexts`"""
 
     def __new__(cls: Type["Container"]) -> "Container":
         if not cls._INSTANCE:
             cls._INSTANCE = super().__new__(cls)
             cls._INSTANCE.contexts = {}
+            cls._INSTANCE.thread_contexts = WeakKeyDictionary()
         return cls._INSTANCE
 
     def __init__(self) -> None:
@@ -37,11 +46,12 @@ class Container:
         if not issubclass(spec, ContainerInjectableContext):
             raise KeyError(f"{spec.__name__} is not a context")
 
-        item = self.contexts.get(spec)
+        contexts = self._current_contexts()
+        item = contexts.get(spec)
         if item is None:
             if spec.can_create_default:
                 item = spec()
-                self.contexts[spec] = item
+                contexts[spec] = item
                 item.add_extras()
             else:
                 raise ContextDefaultCannotBeCreated(spec)
@@ -52,34 +62,70 @@ class Container:
         # value passed to container must be final
         value.resolve()
         # put it into context
-        self.contexts[spec] = value
+        self._current_contexts()[spec] = value
 
     def __delitem__(self, spec: Type[TConfiguration]) -> None:
-        del self.contexts[spec]
+        del self._current_contexts()[spec]
 
     def __contains__(self, spec: Type[TConfiguration]) -> bool:
-        return spec in self.contexts
-
+        return spec in self._current_contexts()
 
     @contextmanager
     def injectable_context(self, config: TConfiguration) -> Iterator[TConfiguration]:
         """A context manager that will insert `config` into the container and restore the previous value when it gets out of scope."""
         spec = type(config)
+        contexts = self._current_contexts()
         previous_config: ContainerInjectableContext = None
-        if spec in self.contexts:
-            previous_config = self.contexts[spec]
+        if spec in contexts:
+            previous_config = contexts[spec]
         # set new config and yield context
         try:
             self[spec] = config
             yield config
         finally:
             # before setting the previous config for given spec, check if there was no overlapping modification
-            if self.contexts[spec] is config:
+            if contexts[spec] is config:
                 # config is injected for spec so restore previous
                 if previous_config is None:
-                    del self.contexts[spec]
+                    del contexts[spec]
                 else:
-                    self.contexts[spec] = previous_config
+                    contexts[spec] = previous_config
             else:
                 # value was modified in the meantime and not restored
-                raise ContainerInjectableContextMangled(spec, self.contexts[spec], config)
+                raise ContainerInjectableContextMangled(spec, contexts[spec], config)
+
+    def snapshot_contexts(self) -> TContexts:
+        """Returns a copy of the contexts visible in the current thread"""
+        return dict(self._current_contexts())
+
+    @contextmanager
+    def thread_isolated_contexts(self, contexts: TContexts = None) -> Iterator[TContexts]:
+        """A context manager that makes the current thread use `contexts` (by default a copy of the contexts it sees). The contexts injected
+        in the isolated thread are not visible in other threads and the other way around. The threads of the pools created with `thread_pool_initializer`
+        in the isolated thread share its contexts.
+        """
+        thread = threading.current_thread()
+        previous_contexts = self.thread_contexts.get(thread)
+        isolated_contexts = self.snapshot_contexts() if contexts is None else contexts
+        self.thread_contexts[thread] = isolated_contexts
+        try:
+            yield isolated_contexts
+        finally:
+            if previous_contexts is None:
+                del self.thread_contexts[thread]
+            else:
+                self.thread_contexts[thread] = previous_contexts
+
+    def thread_pool_initializer(self) -> Optional[Callable[[], None]]:
+        """Returns an initializer of pool threads that makes them share the contexts of the current thread if it is isolated, otherwise None"""
+        contexts = self.thread_contexts.get(threading.current_thread())
+        if contexts is None:
+            return None
+
+        def _share_contexts() -> None:
+            self.thread_contexts[threading.current_thread()] = contexts
+
+        return _share_contexts
+
+    def _current_contexts(self) -> TContexts:
+        return self.thread_contexts.get(threading.current_thread(), self.contexts)
@@ -84,7 +84,6 @@ def with_config(
         kwargs_arg = next((p for p in sig.parameters.values() if p.kind == Parameter.VAR_KEYWORD), None)
         spec_arg: Parameter = None
         pipeline_name_arg: Parameter = None
-        section_context = ConfigSectionContext(sections=sections, merge_style=sections_merge_style)
 
         if spec is None:
             SPEC = spec_from_signature(f, sig, include_defaults)
@@ -116,8 +115,9 @@ def with_config(
             if _LAST_DLT_CONFIG in kwargs:
                 config = last_config(**kwargs)
             else:
+                # section context is merged with the existing one on each call so it cannot be shared between calls
+                section_context = ConfigSectionContext(sections=sections, merge_style=sections_merge_style)
                 # if section derivation function was provided then call it
-                nonlocal sections
                 if section_f:
                     section_context.sections = (section_f(bound_args.arguments), )
                 # sections may be a string
@@ -26,6 +26,12 @@ class RunConfiguration(BaseConfiguration):
     """Multiplier applied to exponential retry delay for http requests"""
     request_max_retry_delay: float = 300
     """Maximum delay between http request retries"""
+    request_cache: bool = False
+    """Caches the responses of http requests in the working dir of the active pipeline"""
+    request_cache_ttl: Optional[float] = 0
+    """Seconds for which a cached response is used without revalidation. 0 revalidates every request, None never expires the cached responses"""
+    request_cache_max_bytes: Optional[int] = None
+    """Evicts the least recently used responses when the cache exceeds this size"""
     config_files_storage_path: str = "/run/config/"
 
     __section__ = "runtime"
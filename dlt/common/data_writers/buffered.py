@@ -1,7 +1,7 @@
 import gzip
-from typing import List, IO, Any, Optional, Type
+from typing import Callable, List, IO, Any, Optional, Type
 
-from dlt.common.utils import uniq_id
+from dlt.common.utils import estimate_size, uniq_id
 from dlt.common.typing import TDataItem, TDataItems
 from dlt.common.data_writers import TLoaderFileFormat
 from dlt.common.data_writers.exceptions import BufferedDataWriterClosed, DestinationCapabilitiesRequired, InvalidFileNameTemplateException
@@ -17,6 +17,7 @@ class BufferedDataWriter:
     @configspec
     class BufferedDataWriterConfiguration(BaseConfiguration):
         buffer_max_items: int = 5000
+        buffer_max_bytes: Optional[int] = None
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
@@ -32,6 +33,7 @@ class BufferedDataWriter:
         file_name_template: str,
         *,
         buffer_max_items: int = 5000,
+        buffer_max_bytes: int = None,
         file_max_items: int = None,
         file_max_bytes: int = None,
         disable_compression: bool = False,
@@ -45,8 +47,12 @@ class BufferedDataWriter:
         # validate if template has correct placeholders
         self.file_name_template = file_name_template
         self.closed_files: List[str] = []  # all fully processed files
+        self.on_file_closed: Callable[[str], None] = None
+        """Called with the name of each file when it is closed"""
         # buffered items must be less than max items in file
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
+        # buffered items are flushed when their estimated size exceeds max bytes
+        self.buffer_max_bytes = buffer_max_bytes
         self.file_max_bytes = file_max_bytes
         self.file_max_items = file_max_items
         # the open function is either gzip.open or open
@@ -55,6 +61,7 @@ class BufferedDataWriter:
         self._current_columns: TTableSchemaColumns = None
         self._file_name: str = None
         self._buffered_items: List[TDataItem] = []
+        self._buffered_bytes = 0
         self._writer: DataWriter = None
         self._file: IO[Any] = None
         self._closed = False
@@ -67,20 +74,38 @@ class BufferedDataWriter:
         self._ensure_open()
         # rotate file if columns changed and writer does not allow for that
         # as the only allowed change is to add new column (no updates/deletes), we detect the change by comparing lengths
-        if self._writer and not self._writer.data_format().supports_schema_changes and len(columns) != len(self._current_columns):
+        if columns is not None and self._writer and not self._writer.data_format().supports_schema_changes and len(columns) != len(self._current_columns):
             assert len(columns) > len(self._current_columns)
             self._rotate_file()
         # until the first chunk is written we can change the columns schema freely
         if columns is not None:
             self._current_columns = dict(columns)
-        if isinstance(item, List):
+        if self._file_format_spec.file_format == "arrow":
+            self._write_arrow_items(item if isinstance(item, list) else [item])
+            return
+        if isinstance(item, list):
             # items coming in single list will be written together, not matter how many are there
             self._buffered_items.extend(item)
         else:
             self._buffered_items.append(item)
+        if self.buffer_max_bytes:
+            self._buffered_bytes += estimate_size(item)
         # flush if max buffer exceeded
-        if len(self._buffered_items) >= self.buffer_max_items:
+        if len(self._buffered_items) >= self.buffer_max_items or (self.buffer_max_bytes and self._buffered_bytes >= self.buffer_max_bytes):
             self._flush_items()
+        self._rotate_on_limits()
+
+    def _write_arrow_items(self, items: List[TDataItem]) -> None:
+        # arrow tables and batches are already buffered so they are written right away
+        for item in items:
+            # a file holds items with a single arrow schema
+            if self._writer and not self._writer.schema.equals(item.schema):  # type: ignore[attr-defined]
+                self._rotate_file()
+            self._buffered_items.append(item)
+            self._flush_items()
+            self._rotate_on_limits()
+
+    def _rotate_on_limits(self) -> None:
         # rotate the file if max_bytes exceeded
         if self._file:
             # rotate on max file size
@@ -129,6 +154,7 @@ class BufferedDataWriter:
             if self._buffered_items:
                 self._writer.write_data(self._buffered_items)
             self._buffered_items.clear()
+            self._buffered_bytes = 0
 
     def _flush_and_close_file(self) -> None:
         # if any buffered items exist, flush them
@@ -142,6 +168,8 @@ class BufferedDataWriter:
             self.closed_files.append(self._file_name)
             self._writer = None
             self._file = None
+            if self.on_file_closed:
+                self.on_file_closed(self._file_name)
 
     def _ensure_open(self) -> None:
         if self._closed:
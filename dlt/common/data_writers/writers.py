@@ -70,6 +70,8 @@ class DataWriter(abc.ABC):
             return InsertValuesWriter
         elif file_format == "parquet":
             return ParquetDataWriter  # type: ignore
+        elif file_format == "arrow":
+            return ArrowWriter  # type: ignore
         else:
             raise ValueError(file_format)
 
@@ -241,3 +243,31 @@ class ParquetDataWriter(DataWriter):
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
         return TFileFormatSpec("parquet", "parquet", True, False, requires_destination_capabilities=True, supports_compression=False)
+
+
+class ArrowWriter(ParquetDataWriter):
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        # arrow schema is taken from the first written item
+        pass
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        for item in rows:
+            if isinstance(item, pyarrow.RecordBatch):
+                item = pyarrow.Table.from_batches([item])
+            if not self.writer:
+                self.schema = item.schema
+                self.writer = pyarrow.parquet.ParquetWriter(self._f, self.schema, flavor=self.parquet_flavor, version=self.parquet_version, data_page_size=self.parquet_data_page_size)
+            self.writer.write_table(item)
+            self.items_count += item.num_rows
+
+    def write_footer(self) -> None:
+        # file may be empty
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec("arrow", "parquet", True, False, requires_destination_capabilities=False, supports_compression=False)
@@ -1,9 +1,9 @@
-from typing import Iterable, Union, List, Any
+from typing import Iterable, Union, List, Any, Optional
 from itertools import chain
 
 from dlt.common.typing import DictStrAny
 
-from jsonpath_ng import parse as _parse, JSONPath
+from jsonpath_ng import parse as _parse, JSONPath, Child, Fields, Root
 
 
 TJsonPath = Union[str, JSONPath]  # Jsonpath compiled or str
@@ -36,6 +36,33 @@ def find_values(path: TJsonPath, data: DictStrAny) -> List[Any]:
     return [m.value for m in path.find(data)]
 
 
+def extract_key_chain(path: TJsonPath) -> Optional[List[str]]:
+    """Return a list of keys if `path` is a plain key or a chain of keys ie. `a.b.c` or `$.a.b`, otherwise None.
+    Values under such paths may be found with direct dict lookups, without evaluating the json path.
+
+    Example:
+    >>> extract_key_chain('$.a.b')
+    >>> # ['a', 'b']
+    >>> extract_key_chain('a.items[*].b')
+    >>> # None
+    """
+    path = compile_path(path)
+    fields: List[Fields] = []
+    while isinstance(path, Child):
+        if not isinstance(path.right, Fields):
+            return None
+        fields.append(path.right)
+        path = path.left
+    if isinstance(path, Fields):
+        fields.append(path)
+    elif not isinstance(path, Root) or not fields:
+        return None
+    # each element must select a single field
+    if any(len(f.fields) != 1 or f.fields[0] == "*" for f in fields):
+        return None
+    return [f.fields[0] for f in reversed(fields)]
+
+
 def resolve_paths(paths: TAnyJsonPath, data: DictStrAny) -> List[str]:
     """Return a list of paths resolved against `data`. The return value is a list of strings.
 
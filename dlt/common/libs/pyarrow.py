@@ -1,14 +1,24 @@
+import base64
+import secrets
 from dlt.common.exceptions import MissingDependencyException
-from typing import Any, Tuple
+from typing import Any, Tuple, Optional
 
 from dlt.common.destination.capabilities import DestinationCapabilitiesContext
+from dlt.common.schema.typing import TDataType, TTableSchemaColumns
+from dlt.common.schema.utils import new_column
 
 try:
     import pyarrow
+    import pyarrow.compute
     import pyarrow.parquet
 except ImportError:
     raise MissingDependencyException("DLT parquet Helpers", ["parquet"], "DLT Helpers for for parquet.")
 
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
 
 def get_py_arrow_datatype(column_type: str, caps: DestinationCapabilitiesContext) -> Any:
     if column_type == "text":
@@ -43,3 +53,69 @@ def get_py_arrow_numeric(precision: Tuple[int, int]) -> Any:
         return pyarrow.decimal256(*precision)
     # for higher precision use max precision and trim scale to leave the most significant part
     return pyarrow.decimal256(76, max(0, 76 - (precision[0] - precision[1])))
+
+
+def get_column_type_from_py_arrow(dtype: Any) -> Optional[TDataType]:
+    """Maps arrow data type `dtype` into dlt data type. Returns None for null type which does not allow to infer the column type"""
+    if pyarrow.types.is_dictionary(dtype):
+        return get_column_type_from_py_arrow(dtype.value_type)
+    if pyarrow.types.is_null(dtype):
+        return None
+    if pyarrow.types.is_string(dtype) or pyarrow.types.is_large_string(dtype):
+        return "text"
+    elif pyarrow.types.is_floating(dtype):
+        return "double"
+    elif pyarrow.types.is_boolean(dtype):
+        return "bool"
+    elif pyarrow.types.is_timestamp(dtype):
+        return "timestamp"
+    elif pyarrow.types.is_integer(dtype):
+        return "bigint"
+    elif pyarrow.types.is_binary(dtype) or pyarrow.types.is_large_binary(dtype) or pyarrow.types.is_fixed_size_binary(dtype):
+        return "binary"
+    elif pyarrow.types.is_decimal(dtype):
+        return "decimal"
+    elif pyarrow.types.is_date(dtype):
+        return "date"
+    elif pyarrow.types.is_nested(dtype):
+        return "complex"
+    else:
+        # time, duration and interval types are stored as text
+        return "text"
+
+
+def py_arrow_to_table_schema_columns(schema: Any) -> TTableSchemaColumns:
+    """Converts arrow `schema` into dlt table columns. Columns of null type are skipped"""
+    columns: TTableSchemaColumns = {}
+    for field in schema:
+        data_type = get_column_type_from_py_arrow(field.type)
+        if data_type:
+            columns[field.name] = new_column(field.name, data_type, nullable=field.nullable)
+    return columns
+
+
+def is_arrow_item(item: Any) -> bool:
+    """Checks if `item` is arrow table or record batch or pandas data frame that will be converted to arrow table"""
+    return isinstance(item, (pyarrow.Table, pyarrow.RecordBatch)) or (pandas is not None and isinstance(item, pandas.DataFrame))
+
+
+def to_arrow_item(item: Any) -> Any:
+    """Converts pandas data frame into arrow table, other arrow items are returned as they are"""
+    if pandas is not None and isinstance(item, pandas.DataFrame):
+        return pyarrow.Table.from_pandas(item, preserve_index=False)
+    return item
+
+
+def uniq_ids_base64_array(num_rows: int, len_: int = 10) -> Any:
+    """Returns arrow string array with `num_rows` random ids in the format of `uniq_id_base64(len_)`. All the random bytes are generated and encoded in a single pass"""
+    # every id is encoded from whole groups of 3 bytes so the encoded ids are not padded and can be sliced from a single buffer
+    chunk_len = -(-len_ // 3) * 3
+    encoded_len = chunk_len // 3 * 4
+    encoded = base64.b64encode(secrets.token_bytes(chunk_len * num_rows))
+    offsets = pyarrow.array(range(0, encoded_len * (num_rows + 1), encoded_len), pyarrow.int32())
+    ids = pyarrow.Array.from_buffers(pyarrow.string(), num_rows, [None, offsets.buffers()[1], pyarrow.py_buffer(encoded)])
+    # cut to the length of the unpadded encoding of `len_` bytes
+    id_len = -(-len_ * 4 // 3)
+    if id_len < encoded_len:
+        ids = pyarrow.compute.utf8_slice_codeunits(ids, 0, id_len)
+    return ids
@@ -29,15 +29,25 @@ class ExtractDataInfo(TypedDict):
     data_type: str
 
 
+class ExtractMetrics(TypedDict):
+    dynamic_table_schemas: int
+    """Number of table schemas computed from dynamic hints"""
+    dynamic_table_schemas_cached: int
+    """Number of items for which the table schema computed from dynamic hints was reused"""
+
+
 class ExtractInfo(NamedTuple):
     """A tuple holding information on extracted data items. Returned by pipeline `extract` method."""
 
     extract_data_info: List[ExtractDataInfo]
+    metrics: ExtractMetrics = None
 
     def asdict(self) -> DictStrAny:
         return {}
 
     def asstr(self, verbosity: int = 0) -> str:
+        if verbosity > 0 and self.metrics:
+            return f"Dynamic table schemas computed: {self.metrics['dynamic_table_schemas']}, reused: {self.metrics['dynamic_table_schemas_cached']}"
         return ""
 
     def __str__(self) -> str:
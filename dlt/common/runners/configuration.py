@@ -11,11 +11,13 @@ class PoolRunnerConfiguration(BaseConfiguration):
     pool_type: TPoolType = None  # type of pool to run, must be set in derived configs
     workers: Optional[int] = None  # how many threads/processes in the pool
     run_sleep: float = 0.1  # how long to sleep between runs with workload, seconds
+    persistent_pool: bool = False  # keep the pool between runs, pool is terminated at exit
 
     if TYPE_CHECKING:
         def __init__(
             self,
             pool_type: TPoolType = None,
-            workers: int = None
+            workers: int = None,
+            persistent_pool: bool = False
         ) -> None:
             ...
@@ -1,15 +1,22 @@
+import atexit
+import threading
 import multiprocessing
-from typing import Callable, Union, cast
+from typing import Callable, Dict, Optional, Tuple, Union, cast
 from multiprocessing.pool import ThreadPool, Pool
 
 from dlt.common import logger, sleep
+from dlt.common.configuration.container import Container
 from dlt.common.runtime import init
 from dlt.common.runners.runnable import Runnable, TPool
-from dlt.common.runners.configuration import PoolRunnerConfiguration
+from dlt.common.runners.configuration import PoolRunnerConfiguration, TPoolType
 from dlt.common.runners.typing import TRunMetrics
 from dlt.common.runtime import signals
 from dlt.common.exceptions import SignalReceivedException
 
+# pools kept between the runs by pool type and number of workers
+_PERSISTENT_POOLS: Dict[Tuple[TPoolType, Optional[int]], Pool] = {}
+_PERSISTENT_POOLS_LOCK = threading.Lock()
+
 
 def create_pool(config: PoolRunnerConfiguration) -> Pool:
     if config.pool_type == "process":
@@ -19,20 +26,59 @@ def create_pool(config: PoolRunnerConfiguration) -> Pool:
         else:
             return Pool(processes=config.workers)
     elif config.pool_type == "thread":
-        return ThreadPool(processes=config.workers)
+        # threads of the pool share the contexts of a thread isolated in the container
+        return ThreadPool(processes=config.workers, initializer=Container().thread_pool_initializer())
     # no pool - single threaded
     return None
 
 
+def get_persistent_pool(config: PoolRunnerConfiguration) -> Pool:
+    """Returns a pool with the type and number of workers from `config` that is reused between the runs. Pools are terminated at exit"""
+    key = (config.pool_type, config.workers)
+    with _PERSISTENT_POOLS_LOCK:
+        pool = _PERSISTENT_POOLS.get(key)
+        if pool is None:
+            pool = create_pool(config)
+            if pool is not None:
+                logger.info(f"Created persistent {config.pool_type} pool with {config.workers or 'default no.'} workers")
+                _PERSISTENT_POOLS[key] = pool
+        return pool
+
+
+def close_persistent_pool(pool: Pool) -> None:
+    """Terminates persistent `pool` so it is not reused"""
+    with _PERSISTENT_POOLS_LOCK:
+        for key, p in list(_PERSISTENT_POOLS.items()):
+            if p is pool:
+                del _PERSISTENT_POOLS[key]
+    pool.terminate()
+
+
+def close_persistent_pools() -> None:
+    """Terminates all persistent pools"""
+    with _PERSISTENT_POOLS_LOCK:
+        pools = list(_PERSISTENT_POOLS.values())
+        _PERSISTENT_POOLS.clear()
+    for pool in pools:
+        pool.terminate()
+
+
+atexit.register(close_persistent_pools)
+
+
 def run_pool(config: PoolRunnerConfiguration, run_f: Union[Runnable[TPool], Callable[[TPool], TRunMetrics]]) -> int:
     # validate the run function
     if not isinstance(run_f, Runnable) and not callable(run_f):
         raise ValueError(run_f, "Pool runner entry point must be a function f(pool: TPool) or Runnable")
 
-    # start pool
-    pool = create_pool(config)
-    logger.info(f"Created {config.pool_type} pool with {config.workers or 'default no.'} workers")
+    # start pool or reuse the pool from previous runs
+    if config.persistent_pool:
+        pool = get_persistent_pool(config)
+    else:
+        pool = create_pool(config)
+        logger.info(f"Created {config.pool_type} pool with {config.workers or 'default no.'} workers")
     runs_count = 1
+    completed = False
 
     def _run_func() -> bool:
         if callable(run_f):
@@ -50,13 +96,19 @@ def run_pool(config: PoolRunnerConfiguration, run_f: Union[Runnable[TPool], Call
             signals.raise_if_signalled()
             runs_count += 1
             sleep(config.run_sleep)
+        completed = True
         return runs_count
     except SignalReceivedException as sigex:
         # sleep this may raise SignalReceivedException
         logger.warning(f"Exiting runner due to signal {sigex.signal_code}")
         raise
     finally:
-        if pool:
+        if pool and config.persistent_pool:
+            # keep the pool for the next run, pool that failed may be in undefined state
+            if not completed:
+                logger.info("Closing persistent processing pool after failed run")
+                close_persistent_pool(pool)
+        elif pool:
             logger.info("Closing processing pool")
             # terminate pool and do not join
             pool.terminate()
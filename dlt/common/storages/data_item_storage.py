@@ -13,19 +13,21 @@ class DataItemStorage(ABC):
         self.buffered_writers: Dict[str, BufferedDataWriter] = {}
         super().__init__(*args)
 
-    def get_writer(self, load_id: str, schema_name: str, table_name: str) -> BufferedDataWriter:
+    def get_writer(self, load_id: str, schema_name: str, table_name: str, file_format: TLoaderFileFormat = None) -> BufferedDataWriter:
+        file_format = file_format or self.loader_file_format
         # unique writer id
-        writer_id = f"{load_id}.{schema_name}.{table_name}"
+        writer_id = f"{load_id}.{schema_name}.{table_name}.{file_format}"
         writer = self.buffered_writers.get(writer_id, None)
         if not writer:
             # assign a jsonl writer for each table
             path = self._get_data_item_path_template(load_id, schema_name, table_name)
-            writer = BufferedDataWriter(self.loader_file_format, path)
+            writer = BufferedDataWriter(file_format, path)
             self.buffered_writers[writer_id] = writer
         return writer
 
-    def write_data_item(self, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns) -> None:
-        writer = self.get_writer(load_id, schema_name, table_name)
+    def write_data_item(self, load_id: str, schema_name: str, table_name: str, item: TDataItems, columns: TTableSchemaColumns, file_format: TLoaderFileFormat = None) -> None:
+        """Writes `item` with a writer for `file_format`. If not set, the default `loader_file_format` of the storage is used"""
+        writer = self.get_writer(load_id, schema_name, table_name, file_format)
         # write item(s)
         writer.write_data_item(item, columns)
 
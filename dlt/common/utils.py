@@ -425,3 +425,25 @@ def compressed_b64decode(value: str) -> bytes:
 
 def identity(x: TAny) -> TAny:
     return x
+
+
+def estimate_size(obj: Any, sample_size: int = 10) -> int:
+    """Estimates the memory taken by a data item in bytes. Arrow tables and data frames report the size of their buffers, the size of
+    a list is extrapolated from its first `sample_size` elements and dicts are measured recursively. Used to bound the memory of buffered items"""
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(sys.getsizeof(k) + estimate_size(v, sample_size) for k, v in obj.items())
+    if isinstance(obj, list):
+        if len(obj) == 0:
+            return sys.getsizeof(obj)
+        sample = obj[:sample_size]
+        return sys.getsizeof(obj) + sum(estimate_size(i, sample_size) for i in sample) * len(obj) // len(sample)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+    # arrow tables and record batches, numpy arrays
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    # pandas data frames
+    if derives_from_class_of_name(obj, "DataFrame"):
+        return int(obj.memory_usage(index=True).sum())
+    return sys.getsizeof(obj)
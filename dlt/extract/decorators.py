@@ -1,6 +1,6 @@
 import os
 import inspect
-from types import ModuleType
+from types import FrameType, ModuleType
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, List, Optional, Tuple, Type, TypeVar, Union, cast, overload
 
@@ -22,7 +22,7 @@ from dlt.common.utils import get_callable_name, get_module_name, is_inner_callab
 from dlt.extract.exceptions import InvalidTransformerDataTypeGeneratorFunctionRequired, ResourceFunctionExpected, ResourceInnerCallableConfigWrapDisallowed, SourceDataIsNone, SourceIsAClassTypeError, ExplicitSourceNameInvalid, SourceNotAFunction, SourceSchemaNotAvailable
 from dlt.extract.incremental import IncrementalResourceWrapper
 
-from dlt.extract.typing import TTableHintTemplate
+from dlt.extract.typing import TParallelizedMode, TTableHintTemplate
 from dlt.extract.source import DltResource, DltSource, TUnboundDltResource
 
 
@@ -198,7 +198,13 @@ def resource(
     primary_key: TTableHintTemplate[TColumnKey] = None,
     merge_key: TTableHintTemplate[TColumnKey] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_parallel_items: int = None,
+    batch_size: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False,
+    weight: float = None,
+    priority: int = None
 ) -> Callable[TResourceFunParams, DltResource]:
     ...
 
@@ -213,7 +219,13 @@ def resource(
     primary_key: TTableHintTemplate[TColumnKey] = None,
     merge_key: TTableHintTemplate[TColumnKey] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_parallel_items: int = None,
+    batch_size: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False,
+    weight: float = None,
+    priority: int = None
 ) -> Callable[[Callable[TResourceFunParams, Any]], DltResource]:
     ...
 
@@ -228,7 +240,13 @@ def resource(
     primary_key: TTableHintTemplate[TColumnKey] = None,
     merge_key: TTableHintTemplate[TColumnKey] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_parallel_items: int = None,
+    batch_size: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False,
+    weight: float = None,
+    priority: int = None
 ) -> DltResource:
     ...
 
@@ -245,8 +263,14 @@ def resource(
     selected: bool = True,
     spec: Type[BaseConfiguration] = None,
     depends_on: TUnboundDltResource = None,
+    *,
+    max_parallel_items: int = None,
+    batch_size: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False,
+    weight: float = None,
+    priority: int = None
 ) -> Any:
-    """When used as a decorator, transforms any generator (yielding) function into a `dlt resource`. When used as a function, it transforms data in `data` argument into a `dlt resource`.
+    """When used as a decorator, transforms any generator (yielding) or async generator function into a `dlt resource`. When used as a function, it transforms data in `data` argument into a `dlt resource`.
 
     ### Summary
     A `resource`is a location within a `source` that holds the data with specific structure (schema) or coming from specific origin. A resource may be a rest API endpoint, table in the database or a tab in Google Sheets.
@@ -294,6 +318,18 @@ def resource(
 
         depends_on (TUnboundDltResource, optional): Allows to pipe data from one resource to another to build multi-step pipelines.
 
+        max_parallel_items (int, optional): Limits the number of items from this resource (awaitables, deferred functions and async generators) evaluated in parallel. The global `max_parallel_items` still applies.
+
+        batch_size (int, optional): Collects single data items yielded by the resource into lists of up to `batch_size` items before they are passed to the transform steps (ie. `add_map`, `add_filter`) and the transformers.
+        Speeds up the extraction of resources that yield one small item at a time. Ignored for transformers.
+
+        parallelized (bool | Literal["ordered", "unordered"], optional): Evaluates the resource generator in the thread pool so several resources are extracted in parallel. For transformers, each call to the decorated function is evaluated in the thread pool.
+        If `True` or "unordered", items are yielded as soon as they are available, "ordered" preserves the order of the calls. Defaults to False.
+
+        weight (float, optional): Share of the extraction time given to this resource relative to other resources when `next_item_mode` is "weighted". Defaults to 1.
+
+        priority (int, optional): Resources with higher priority are extracted before the others when `next_item_mode` is "priority". Defaults to 0.
+
     ### Raises
         ResourceNameMissing: indicates that name of the resource cannot be inferred from the `data` being passed.
         InvalidResourceDataType: indicates that the `data` argument cannot be converted into `dlt resource`
@@ -309,7 +345,18 @@ def resource(
             primary_key=primary_key,
             merge_key=merge_key
         )
-        return DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, depends_on), incremental=incremental)
+        resource = DltResource.from_data(_data, _name, _section, table_template, selected, cast(DltResource, depends_on), incremental=incremental)
+        if max_parallel_items is not None:
+            resource.max_parallel_items = max_parallel_items
+        if batch_size is not None:
+            resource.batch_size = batch_size
+        if parallelized:
+            resource.parallelized = "unordered" if parallelized is True else parallelized
+        if weight is not None:
+            resource.weight = weight
+        if priority is not None:
+            resource.priority = priority
+        return resource
 
 
     def decorator(f: Callable[TResourceFunParams, Any]) -> Callable[TResourceFunParams, DltResource]:
@@ -362,9 +409,14 @@ def resource(
     else:
         # take name from the generator
         source_section: str = None
+        frame: FrameType = None
         if inspect.isgenerator(data):
+            frame = data.gi_frame
+        elif inspect.isasyncgen(data):
+            frame = data.ag_frame
+        if frame is not None:
             name = name or get_callable_name(data)  # type: ignore
-            func_module = inspect.getmodule(data.gi_frame)
+            func_module = inspect.getmodule(frame)
             source_section = _get_source_section_name(func_module)
 
         return make_resource(name, source_section, data)
@@ -382,7 +434,10 @@ def transformer(
     primary_key: TTableHintTemplate[TColumnKey] = None,
     merge_key: TTableHintTemplate[TColumnKey] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_parallel_items: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False
 ) -> Callable[[Callable[Concatenate[TDataItem, TResourceFunParams], Any]], Callable[TResourceFunParams, DltResource]]:
     ...
 
@@ -398,7 +453,10 @@ def transformer(
     primary_key: TTableHintTemplate[TColumnKey] = None,
     merge_key: TTableHintTemplate[TColumnKey] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_parallel_items: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False
 ) -> Callable[TResourceFunParams, DltResource]:
     ...
 
@@ -413,7 +471,10 @@ def transformer(  # type: ignore
     primary_key: TTableHintTemplate[TColumnKey] = None,
     merge_key: TTableHintTemplate[TColumnKey] = None,
     selected: bool = True,
-    spec: Type[BaseConfiguration] = None
+    spec: Type[BaseConfiguration] = None,
+    *,
+    max_parallel_items: int = None,
+    parallelized: Union[bool, TParallelizedMode] = False
 ) -> Callable[[Callable[Concatenate[TDataItem, TResourceFunParams], Any]], Callable[TResourceFunParams, DltResource]]:
     """A form of `dlt resource` that takes input from other resources via `data_from` argument in order to enrich or transform the data.
 
@@ -466,6 +527,11 @@ def transformer(  # type: ignore
         selected (bool, optional): When `True` `dlt pipeline` will extract and load this resource, if `False`, the resource will be ignored.
 
         spec (Type[BaseConfiguration], optional): A specification of configuration and secret values required by the source.
+
+        max_parallel_items (int, optional): Limits the number of items from this transformer (awaitables, deferred functions and async generators) evaluated in parallel. The global `max_parallel_items` still applies.
+
+        parallelized (bool | Literal["ordered", "unordered"], optional): Evaluates each call to the decorated function in the thread pool so data items from `data_from` are transformed in parallel. The number of threads is controlled by the `workers` option.
+        If `True` or "unordered", items are yielded as soon as they are available, "ordered" preserves the order of the parent items. Defaults to False.
     """
     if isinstance(f, DltResource):
         raise ValueError("Please pass `data_from=` argument as keyword argument. The only positional argument to transformer is the decorated function")
@@ -480,7 +546,9 @@ def transformer(  # type: ignore
         merge_key=merge_key,
         selected=selected,
         spec=spec,
-        depends_on=data_from
+        depends_on=data_from,
+        max_parallel_items=max_parallel_items,
+        parallelized=parallelized
     )
 
 
@@ -9,6 +9,13 @@ class ExtractorException(DltException):
     pass
 
 
+class ProcessExtractNotSupported(ExtractorException):
+    def __init__(self, process_workers: int, feature: str) -> None:
+        self.process_workers = process_workers
+        self.feature = feature
+        super().__init__(f"Extract in {process_workers} process_workers cannot be used together with {feature}. The forked processes do not report the closed files and batches back and the background threads of the pipeline must not be forked. Set process_workers to 1 or disable {feature}.")
+
+
 class DltSourceException(DltException):
     pass
 
@@ -88,7 +95,7 @@ class InvalidResourceDataType(DltResourceException):
 
 class InvalidResourceDataTypeAsync(InvalidResourceDataType):
     def __init__(self, resource_name: str, item: Any,_typ: Type[Any]) -> None:
-        super().__init__(resource_name, item, _typ, "Async iterators and generators are not valid resources. Please use standard iterators and generators that yield Awaitables instead (for example by yielding from async function without await")
+        super().__init__(resource_name, item, _typ, "Async iterables that are not async iterators are not valid resources. Please use async generators or standard iterators and generators that yield Awaitables instead (for example by yielding from async function without await")
 
 
 class InvalidResourceDataTypeBasic(InvalidResourceDataType):
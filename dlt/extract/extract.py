@@ -1,26 +1,48 @@
 import contextlib
+import multiprocessing
 import os
-from typing import ClassVar, List, Set
+import time
+from copy import deepcopy
+from functools import partial
+from typing import Any, Callable, ClassVar, Dict, List, Sequence, Set, Tuple
 
+from dlt.common.configuration import configspec
 from dlt.common.configuration.container import Container
+from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.resolve import inject_section
+from dlt.common.configuration.specs import BaseConfiguration
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
-from dlt.common.pipeline import _reset_resource_state
+from dlt.common.exceptions import MissingDependencyException, UnsupportedProcessStartMethodException
+from dlt.common.pipeline import ExtractMetrics, _reset_resource_state, source_state
 
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.utils import uniq_id
-from dlt.common.typing import TDataItems, TDataItem
+from dlt.common.typing import DictStrAny, TDataItems, TDataItem
+from dlt.common.data_writers import BufferedDataWriter, TLoaderFileFormat
 from dlt.common.schema import Schema, utils, TSchemaUpdate
 from dlt.common.storages import NormalizeStorageConfiguration, NormalizeStorage, DataItemStorage
 from dlt.common.configuration.specs import known_sections
 
 from dlt.extract.decorators import SourceSchemaInjectableContext
-from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints
-from dlt.extract.pipe import PipeIterator
+from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints, ProcessExtractNotSupported
+from dlt.extract.pipe import PipeItem, PipeIterator
 from dlt.extract.source import DltResource, DltSource
 from dlt.extract.typing import TableNameMeta
 
+try:
+    from dlt.common.libs import pyarrow
+except MissingDependencyException:
+    pyarrow = None
+
+
+@configspec
+class ExtractorConfiguration(BaseConfiguration):
+    process_workers: int = 1
+    """Number of processes extracting the independent resources of a source in parallel. Resources connected by transformers are always extracted in the same process"""
+
+    __section__ = "extract"
+
 
 class ExtractorStorage(DataItemStorage, NormalizeStorage):
     EXTRACT_FOLDER: ClassVar[str] = "extract"
@@ -29,14 +51,20 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
         # data item storage with jsonl with pua encoding
         super().__init__("puae-jsonl", True, C)
         self.storage.create_folder(ExtractorStorage.EXTRACT_FOLDER, exists_ok=True)
+        # files closed by the writers and not yet committed, by extract id
+        self._closed_files: Dict[str, List[str]] = {}
+        # number of files closed by the writers since the last batch, by extract id
+        self._closed_files_count: Dict[str, int] = {}
 
     def create_extract_id(self) -> str:
         extract_id = uniq_id()
         self.storage.create_folder(self._get_extract_path(extract_id))
         return extract_id
 
-    def commit_extract_files(self, extract_id: str, with_delete: bool = True) -> None:
+    def commit_extract_files(self, extract_id: str, with_delete: bool = True) -> List[str]:
+        """Moves all files extracted in `extract_id` to be normalized and returns their names"""
         extract_path = self._get_extract_path(extract_id)
+        committed_files: List[str] = []
         for file in self.storage.list_folder_files(extract_path, to_root=False):
             from_file = os.path.join(extract_path, file)
             to_file = os.path.join(NormalizeStorage.EXTRACTED_FOLDER, file)
@@ -45,8 +73,65 @@ class ExtractorStorage(DataItemStorage, NormalizeStorage):
             else:
                 # create hardlink which will act as a copy
                 self.storage.link_hard(from_file, to_file)
+            committed_files.append(to_file)
         if with_delete:
             self.storage.delete_folder(extract_path, recursively=True)
+            self._closed_files.pop(extract_id, None)
+        return committed_files
+
+    def commit_closed_files(self, extract_id: str) -> List[str]:
+        """Moves files of `extract_id` that were already closed by the writers (ie. on reaching `file_max_items`) to be normalized and returns their names.
+        The files still being written are committed with `commit_extract_files`"""
+        closed_files = self._closed_files.pop(extract_id, None)
+        if not closed_files:
+            return []
+        extract_path = self._get_extract_path(extract_id)
+        committed_files: List[str] = []
+        for closed_file in closed_files:
+            file = os.path.basename(closed_file)
+            to_file = os.path.join(NormalizeStorage.EXTRACTED_FOLDER, file)
+            self.storage.atomic_rename(os.path.join(extract_path, file), to_file)
+            committed_files.append(to_file)
+        return committed_files
+
+    def closed_files_count(self, extract_id: str) -> int:
+        """Returns the number of files of `extract_id` closed by the writers since the last batch was committed"""
+        return self._closed_files_count.get(extract_id, 0)
+
+    def merge_extract_files(self, extract_id: str, into_extract_id: str) -> None:
+        """Moves all files extracted in `extract_id` into `into_extract_id` and deletes the `extract_id` folder"""
+        extract_path = self._get_extract_path(extract_id)
+        into_path = self._get_extract_path(into_extract_id)
+        for file in self.storage.list_folder_files(extract_path, to_root=False):
+            self.storage.atomic_rename(os.path.join(extract_path, file), os.path.join(into_path, file))
+        self.storage.delete_folder(extract_path, recursively=True)
+
+    def delete_extract_files(self, extract_id: str) -> None:
+        """Deletes the `extract_id` folder with all the files extracted into it, if it exists"""
+        extract_path = self._get_extract_path(extract_id)
+        if self.storage.has_folder(extract_path):
+            self.storage.delete_folder(extract_path, recursively=True)
+
+    def commit_extract_batch(self, extract_id: str) -> List[str]:
+        """Closes the writers of `extract_id` and moves all the extracted files to be normalized. Extraction into `extract_id` may continue with new writers"""
+        self.close_writers(extract_id)
+        for writer_id in [writer_id for writer_id in self.buffered_writers if writer_id.startswith(extract_id)]:
+            del self.buffered_writers[writer_id]
+        committed_files = self.commit_extract_files(extract_id)
+        self._closed_files_count.pop(extract_id, None)
+        self.storage.create_folder(self._get_extract_path(extract_id))
+        return committed_files
+
+    def get_writer(self, load_id: str, schema_name: str, table_name: str, file_format: TLoaderFileFormat = None) -> BufferedDataWriter:
+        writer = super().get_writer(load_id, schema_name, table_name, file_format)
+        if writer.on_file_closed is None:
+            # collect closed files so they are committed and counted without scanning all the writers
+            writer.on_file_closed = partial(self._on_file_closed, load_id)
+        return writer
+
+    def _on_file_closed(self, extract_id: str, file_name: str) -> None:
+        self._closed_files.setdefault(extract_id, []).append(file_name)
+        self._closed_files_count[extract_id] = self._closed_files_count.get(extract_id, 0) + 1
 
     def _get_data_item_path_template(self, load_id: str, schema_name: str, table_name: str) -> str:
         template = NormalizeStorage.build_extracted_file_stem(schema_name, table_name, "%s")
@@ -64,12 +149,38 @@ def extract(
     *,
     max_parallel_items: int = None,
     workers: int = None,
-    futures_poll_interval: float = None
+    futures_poll_interval: float = None,
+    metrics: ExtractMetrics = None,
+    on_files_closed: Callable[[TSchemaUpdate, Sequence[str]], None] = None,
+    batch_max_items: int = None,
+    batch_max_seconds: float = None,
+    batch_max_files: int = None,
+    on_batch_end: Callable[[TSchemaUpdate], None] = None
 ) -> TSchemaUpdate:
+    """Extracts the selected resources of the `source` into `storage` and returns the table schemas created from resource hints.
+
+    If `on_files_closed` is provided, the files that reached the writer size limits are committed while extraction is running. The callback receives
+    a copy of the table schemas created so far and the names of the committed files.
+
+    If `on_batch_end` is provided, the extraction is split into batches of up to `batch_max_items` items, `batch_max_seconds` seconds or `batch_max_files`
+    files closed by the writers. At the end of each batch all the files are committed and the callback receives the table schemas created in that batch. The last batch is returned.
+    """
 
     dynamic_tables: TSchemaUpdate = {}
     schema = source.schema
     resources_with_items: Set[str] = set()
+    # last arrow schema seen for a table
+    arrow_schemas: Dict[str, Any] = {}
+    # resources and their static table names by pipe id, resolved on the first item of a pipe
+    resources_by_pipe: Dict[str, Tuple[DltResource, str]] = {}
+    # normalized names and writers by table name
+    table_writers: Dict[str, Tuple[str, BufferedDataWriter]] = {}
+    # resources, table names and dynamic hints for which the table schema was already computed
+    computed_table_schemas: Set[Tuple[str, str, Any]] = set()
+    if metrics is None:
+        metrics = ExtractMetrics(dynamic_table_schemas=0, dynamic_table_schemas_cached=0)
+    batch_items = 0
+    batch_started_at = time.monotonic()
 
     with collector(f"Extract {source.name}"):
 
@@ -78,31 +189,76 @@ def extract(
             storage.write_empty_file(extract_id, schema.name, table_name, None)
 
         def _write_item(table_name: str, resource_name: str, item: TDataItems) -> None:
-            # normalize table name before writing so the name match the name in schema
-            # note: normalize function should be cached so there's almost no penalty on frequent calling
-            # note: column schema is not required for jsonl writer used here
-            table_name = schema.naming.normalize_identifier(table_name)
+            if pyarrow and not isinstance(item, dict) and (pyarrow.is_arrow_item(item) or (isinstance(item, list) and item and pyarrow.is_arrow_item(item[0]))):
+                _write_arrow_item(table_name, resource_name, item)
+                return
+            table_writer = table_writers.get(table_name)
+            if table_writer is None:
+                # normalize table name before writing so the name match the name in schema
+                # note: column schema is not required for jsonl writer used here
+                normalized_name = schema.naming.normalize_identifier(table_name)
+                table_writer = table_writers[table_name] = (normalized_name, storage.get_writer(extract_id, schema.name, normalized_name))
+            collector.update(table_writer[0])
+            resources_with_items.add(resource_name)
+            table_writer[1].write_data_item(item, None)
+
+        def _write_arrow_item(table_name: str, resource_name: str, item: TDataItems) -> None:
+            items = [pyarrow.to_arrow_item(i) for i in (item if isinstance(item, list) else [item])]
+            # add columns from arrow schema to the partial table, columns declared in the resource take precedence
+            partial_columns = dynamic_tables[table_name][0].setdefault("columns", {})
+            normalized_name = schema.naming.normalize_identifier(table_name)
+            # columns already in the schema keep their types, normalize casts the arrow data to them
+            existing_columns = schema.get_table_columns(normalized_name) if normalized_name in schema.tables else {}
+            for arrow_item in items:
+                last_schema = arrow_schemas.get(table_name)
+                if last_schema is None or not last_schema.equals(arrow_item.schema):
+                    arrow_schemas[table_name] = arrow_item.schema
+                    for column_name, column in pyarrow.py_arrow_to_table_schema_columns(arrow_item.schema).items():
+                        if schema.naming.normalize_identifier(column_name) not in existing_columns:
+                            partial_columns.setdefault(column_name, column)
+            table_name = normalized_name
             collector.update(table_name)
             resources_with_items.add(resource_name)
-            storage.write_data_item(extract_id, schema.name, table_name, item, None)
+            # arrow items are written as parquet files without conversion to python objects
+            storage.write_data_item(extract_id, schema.name, table_name, items, None, file_format="arrow")
 
         def _write_dynamic_table(resource: DltResource, item: TDataItem) -> None:
             table_name = resource._table_name_hint_fun(item)
             existing_table = dynamic_tables.get(table_name)
-            if existing_table is None:
-                dynamic_tables[table_name] = [resource.table_schema(item)]
-            else:
-                # quick check if deep table merge is required
-                if resource._table_has_other_dynamic_hints:
-                    new_table = resource.table_schema(item)
+            # other dynamic hints are evaluated once per table name unless the resource requests evaluation for each item
+            hints_key: Tuple[str, str, Any] = None
+            evaluate_hints = resource._table_has_other_dynamic_hints and resource.evaluate_hints_per_item
+            if evaluate_hints:
+                try:
+                    # the table schema is computed again only when values of other dynamic hints change
+                    hints_key = (resource.name, table_name, resource.dynamic_hints_key(item))
+                except TypeError:
+                    # hints cannot be hashed so table schema is always computed
+                    pass
+            if existing_table is None or (evaluate_hints and (hints_key is None or hints_key not in computed_table_schemas)):
+                new_table = resource.table_schema(item)
+                if existing_table is None:
+                    dynamic_tables[table_name] = [new_table]
+                else:
                     # this merges into existing table in place
                     utils.merge_tables(existing_table[0], new_table)
-                else:
-                    # if there are no other dynamic hints besides name then we just leave the existing partial table
-                    pass
+                metrics["dynamic_table_schemas"] += 1
+                if hints_key is not None:
+                    computed_table_schemas.add(hints_key)
+            else:
+                # other dynamic hints were evaluated for the first item with this table name or their values did not change so we just leave the existing partial table
+                metrics["dynamic_table_schemas_cached"] += 1
             # write to storage with inferred table name
             _write_item(table_name, resource.name, item)
 
+        def _end_batch() -> None:
+            # writers and table schemas are created again in the next batch
+            table_writers.clear()
+            computed_table_schemas.clear()
+            storage.commit_extract_batch(extract_id)
+            on_batch_end(dynamic_tables)
+            dynamic_tables.clear()
+
         def _write_static_table(resource: DltResource, table_name: str) -> None:
             existing_table = dynamic_tables.get(table_name)
             if existing_table is None:
@@ -110,6 +266,32 @@ def extract(
                 static_table["name"] = table_name
                 dynamic_tables[table_name] = [static_table]
 
+        def _write_pipe_item(pipe_item: PipeItem) -> None:
+            # TODO: many resources may be returned. if that happens the item meta must be present with table name and this name must match one of resources
+            pipe_id = pipe_item.pipe._pipe_id
+            resource_dispatch = resources_by_pipe.get(pipe_id)
+            if resource_dispatch is None:
+                resource = source.resources.find_by_pipe(pipe_item.pipe)
+                static_table_name = None if resource._table_name_hint_fun else resource.table_name
+                resource_dispatch = resources_by_pipe[pipe_id] = (resource, static_table_name)
+            resource, static_table_name = resource_dispatch
+            # if meta contains table name
+            if isinstance(pipe_item.meta, TableNameMeta):
+                table_name = pipe_item.meta.table_name
+                _write_static_table(resource, table_name)
+                _write_item(table_name, resource.name, pipe_item.item)
+            elif static_table_name is None:
+                # get partial table from table template
+                if isinstance(pipe_item.item, list):
+                    for item in pipe_item.item:
+                        _write_dynamic_table(resource, item)
+                else:
+                    _write_dynamic_table(resource, pipe_item.item)
+            else:
+                # write item belonging to table with static name
+                _write_static_table(resource, static_table_name)
+                _write_item(static_table_name, resource.name, pipe_item.item)
+
         # yield from all selected pipes
         with PipeIterator.from_pipes(source.resources.selected_pipes, max_parallel_items=max_parallel_items, workers=workers, futures_poll_interval=futures_poll_interval) as pipes:
             left_gens = total_gens = len(pipes._sources)
@@ -124,27 +306,23 @@ def extract(
 
                 signals.raise_if_signalled()
 
-                # TODO: many resources may be returned. if that happens the item meta must be present with table name and this name must match one of resources
-                # if meta contains table name
-                resource = source.resources.find_by_pipe(pipe_item.pipe)
-                table_name: str = None
-                if isinstance(pipe_item.meta, TableNameMeta):
-                    table_name = pipe_item.meta.table_name
-                    _write_static_table(resource, table_name)
-                    _write_item(table_name, resource.name, pipe_item.item)
-                else:
-                    # get partial table from table template
-                    if resource._table_name_hint_fun:
-                        if isinstance(pipe_item.item, List):
-                            for item in pipe_item.item:
-                                _write_dynamic_table(resource, item)
-                        else:
-                            _write_dynamic_table(resource, pipe_item.item)
-                    else:
-                        # write item belonging to table with static name
-                        table_name = resource.table_name
-                        _write_static_table(resource, table_name)
-                        _write_item(table_name, resource.name, pipe_item.item)
+                _write_pipe_item(pipe_item)
+
+                if on_files_closed is not None:
+                    closed_files = storage.commit_closed_files(extract_id)
+                    if closed_files:
+                        on_files_closed(deepcopy(dynamic_tables), closed_files)
+
+                if on_batch_end is not None:
+                    batch_items += len(pipe_item.item) if isinstance(pipe_item.item, list) else 1
+                    if (batch_max_items and batch_items >= batch_max_items) or (batch_max_seconds and time.monotonic() - batch_started_at >= batch_max_seconds) \
+                            or (batch_max_files and storage.closed_files_count(extract_id) >= batch_max_files):
+                        # write the items in flight so the state of the resources corresponds to the committed files
+                        for drained_item in pipes.drain():
+                            _write_pipe_item(drained_item)
+                        _end_batch()
+                        batch_items = 0
+                        batch_started_at = time.monotonic()
 
             # find defined resources that did not yield any pipeitems and create empty jobs for them
             data_tables = {t["name"]: t for t in schema.data_tables()}
@@ -168,16 +346,153 @@ def extract(
     return dynamic_tables
 
 
+_EXTRACT_SHARDS: List[Tuple[str, DltSource, ExtractorStorage, int, int]] = None
+"""Shards of the source extracted in the forked processes, set before the process pool is created"""
+
+
+def _extract_shard(shard_no: int) -> Tuple[TSchemaUpdate, DictStrAny, ExtractMetrics]:
+    extract_id, source, storage, max_parallel_items, workers = _EXTRACT_SHARDS[shard_no]
+    metrics = ExtractMetrics(dynamic_table_schemas=0, dynamic_table_schemas_cached=0)
+    dynamic_tables = extract(extract_id, source, storage, max_parallel_items=max_parallel_items, workers=workers, metrics=metrics)
+    # send back the source state so resource and incremental state may be merged in the main process
+    return dynamic_tables, source_state(), metrics
+
+
+def _merge_shard_state(state: DictStrAny, snapshot: DictStrAny, shard_state: DictStrAny, resource_names: Set[str]) -> None:
+    """Merges state of the resources in `resource_names` from `shard_state` into the source `state`. Other source scoped keys are merged only if the shard
+    changed them, as compared to the `snapshot` of the source state sent to the shard
+    """
+    shard_state = dict(shard_state)
+    shard_resources = shard_state.pop("resources", {})
+    resources = state.setdefault("resources", {})
+    for name in resource_names:
+        if name in shard_resources:
+            resources[name] = shard_resources[name]
+        else:
+            resources.pop(name, None)
+    snapshot = {k: v for k, v in snapshot.items() if k != "resources"}
+    _merge_changed_keys(state, snapshot, shard_state)
+
+
+def _merge_changed_keys(dest: DictStrAny, snapshot: DictStrAny, changed: DictStrAny) -> None:
+    """Sets the keys of `dest` that have different value in `changed` than in `snapshot`, nested dictionaries are merged recursively. Removes the keys
+    that are in `snapshot` but not in `changed`
+    """
+    for key, value in changed.items():
+        if key in snapshot and value == snapshot[key]:
+            continue
+        if isinstance(value, dict) and isinstance(dest.get(key), dict):
+            # dictionaries created by several shards are also merged
+            key_snapshot = snapshot.get(key)
+            _merge_changed_keys(dest[key], key_snapshot if isinstance(key_snapshot, dict) else {}, value)
+        else:
+            dest[key] = value
+    for key in snapshot:
+        if key not in changed:
+            dest.pop(key, None)
+
+
+def extract_in_processes(
+    extract_id: str,
+    source: DltSource,
+    storage: ExtractorStorage,
+    collector: Collector = NULL_COLLECTOR,
+    *,
+    process_workers: int,
+    max_parallel_items: int = None,
+    workers: int = None,
+    metrics: ExtractMetrics = None
+) -> TSchemaUpdate:
+    """Extracts the selected resources of the `source` in `process_workers` forked processes.
+
+    The selected resources are decomposed into strongly connected components so transformers are extracted together with their parents. The components are
+    distributed among the processes, each of them writing into its own extract folder. The files, the dynamic tables and the resource state are merged back into
+    `extract_id` and the current source state.
+    """
+    global _EXTRACT_SHARDS
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise UnsupportedProcessStartMethodException(multiprocessing.get_start_method())
+
+    components = [list(c.resources.selected.keys()) for c in source.decompose("scc")]
+    shards_count = min(process_workers, len(components))
+    if shards_count <= 1:
+        return extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers, metrics=metrics)
+
+    # distribute components among shards
+    shards_resources: List[List[str]] = [[] for _ in range(shards_count)]
+    for idx, component in enumerate(components):
+        shards_resources[idx % shards_count].extend(component)
+    shard_sources = [source.with_resources(*names) for names in shards_resources]
+    shard_ids = [storage.create_extract_id() for _ in shard_sources]
+
+    dynamic_tables: TSchemaUpdate = {}
+    state = source_state()
+    # shards send back the whole source state, only the changes made by each shard are merged
+    snapshot = deepcopy(state)
+    with collector(f"Extract {source.name}"):
+        collector.update("Resources", 0, len(source.resources.selected))
+        # the shards are passed to forked processes via global variable: sources and generators are not picklable
+        _EXTRACT_SHARDS = [(shard_id, shard_source, storage, max_parallel_items, workers) for shard_id, shard_source in zip(shard_ids, shard_sources)]
+        pool = multiprocessing.get_context("fork").Pool(processes=shards_count)
+        try:
+            for shard_no, (shard_tables, shard_state, shard_metrics) in enumerate(pool.imap(_extract_shard, range(shards_count))):
+                signals.raise_if_signalled()
+                if metrics is not None:
+                    for key, value in shard_metrics.items():
+                        metrics[key] += value  # type: ignore[literal-required]
+                for table_name, partials in shard_tables.items():
+                    dynamic_tables.setdefault(table_name, []).extend(partials)
+                _merge_shard_state(state, snapshot, shard_state, set(shard_sources[shard_no].resources.extracted.keys()))
+                storage.merge_extract_files(shard_ids[shard_no], extract_id)
+                collector.update("Resources", len(shards_resources[shard_no]))
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+            _EXTRACT_SHARDS = None
+            # shards that failed or were not merged leave their folders behind
+            for shard_id in shard_ids:
+                storage.delete_extract_files(shard_id)
+
+    return dynamic_tables
+
+
+@with_config(spec=ExtractorConfiguration)
 def extract_with_schema(
     storage: ExtractorStorage,
     source: DltSource,
     schema: Schema,
     collector: Collector,
     max_parallel_items: int,
-    workers: int
+    workers: int,
+    *,
+    process_workers: int = 1,
+    metrics: ExtractMetrics = None,
+    on_files_closed: Callable[[TSchemaUpdate, Sequence[str]], None] = None,
+    batch_max_items: int = None,
+    batch_max_seconds: float = None,
+    batch_max_files: int = None,
+    on_batch_end: Callable[[], None] = None
 ) -> str:
+    if process_workers > 1:
+        # the shards do not report closed files and batches back to the main process
+        if on_batch_end:
+            raise ProcessExtractNotSupported(process_workers, "micro batches and extract checkpoints")
+        if on_files_closed:
+            raise ProcessExtractNotSupported(process_workers, "pipelined_run")
     # generate extract_id to be able to commit all the sources together later
     extract_id = storage.create_extract_id()
+
+    def _update_schema(partial_tables: TSchemaUpdate) -> None:
+        for partials in partial_tables.values():
+            for partial_table in partials:
+                schema.update_schema(schema.normalize_table_identifiers(partial_table))
+
+    def _end_batch(partial_tables: TSchemaUpdate) -> None:
+        _update_schema(partial_tables)
+        on_batch_end()
+
     with Container().injectable_context(SourceSchemaInjectableContext(schema)):
         # inject the config section with the current source name
         with inject_section(ConfigSectionContext(sections=(known_sections.SOURCES, source.section, source.name), source_state_key=source.name)):
@@ -187,11 +502,19 @@ def extract_with_schema(
                     if resource.write_disposition == "replace":
                         _reset_resource_state(resource._name)
 
-            extractor = extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers)
-            # iterate over all items in the pipeline and update the schema if dynamic table hints were present
-            for _, partials in extractor.items():
-                for partial in partials:
-                    schema.update_schema(schema.normalize_table_identifiers(partial))
+            if process_workers > 1:
+                # files extracted in processes are committed together when all shards are done
+                extractor = extract_in_processes(
+                    extract_id, source, storage, collector, process_workers=process_workers, max_parallel_items=max_parallel_items, workers=workers, metrics=metrics
+                )
+            else:
+                extractor = extract(
+                    extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers, metrics=metrics, on_files_closed=on_files_closed,
+                    batch_max_items=batch_max_items, batch_max_seconds=batch_max_seconds, batch_max_files=batch_max_files,
+                    on_batch_end=_end_batch if on_batch_end else None
+                )
+            # update the schema if dynamic table hints were present
+            _update_schema(extractor)
 
     return extract_id
 
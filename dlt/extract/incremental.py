@@ -1,32 +1,55 @@
-from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_origin, Sequence
+from typing import Generic, Literal, TypeVar, Any, Optional, Callable, List, Set, TypedDict, Union, get_origin, Sequence
+import re
+import base64
+import hashlib
 import inspect
 from functools import wraps
-from datetime import datetime  # noqa: I251
+from datetime import date, datetime  # noqa: I251
 
 import dlt
-from dlt.common.json import json
-from dlt.common.jsonpath import compile_path, find_values, JSONPath
+from dlt.common import logger
+from dlt.common.json import json, custom_pua_remove
+from dlt.common.jsonpath import compile_path, extract_key_chain, find_values, JSONPath
 from dlt.common.typing import TDataItem, TDataItems, TFun, extract_inner_type, is_optional_type
 from dlt.common.schema.typing import TColumnKey
 from dlt.common.configuration import configspec, ConfigurationValueError
 from dlt.common.configuration.specs import BaseConfiguration
 from dlt.common.pipeline import resource_state
-from dlt.common.utils import digest128
 from dlt.extract.exceptions import IncrementalUnboundError, PipeException
 from dlt.extract.pipe import Pipe
-from dlt.extract.utils import resolve_column_value
+from dlt.extract.utils import WrappedIterator, resolve_column_value
 from dlt.extract.typing import FilterItem, SupportsPipe, TTableHintTemplate
 from dlt.common import pendulum
+from dlt.common.exceptions import MissingDependencyException
+
+try:
+    from dlt.common.libs.pyarrow import pyarrow as pa, is_arrow_item, to_arrow_item
+    import pyarrow.compute as pc
+    import numpy as np
+except MissingDependencyException:
+    pa = None
 
 
 TCursorValue = TypeVar("TCursorValue", bound=Any)
 LastValueFunc = Callable[[Sequence[TCursorValue]], Any]
+TSortOrder = Literal["asc", "desc"]
+
+UNIQUE_HASH_LEN = 10
+"""Length of binary digest of a unique value. Shake128 digests of legacy states are truncated to this length"""
+UNIQUE_HASHES_CHUNK_SIZE = 1024 * 1024
+"""Max length of a single chunk of concatenated digests stored in state"""
+ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+ISO_DATETIME_PATTERN = re.compile(
+    r"^\d{4}-\d{2}-\d{2}(?P<sep>[T ])\d{2}:\d{2}(?P<seconds>:\d{2})?(?P<fraction>[.,]\d+)?(?P<offset>Z|[+-]\d{2}(?P<colon>:?)\d{2})?$"
+)
+"""Parts of ISO strings used to format the boundaries of split ranges like `initial_value`"""
 
 
 class IncrementalColumnState(TypedDict):
     initial_value: Optional[Any]
     last_value: Optional[Any]
-    unique_hashes: List[str]
+    unique_hashes: List[bytes]
+    """Chunks of concatenated binary digests of rows with `last_value`. Legacy states loaded from storage may keep base64 encoded digests which are converted on load"""
 
 
 class IncrementalCursorPathMissing(PipeException):
@@ -37,6 +60,14 @@ class IncrementalCursorPathMissing(PipeException):
         super().__init__(pipe_name, msg)
 
 
+class IncrementalCursorPathHasValueNone(PipeException):
+    def __init__(self, pipe_name: str, json_path: str, item: TDataItem) -> None:
+        self.json_path = json_path
+        self.item = item
+        msg = f"Cursor element with JSON path {json_path} has the value None in extracted data item. All data items must contain a value of the cursor element. Filter out the rows with None before the incremental step."
+        super().__init__(pipe_name, msg)
+
+
 class IncrementalPrimaryKeyMissing(PipeException):
     def __init__(self, pipe_name: str, primary_key_column: str, item: TDataItem) -> None:
         self.primary_key_column = primary_key_column
@@ -78,11 +109,16 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         end_value: Optional value used to load a limited range of records between `initial_value` and `end_value`.
             Use in conjunction with `initial_value`, e.g. load records from given month `incremental(initial_value="2022-01-01T00:00:00Z", end_value="2022-02-01T00:00:00Z")`
             Note, when this is set the incremental filtering is stateless and `initial_value` always supersedes any previous incremental value in state.
+        max_unique_hashes: Optional limit of unique hashes of rows with the current `last_value` kept in state. Rows above the limit are deduplicated in the current run but not in the next run.
+        row_order: Optional order of the cursor values yielded by the resource, "asc" or "desc". When set, the resource generator is closed as soon as
+            the rows leave the range between `last_value` and `end_value`, so no more data is requested.
     """
     cursor_path: str = None
     # TODO: Support typevar here
     initial_value: Optional[Any] = None
     end_value: Optional[Any] = None
+    max_unique_hashes: Optional[int] = None
+    row_order: Optional[TSortOrder] = None
 
     def __init__(
             self,
@@ -90,21 +126,31 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             initial_value: Optional[TCursorValue]=None,
             last_value_func: Optional[LastValueFunc[TCursorValue]]=max,
             primary_key: Optional[TTableHintTemplate[TColumnKey]] = None,
-            end_value: Optional[TCursorValue] = None
+            end_value: Optional[TCursorValue] = None,
+            max_unique_hashes: Optional[int] = None,
+            row_order: Optional[TSortOrder] = None
     ) -> None:
         self.cursor_path = cursor_path
         if self.cursor_path:
-            self.cursor_path_p: JSONPath = compile_path(cursor_path)
+            self._compile_cursor_path()
         self.last_value_func = last_value_func
         self.initial_value = initial_value
         """Initial value of last_value"""
         self.end_value = end_value
+        self.max_unique_hashes = max_unique_hashes
+        """Max number of unique hashes of rows with `last_value` kept in state"""
+        self.row_order = row_order
+        self._pipe: SupportsPipe = None
+        """Pipe to which the incremental is bound"""
         self.start_value: Any = initial_value
         """Value of last_value at the beginning of current pipeline run"""
         self.resource_name: Optional[str] = None
         self.primary_key: Optional[TTableHintTemplate[TColumnKey]] = primary_key
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
+        self._unique_hashes: Set[bytes] = set()
+        """Unique hashes from state kept in a set for fast lookup"""
+        self._unique_hashes_capped = False
         super().__init__(self.transform)
 
         self.end_out_of_range: bool = False
@@ -122,7 +168,13 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
 
     def copy(self) -> "Incremental[TCursorValue]":
         return self.__class__(
-            self.cursor_path, initial_value=self.initial_value, last_value_func=self.last_value_func, primary_key=self.primary_key, end_value=self.end_value
+            self.cursor_path,
+            initial_value=self.initial_value,
+            last_value_func=self.last_value_func,
+            primary_key=self.primary_key,
+            end_value=self.end_value,
+            max_unique_hashes=self.max_unique_hashes,
+            row_order=self.row_order
         )
 
     def merge(self, other: "Incremental[TCursorValue]") -> "Incremental[TCursorValue]":
@@ -141,8 +193,56 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 kwargs[key] = value
         return self.__class__(**kwargs)
 
+    def split(self, n: int) -> List["Incremental[TCursorValue]"]:
+        """Splits the range between `initial_value` and `end_value` into `n` consecutive sub-ranges of equal length.
+
+        Each sub-range is a copy of this instance. As ranges are half closed, the sub-ranges do not overlap. Loading with `end_value` is stateless
+        so the sub-ranges may be extracted in parallel, for example by resources with `parallelized` option:
+        >>> created_at = dlt.sources.incremental("created_at", initial_value=pendulum.datetime(2015, 1, 1), end_value=pendulum.datetime(2023, 1, 1))
+        >>> resources = [
+        >>>     dlt.resource(get_issues, name=f"issues_{i}", table_name="issues", parallelized=True)(created_at=part)
+        >>>     for i, part in enumerate(created_at.split(8))
+        >>> ]
+
+        Integers, floats, dates and datetimes are supported. ISO strings are parsed into datetimes and sub-range boundaries are formatted back as ISO strings
+        with the same precision and offset style as `initial_value`. Date only strings are split on whole days.
+        Only `max` and `min` last value functions are supported.
+        """
+        if n < 1:
+            raise ValueError(f"Incremental range must be split into at least 1 part, {n} requested")
+        if self.initial_value is None or self.end_value is None:
+            raise ValueError("Incremental range may be split only if both 'initial_value' and 'end_value' are set")
+        if self.last_value_func not in (max, min):
+            raise ValueError("Incremental range may be split only with 'max' or 'min' last value functions")
+        start, end = self.initial_value, self.end_value
+        if isinstance(start, str):
+            start, end = pendulum.parse(start), pendulum.parse(end)
+            if ISO_DATE_PATTERN.match(self.initial_value):
+                # date only strings are split on whole days
+                start, end = start.date(), end.date()
+        if isinstance(start, int) and not isinstance(start, bool):
+            boundaries = [start + (end - start) * i // n for i in range(n + 1)]
+        elif isinstance(start, (float, date)):
+            boundaries = [start + (end - start) * i / n for i in range(n)] + [end]
+        else:
+            raise ValueError(f"Incremental range with values of type {type(start).__name__} cannot be split")
+        if isinstance(self.initial_value, str):
+            boundaries = [_format_iso_like(b, self.initial_value) for b in boundaries]
+            # keep the original boundaries
+            boundaries[0], boundaries[-1] = self.initial_value, self.end_value
+        parts: List[Incremental[TCursorValue]] = []
+        for initial_value, end_value in zip(boundaries, boundaries[1:]):
+            # skip empty ranges if there are less values than parts
+            if initial_value == end_value:
+                continue
+            part = self.copy()
+            part.initial_value = part.start_value = initial_value
+            part.end_value = end_value
+            parts.append(part)
+        return parts
+
     def on_resolved(self) -> None:
-        self.cursor_path_p = compile_path(self.cursor_path)
+        self._compile_cursor_path()
         if self.end_value is not None and self.initial_value is None:
             raise ConfigurationValueError(
                 "Incremental 'end_value' was specified without 'initial_value'. 'initial_value' is required when using 'end_value'."
@@ -165,7 +265,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             self.initial_value = native_value.initial_value
             self.last_value_func = native_value.last_value_func
             self.end_value = native_value.end_value
-            self.cursor_path_p = self.cursor_path_p
+            self.max_unique_hashes = native_value.max_unique_hashes
+            self.row_order = native_value.row_order
+            if self.cursor_path:
+                self._compile_cursor_path()
             self.resource_name = self.resource_name
         else:  # TODO: Maybe check if callable(getattr(native_value, '__lt__', None))
             # Passing bare value `incremental=44` gets parsed as initial_value
@@ -173,6 +276,11 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         if not self.is_partial():
             self.resolve()
 
+    def _compile_cursor_path(self) -> None:
+        self.cursor_path_p: JSONPath = compile_path(self.cursor_path)
+        # plain keys and key chains are resolved with dict lookups, json path is evaluated only for wildcards, filters etc.
+        self._cursor_keys = extract_key_chain(self.cursor_path_p)
+
     def get_state(self) -> IncrementalColumnState:
         """Returns an Incremental state for a particular cursor column"""
         if not self.resource_name:
@@ -209,25 +317,87 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         s = self.get_state()
         return s['last_value']  # type: ignore
 
-    def unique_value(self, row: TDataItem) -> str:
+    def unique_value(self, row: TDataItem) -> bytes:
         try:
             if self.primary_key:
-                return digest128(json.dumps(resolve_column_value(self.primary_key, row), sort_keys=True))
+                return _digest(json.dumps(resolve_column_value(self.primary_key, row), sort_keys=True))
             elif self.primary_key is None:
-                return digest128(json.dumps(row, sort_keys=True))
+                return _digest(json.dumps(row, sort_keys=True))
             else:
                 return None
         except KeyError as k_err:
             raise IncrementalPrimaryKeyMissing(self.resource_name, k_err.args[0], row)
 
+    def _load_unique_hashes(self) -> None:
+        """Loads unique hashes from state into a set. Converts legacy base64 encoded digests and chunks serialized without type information into binary chunks"""
+        stored_chunks: Sequence[Union[bytes, str]] = self._cached_state["unique_hashes"]
+        self._unique_hashes = set()
+        self._unique_hashes_capped = False
+        chunks: List[bytes] = []
+        legacy: List[bytes] = []
+        for stored_chunk in stored_chunks:
+            if isinstance(stored_chunk, str):
+                encoded = custom_pua_remove(stored_chunk)
+                decoded = base64.b64decode(encoded + "=" * (-len(encoded) % 4))
+                # legacy digests have 15 bytes, chunks contain whole digests
+                if len(decoded) % UNIQUE_HASH_LEN != 0:
+                    legacy.append(decoded[:UNIQUE_HASH_LEN])
+                else:
+                    chunks.append(decoded)
+            else:
+                chunks.append(stored_chunk)
+        if legacy:
+            chunks.append(b"".join(legacy))
+        # keep only binary chunks in the state
+        self._cached_state["unique_hashes"] = chunks
+        for chunk in chunks:
+            self._unique_hashes.update(chunk[i:i + UNIQUE_HASH_LEN] for i in range(0, len(chunk), UNIQUE_HASH_LEN))
+
+    def _add_unique_hash(self, unique_value: bytes) -> None:
+        if self.max_unique_hashes is not None and len(self._unique_hashes) >= self.max_unique_hashes:
+            if not self._unique_hashes_capped:
+                logger.warning(
+                    f"Incremental for resource {self.resource_name} exceeded {self.max_unique_hashes} unique hashes of rows with cursor value {self._cached_state['last_value']}. Rows above the limit will not be deduplicated in the next run."
+                )
+                self._unique_hashes_capped = True
+            # rows above the limit are still deduplicated in the current run
+            self._unique_hashes.add(unique_value)
+            return
+        self._unique_hashes.add(unique_value)
+        # merge chunks of the same size like a binary counter so appends are cheap and the number of chunks in state stays low
+        chunks = self._cached_state["unique_hashes"]
+        chunks.append(unique_value)
+        while len(chunks) > 1 and len(chunks[-2]) <= len(chunks[-1]) and len(chunks[-2]) < UNIQUE_HASHES_CHUNK_SIZE:
+            last = chunks.pop()
+            chunks[-1] += last
+
+    def _reset_unique_hashes(self, unique_value: bytes) -> None:
+        self._unique_hashes = {unique_value}
+        self._unique_hashes_capped = False
+        self._cached_state["unique_hashes"] = [unique_value]
+
+    def find_cursor_value(self, row: TDataItem) -> Any:
+        """Returns the value under `cursor_path` in `row`. Raises `IncrementalCursorPathMissing` if not found"""
+        if self._cursor_keys is not None:
+            row_value = row
+            for key in self._cursor_keys:
+                try:
+                    row_value = row_value[key]
+                except (KeyError, TypeError, IndexError):
+                    raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+            return row_value
+        row_values = find_values(self.cursor_path_p, row)
+        if not row_values:
+            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+        return row_values[0]
+
     def transform(self, row: TDataItem) -> bool:
         if row is None:
             return True
 
-        row_values = find_values(self.cursor_path_p, row)
-        if not row_values:
-            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
-        row_value = row_values[0]
+        row_value = self.find_cursor_value(row)
+        if row_value is None:
+            raise IncrementalCursorPathHasValueNone(self.resource_name, self.cursor_path, row)
 
         # For datetime cursor, ensure the value is a timezone aware datetime.
         # The object saved in state will always be a tz aware pendulum datetime so this ensures values are comparable
@@ -255,10 +425,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 unique_value = self.unique_value(row)
                 # if unique value exists then use it to deduplicate
                 if unique_value:
-                    if unique_value in incremental_state['unique_hashes']:
+                    if unique_value in self._unique_hashes:
                         return False
                     # add new hash only if the record row id is same as current last value
-                    incremental_state['unique_hashes'].append(unique_value)
+                    self._add_unique_hash(unique_value)
                 return True
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -273,26 +443,185 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             incremental_state["last_value"] = new_value
             unique_value = self.unique_value(row)
             if unique_value:
-                incremental_state["unique_hashes"] = [unique_value]
+                self._reset_unique_hashes(unique_value)
 
         return True
 
+    def __call__(self, item: TDataItems, meta: Any = None) -> Optional[TDataItems]:
+        # filter the whole list in one call
+        if isinstance(item, list):
+            if item and pa and is_arrow_item(item[0]):
+                item = [t for t in (self.transform_arrow(i) for i in item) if t is not None]
+            else:
+                transform = self.transform
+                item = [row for row in item if transform(row)]
+            item = item or None
+        elif pa and is_arrow_item(item):
+            item = self.transform_arrow(item)
+        elif not self.transform(item):
+            item = None
+        if self.row_order and self._rows_left_range():
+            self._close_gen()
+        return item
+
+    def _rows_left_range(self) -> bool:
+        """Tells if ordered rows left the range and no more rows from the resource will pass the filter"""
+        # rows ordered in the direction of the last value function reach the end value, rows ordered in the opposite direction fall below the start value
+        if (self.row_order == "asc") == (self.last_value_func is not min):
+            return self.end_out_of_range
+        return self.start_out_of_range
+
+    def _close_gen(self) -> None:
+        """Closes the generator of the bound pipe so the resource does not yield any more rows"""
+        if not isinstance(self._pipe, Pipe) or self._pipe.is_empty or self._pipe.has_parent:
+            return
+        gen = self._pipe.gen
+        if isinstance(gen, WrappedIterator):
+            # async and parallelized resources are wrapped, close the resource generator itself
+            gen.close()
+        elif inspect.isgenerator(gen):
+            gen.close()
+
+    def transform_arrow(self, item: Any) -> Any:
+        """Filters arrow table, record batch or pandas data frame `item` with arrow compute kernels. Updates the state like `transform`.
+        Returns None if all rows were filtered out. Data frames are returned as data frames, record batches as arrow tables.
+        """
+        is_pandas = not isinstance(item, (pa.Table, pa.RecordBatch))
+        tbl = to_arrow_item(item)
+        if isinstance(tbl, pa.RecordBatch):
+            tbl = pa.Table.from_batches([tbl])
+        if tbl.num_rows > 0:
+            if self.last_value_func in (max, min) and self._cursor_keys is not None and len(self._cursor_keys) == 1:
+                tbl = self._filter_arrow(tbl)
+            else:
+                # custom last value functions and nested cursor paths are evaluated row by row
+                transform = self.transform
+                tbl = tbl.filter(pa.array([transform(row) for row in tbl.to_pylist()], pa.bool_()))
+        if tbl.num_rows == 0:
+            return None
+        return tbl.to_pandas() if is_pandas else tbl
+
+    def _filter_arrow(self, tbl: Any) -> Any:
+        cursor_name = self._cursor_keys[0]
+        if cursor_name not in tbl.schema.names:
+            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, tbl)
+        if tbl[cursor_name].null_count > 0:
+            raise IncrementalCursorPathHasValueNone(self.resource_name, self.cursor_path, tbl)
+        is_max = self.last_value_func is max
+        # "before" means lower than for max and higher than for min
+        before, before_equal = (pc.less, pc.less_equal) if is_max else (pc.greater, pc.greater_equal)
+
+        def _scalar(value: Any) -> Any:
+            try:
+                return pa.scalar(value, type=tbl[cursor_name].type)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+                return pa.scalar(value)
+
+        def _to_py(value: Any) -> Any:
+            value = value.as_py()
+            if isinstance(value, datetime):
+                value = pendulum.instance(value)
+            return value
+
+        # filter end value ranges exclusively and start value inclusively
+        mask = None
+        if self.end_value is not None:
+            mask = before(tbl[cursor_name], _scalar(self.end_value)).fill_null(False)
+            if not pc.all(mask).as_py():
+                self.end_out_of_range = True
+        if self.start_value is not None:
+            start_mask = before_equal(_scalar(self.start_value), tbl[cursor_name]).fill_null(False)
+            if not pc.all(start_mask).as_py():
+                self.start_out_of_range = True
+            mask = start_mask if mask is None else pc.and_(mask, start_mask)
+        if mask is not None:
+            tbl = tbl.filter(mask)
+        if tbl.num_rows == 0:
+            return tbl
+
+        incremental_state = self._cached_state
+        last_value = incremental_state["last_value"]
+        cursor = tbl[cursor_name]
+        batch_last_value = _to_py(pc.max(cursor) if is_max else pc.min(cursor))
+        new_value = self.last_value_func((batch_last_value, last_value)) if last_value is not None else batch_last_value
+        # deduplicate rows with the last value, hashes are computed only for those rows
+        keep = None
+        if self.primary_key != ():
+            keep = np.ones(tbl.num_rows, dtype=bool)
+            if last_value is not None:
+                self._dedup_arrow_rows(tbl, pc.equal(cursor, _scalar(last_value)), keep, add_hashes=new_value == last_value)
+            if new_value != last_value:
+                self._unique_hashes = set()
+                self._unique_hashes_capped = False
+                incremental_state["unique_hashes"] = []
+                self._dedup_arrow_rows(tbl, pc.equal(cursor, _scalar(new_value)), keep, add_hashes=True)
+        incremental_state["last_value"] = new_value
+        if keep is not None and not keep.all():
+            tbl = tbl.filter(pa.array(keep))
+        return tbl
+
+    def _dedup_arrow_rows(self, tbl: Any, eq_mask: Any, keep: Any, add_hashes: bool) -> None:
+        """Marks rows selected by `eq_mask` that are already in unique hashes in `keep` and optionally adds hashes of the remaining rows"""
+        indices = pc.indices_nonzero(eq_mask.fill_null(False)).to_numpy()
+        if len(indices) == 0:
+            return
+        seen: Set[bytes] = set()
+        for idx, row in zip(indices, tbl.take(indices).to_pylist()):
+            unique_value = self.unique_value(row)
+            if unique_value in self._unique_hashes or unique_value in seen:
+                keep[idx] = False
+            else:
+                seen.add(unique_value)
+                if add_hashes:
+                    self._add_unique_hash(unique_value)
+
     def bind(self, pipe: SupportsPipe) -> "Incremental[TCursorValue]":
         "Called by pipe just before evaluation"
         # bind the resource/pipe name
         if self.is_partial():
             raise IncrementalCursorPathMissing(pipe.name, None, None)
         self.resource_name = pipe.name
+        self._pipe = pipe
         # set initial value from last value, in case of a new state those are equal
         self.start_value = self.last_value
         # cache state
         self._cached_state = self.get_state()
+        self._load_unique_hashes()
         return self
 
     def __str__(self) -> str:
         return f"Incremental at {id(self)} for resource {self.resource_name} with cursor path: {self.cursor_path} initial {self.initial_value} lv_func {self.last_value_func}"
 
 
+def _digest(v: str) -> bytes:
+    return hashlib.shake_128(v.encode("utf-8")).digest(UNIQUE_HASH_LEN)
+
+
+def _format_iso_like(value: date, template: str) -> str:
+    """Formats `value` as ISO string with the same precision and offset style as ISO string `template`"""
+    if not isinstance(value, datetime):
+        return value.isoformat()
+    match = ISO_DATETIME_PATTERN.match(template)
+    if match is None:
+        return json.dumps(value).strip('"')
+    formatted = value.strftime(f"%Y-%m-%d{match['sep']}%H:%M")
+    if match["seconds"]:
+        formatted += value.strftime(":%S")
+    if match["fraction"]:
+        digits = len(match["fraction"]) - 1
+        formatted += match["fraction"][0] + f"{value.microsecond:06d}".ljust(digits, "0")[:digits]
+    offset = match["offset"]
+    if offset:
+        offset_minutes = int(value.utcoffset().total_seconds()) // 60
+        if offset == "Z" and offset_minutes == 0:
+            formatted += "Z"
+        else:
+            hours, minutes = divmod(abs(offset_minutes), 60)
+            colon = ":" if offset == "Z" else match["colon"]
+            formatted += f"{'-' if offset_minutes < 0 else '+'}{hours:02d}{colon}{minutes:02d}"
+    return formatted
+
+
 class IncrementalResourceWrapper(FilterItem):
     _incremental: Optional[Incremental[Any]] = None
     """Keeps the injectable incremental"""
@@ -1,25 +1,29 @@
+import time
 import inspect
 import types
 import asyncio
 import makefun
 from asyncio import Future
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from threading import Thread
-from typing import Any, ContextManager, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from functools import partial
+from threading import Thread, Condition
+from typing import Any, AsyncIterator, ContextManager, Deque, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal, cast
 
-from dlt.common import sleep
 from dlt.common.configuration import configspec
 from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.specs import BaseConfiguration, ContainerInjectableContext
 from dlt.common.configuration.container import Container
 from dlt.common.exceptions import PipelineException
+from dlt.common.runtime.signals import raise_if_signalled
 from dlt.common.source import unset_current_pipe_name, set_current_pipe_name
 from dlt.common.typing import AnyFun, AnyType, TDataItems
-from dlt.common.utils import get_callable_name
+from dlt.common.utils import estimate_size, flatten_list_or_items, get_callable_name
 
 from dlt.extract.exceptions import CreatePipeException, DltSourceException, ExtractorException, InvalidResourceDataTypeFunctionNotAGenerator, InvalidStepFunctionArguments, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, PipeException, PipeItemProcessingError, PipeNotBoundToData, ResourceExtractionError
-from dlt.extract.typing import DataItemWithMeta, ItemTransform, SupportsPipe, TPipedDataItems
+from dlt.extract.typing import DataItemWithMeta, ItemTransform, SupportsPipe, TDeferredDataItems, TParallelizedMode, TPipedDataItems
+from dlt.extract.utils import WrappedIterator, batch_items, wrap_async_iterator, wrap_parallel_iterator
 
 if TYPE_CHECKING:
     TItemFuture = Future[Union[TDataItems, DataItemWithMeta]]
@@ -60,12 +64,13 @@ class SourcePipeItem(NamedTuple):
 TPipeStep = Union[
     Iterable[TPipedDataItems],
     Iterator[TPipedDataItems],
+    AsyncIterator[TPipedDataItems],
     Callable[[TDataItems, Optional[Any]], TPipedDataItems],
     Callable[[TDataItems, Optional[Any]], Iterator[TPipedDataItems]],
     Callable[[TDataItems, Optional[Any]], Iterator[ResolvablePipeItem]]
 ]
 
-TPipeNextItemMode = Union[Literal["fifo"], Literal["round_robin"]]
+TPipeNextItemMode = Union[Literal["fifo"], Literal["round_robin"], Literal["weighted"], Literal["priority"]]
 
 
 class ForkPipe:
@@ -94,6 +99,39 @@ class ForkPipe:
             yield ResolvablePipeItem(_it, step, pipe, meta)
 
 
+class ParallelStep:
+    def __init__(self, pipe_name: str, step: TPipeStep) -> None:
+        """A transformer step that defers the call to `step` so it is evaluated in the thread pool of the pipe iterator.
+
+        Items yielded from a single call are passed further as a list.
+        """
+        self.pipe_name = pipe_name
+        self.step = step
+
+    def __call__(self, item: TDataItems, meta: Any = None) -> TDeferredDataItems:
+        def _run() -> Any:
+            # register pipe name in the worker thread
+            set_current_pipe_name(self.pipe_name)
+            result = self.step(item, meta=meta)  # type: ignore
+            if isinstance(result, AsyncIterator):
+                return wrap_async_iterator(result)
+            if isinstance(result, Iterator):
+                # evaluate the generator in the worker thread
+                items = list(result)
+                if len(items) == 1:
+                    return items[0]
+                if any(isinstance(i, (DataItemWithMeta, Iterator, Awaitable)) or callable(i) for i in items):
+                    # those items must be evaluated separately by the pipe iterator
+                    return iter(items)
+                # pass all items from a single call together so the order of calls is preserved
+                return list(flatten_list_or_items(iter(items)))
+            if result is None:
+                return iter(())
+            return result
+
+        return _run
+
+
 class Pipe(SupportsPipe):
     def __init__(self, name: str, steps: List[TPipeStep] = None, parent: "Pipe" = None) -> None:
         self.name = name
@@ -101,13 +139,23 @@ class Pipe(SupportsPipe):
         self._steps: List[TPipeStep] = []
         self._pipe_id = f"{name}_{id(self)}"
         self.parent = parent
+        self.max_parallel_items: int = None
+        """Maximum number of items from this pipe (awaitables, deferred functions and async iterators) evaluated in parallel"""
+        self.batch_size: int = None
+        """Number of single data items from the data generating step collected into a list before entering the transform steps"""
+        self.parallelized: TParallelizedMode = None
+        """Evaluates the data generating step in the thread pool. Items are yielded in order of the calls ("ordered") or as soon as they are available ("unordered")"""
+        self.weight: float = 1.0
+        """Share of the time spent in the data generating step relative to other pipes in "weighted" next item mode"""
+        self.priority: int = 0
+        """Pipes with higher priority are extracted first in "priority" next item mode"""
         # add the steps, this will check and mod transformations
         if steps:
             for step in steps:
                 self.append_step(step)
 
     @classmethod
-    def from_data(cls, name: str, gen: Union[Iterable[TPipedDataItems], Iterator[TPipedDataItems], AnyFun], parent: "Pipe" = None) -> "Pipe":
+    def from_data(cls, name: str, gen: Union[Iterable[TPipedDataItems], Iterator[TPipedDataItems], AsyncIterator[TPipedDataItems], AnyFun], parent: "Pipe" = None) -> "Pipe":
         return cls(name, [gen], parent=parent)
 
     @property
@@ -211,15 +259,27 @@ class Pipe(SupportsPipe):
         else:
             self.ensure_gen_bound()
 
+        p = Pipe(self.name, [])
         if self.has_parent:
-            steps = self.parent.full_pipe().steps
+            parent_pipe = self.parent.full_pipe()
+            steps = parent_pipe.steps
+            # the head of the full pipe comes from the parent
+            p.batch_size = parent_pipe.batch_size
+            p.parallelized = parent_pipe.parallelized
+            p.weight, p.priority = parent_pipe.weight, parent_pipe.priority
         else:
             steps = []
+            p.batch_size = self.batch_size
+            p.parallelized = self.parallelized
+            p.weight, p.priority = self.weight, self.priority
 
+        gen_idx = len(steps) + self._gen_idx
         steps.extend(self._steps)
-        p = Pipe(self.name, [])
+        if self.has_parent and self.parallelized and not isinstance(steps[gen_idx], ParallelStep):
+            steps[gen_idx] = ParallelStep(self.name, steps[gen_idx])
         # set the steps so they are not evaluated again
         p._steps = steps
+        p.max_parallel_items = self.max_parallel_items
         # return pipe with resolved dependencies
         return p
 
@@ -252,9 +312,19 @@ class Pipe(SupportsPipe):
             # otherwise it must be an iterator
             if isinstance(gen, Iterable):
                 self.replace_gen(iter(gen))
+            # async iterators are advanced on the event loop
+            if isinstance(self.gen, AsyncIterator):
+                self.replace_gen(wrap_async_iterator(self.gen))
+            else:
+                if self.batch_size and self.batch_size > 1:
+                    self.replace_gen(batch_items(cast(Iterator[TDataItems], self.gen), self.batch_size))
+                if self.parallelized:
+                    self.replace_gen(wrap_parallel_iterator(self.name, cast(Iterator[TDataItems], self.gen)))
         else:
             # verify if transformer can be called
             self._ensure_transform_step(self._gen_idx, gen)
+            if self.parallelized and not isinstance(gen, ParallelStep):
+                self.replace_gen(ParallelStep(self.name, gen))
 
         # evaluate transforms
         for step_no, step in enumerate(self._steps):
@@ -317,7 +387,7 @@ class Pipe(SupportsPipe):
             # this partial wraps transformer and sets a signature that is compatible with pipe transform calls
             _data = makefun.wraps(head, new_sig=inspect.signature(_tx_partial))(_tx_partial)
         else:
-            if inspect.isgeneratorfunction(inspect.unwrap(head)) or inspect.isgenerator(head):
+            if inspect.isgeneratorfunction(inspect.unwrap(head)) or inspect.isgenerator(head) or inspect.isasyncgenfunction(inspect.unwrap(head)):
                 # if no arguments then no wrap
                 if len(sig.parameters) == 0:
                     return head
@@ -335,9 +405,9 @@ class Pipe(SupportsPipe):
         return _data
 
     def _verify_head_step(self, step: TPipeStep) -> None:
-        # first element must be Iterable, Iterator or Callable in resource pipe
-        if not isinstance(step, (Iterable, Iterator)) and not callable(step):
-            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator or a Callable")
+        # first element must be Iterable, Iterator, AsyncIterator or Callable in resource pipe
+        if not isinstance(step, (Iterable, Iterator, AsyncIterator)) and not callable(step):
+            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator, AsyncIterator or a Callable")
 
     def _wrap_transform_step_meta(self, step_no: int, step: TPipeStep) -> TPipeStep:
         # step must be a callable: a transformer or a transformation
@@ -405,6 +475,11 @@ class Pipe(SupportsPipe):
         """Clones the pipe steps, optionally keeping the pipe id. Used internally to clone a list of connected pipes."""
         p = Pipe(self.name, [], self.parent)
         p._steps = self._steps.copy()
+        p.max_parallel_items = self.max_parallel_items
+        p.batch_size = self.batch_size
+        p.parallelized = self.parallelized
+        p.weight = self.weight
+        p.priority = self.priority
         # clone shares the id with the original
         if keep_pipe_id:
             p._pipe_id = self._pipe_id
@@ -427,11 +502,14 @@ class PipeIterator(Iterator[PipeItem]):
         futures_poll_interval: float = 0.01
         copy_on_fork: bool = False
         next_item_mode: str = "fifo"
+        max_parallel_bytes: Optional[int] = None
 
         __section__ = "extract"
 
-    def __init__(self, max_parallel_items: int, workers: int, futures_poll_interval: float, next_item_mode: TPipeNextItemMode) -> None:
+    def __init__(self, max_parallel_items: int, workers: int, futures_poll_interval: float, next_item_mode: TPipeNextItemMode, max_parallel_bytes: int = None) -> None:
         self.max_parallel_items = max_parallel_items
+        self.max_parallel_bytes = max_parallel_bytes
+        """Sources are paused when the estimated size of the results of the futures in flight exceeds this number"""
         self.workers = workers
         self.futures_poll_interval = futures_poll_interval
 
@@ -441,12 +519,41 @@ class PipeIterator(Iterator[PipeItem]):
         self._async_pool_thread: Thread = None
         self._thread_pool: ThreadPoolExecutor = None
         self._sources: List[SourcePipeItem] = []
-        self._futures: List[FuturePipeItem] = []
+        self._head_gens: List[Iterator[TDataItems]] = []
+        """Generators of the pipe heads. Wrapped generators are closed even if they are no longer in the sources"""
+        self._futures: Dict[TItemFuture, FuturePipeItem] = {}
+        """All submitted futures that were not yet resolved, in order of submission"""
+        self._done_futures: Deque[FuturePipeItem] = deque()
+        """Futures in order of completion, pushed by done callbacks"""
+        self._pending_futures: Dict[str, int] = {}
+        """Number of futures that are not yet done per pipe id"""
+        self._ordered_futures: Dict[str, Deque[FuturePipeItem]] = {}
+        """Submitted futures of pipes parallelized in "ordered" mode, released in order of submission"""
+        self._futures_done = Condition()
         self._next_item_mode = next_item_mode
+        self._futures_bytes: Dict[str, int] = {}
+        """Estimated size of the result of a future per pipe id, taken from the last done future"""
+        self._sources_wait_time: Dict[int, float] = {}
+        """Time spent waiting for items of the initial sources, by id of the source generator. Used by "weighted" next item mode"""
+        self._draining = False
+        """When set, the resources are not advanced and the iterator stops when all the items taken from them were processed"""
+        self._waiting_items: Dict[int, Union[ResolvablePipeItem, SourcePipeItem]] = {}
+        """Items waiting for a free slot of their pipe, by id of the source generator they come from. Such sources are skipped until the item is submitted"""
+        self._item_source_id: int = None
+        """Id of the source generator of the last item taken from the sources"""
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
-    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = 0.01, next_item_mode: TPipeNextItemMode = "fifo") -> "PipeIterator":
+    def from_pipe(
+        cls,
+        pipe: Pipe,
+        *,
+        max_parallel_items: int = 20,
+        workers: int = 5,
+        futures_poll_interval: float = 0.01,
+        next_item_mode: TPipeNextItemMode = "fifo",
+        max_parallel_bytes: int = None
+    ) -> "PipeIterator":
         # join all dependent pipes
         if pipe.parent:
             pipe = pipe.full_pipe()
@@ -456,9 +563,10 @@ class PipeIterator(Iterator[PipeItem]):
         pipe.evaluate_gen()
         assert isinstance(pipe.gen, Iterator)
         # create extractor
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode, max_parallel_bytes)
         # add as first source
         extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+        extract._head_gens.append(pipe.gen)
         cls._initial_sources_count = 1
         return extract
 
@@ -473,11 +581,12 @@ class PipeIterator(Iterator[PipeItem]):
         workers: int = 5,
         futures_poll_interval: float = 0.01,
         copy_on_fork: bool = False,
-        next_item_mode: TPipeNextItemMode = "fifo"
+        next_item_mode: TPipeNextItemMode = "fifo",
+        max_parallel_bytes: int = None
     ) -> "PipeIterator":
 
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
-        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
+        extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode, max_parallel_bytes)
         # clone all pipes before iterating (recursively) as we will fork them (this add steps) and evaluate gens
         pipes = PipeIterator.clone_pipes(pipes)
 
@@ -493,12 +602,13 @@ class PipeIterator(Iterator[PipeItem]):
                     pipe.parent.fork(pipe.parent, len(pipe.parent) - 1, copy_on_fork=copy_on_fork)
                 _fork_pipeline(pipe.parent)
             else:
-                # head of independent pipe must be iterator
-                pipe.evaluate_gen()
-                assert isinstance(pipe.gen, Iterator)
                 # add every head as source only once
                 if not any(i.pipe == pipe for i in extract._sources):
+                    # head of independent pipe must be iterator
+                    pipe.evaluate_gen()
+                    assert isinstance(pipe.gen, Iterator)
                     extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
+                    extract._head_gens.append(pipe.gen)
 
         # reverse pipes for current mode, as we start processing from the back
         if next_item_mode == "fifo":
@@ -512,24 +622,35 @@ class PipeIterator(Iterator[PipeItem]):
 
     def __next__(self) -> PipeItem:
         pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
+        # source generator of the current item, None if the item comes from a future
+        source_id: int = None
         # __next__ should call itself to remove the `while` loop and continue clauses but that may lead to stack overflows: there's no tail recursion opt in python
         # https://stackoverflow.com/questions/13591970/does-python-optimize-tail-recursion (see Y combinator on how it could be emulated)
         while True:
             # do we need new item?
             if pipe_item is None:
                 # process element from the futures
+                source_id = None
                 if len(self._futures) > 0:
                     pipe_item = self._resolve_futures()
+                # then items that waited for a free slot of their pipe
+                if pipe_item is None:
+                    pipe_item = self._get_waiting_item()
                 # if none then take element from the newest source
                 if pipe_item is None:
+                    if self._is_over_memory_budget():
+                        # pause the sources until results of the futures are consumed
+                        self._wait_for_futures(lambda: len(self._done_futures) > 0)
+                        continue
                     pipe_item = self._get_source_item()
+                    source_id = self._item_source_id
 
                 if pipe_item is None:
-                    if len(self._futures) == 0 and len(self._sources) == 0:
+                    if len(self._futures) == 0 and not self._waiting_items and (len(self._sources) == 0 or self._draining):
                         # no more elements in futures or sources
                         raise StopIteration()
                     else:
-                        sleep(self.futures_poll_interval)
+                        self._wait_for_futures(lambda: len(self._done_futures) > 0)
                     continue
 
             item = pipe_item.item
@@ -541,20 +662,30 @@ class PipeIterator(Iterator[PipeItem]):
                 continue
 
             if isinstance(item, Awaitable) or callable(item):
+                # does the pipe have a free slot?
+                if not self._has_pipe_slot(pipe_item.pipe):
+                    if source_id is not None and self._next_item_mode != "fifo" and not self._draining:
+                        # keep the item for later and continue with other sources
+                        self._waiting_items[source_id] = pipe_item
+                        pipe_item = None
+                    else:
+                        # wait until any future of the pipe is done and try same item again
+                        self._wait_for_futures(partial(self._has_pipe_slot, pipe_item.pipe))
+                    continue
                 # do we have a free slot or one of the slots is done?
-                if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
+                if len(self._futures) < self.max_parallel_items or len(self._done_futures) > 0:
                     if isinstance(item, Awaitable):
                         future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
-                    self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
+                    self._add_future(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
                     # pipe item consumed for now, request a new one
                     pipe_item = None
                     continue
                 else:
                     # print("maximum futures exceeded, waiting")
-                    sleep(self.futures_poll_interval)
+                    self._wait_for_futures(lambda: len(self._done_futures) > 0)
                 # try same item later
                 continue
 
@@ -576,6 +707,9 @@ class PipeIterator(Iterator[PipeItem]):
                 if isinstance(next_item, DataItemWithMeta):
                     next_meta = next_item.meta
                     next_item = next_item.data
+                if isinstance(next_item, AsyncIterator):
+                    # async generator transformers are advanced item by item on the event loop
+                    next_item = wrap_async_iterator(next_item)
             except TypeError as ty_ex:
                 assert callable(step)
                 raise InvalidStepFunctionArguments(pipe_item.pipe.name, get_callable_name(step), inspect.signature(step), str(ty_ex))
@@ -597,10 +731,19 @@ class PipeIterator(Iterator[PipeItem]):
             loop.stop()
 
         # stop all futures
-        for f, _, _, _ in self._futures:
+        for f in self._futures:
             if not f.done():
                 f.cancel()
         self._futures.clear()
+        self._done_futures.clear()
+        self._pending_futures.clear()
+        self._ordered_futures.clear()
+        self._futures_bytes.clear()
+        # close coroutines that were never submitted
+        for waiting_item in self._waiting_items.values():
+            if inspect.iscoroutine(waiting_item.item):
+                waiting_item.item.close()
+        self._waiting_items.clear()
 
         # close all generators
         for gen, _, _, _ in self._sources:
@@ -610,6 +753,8 @@ class PipeIterator(Iterator[PipeItem]):
 
         # print("stopping loop")
         if self._async_pool:
+            # let the cancelled tasks finish and close the async generators before the loop is stopped
+            asyncio.run_coroutine_threadsafe(self._shutdown_async_pool(), self._async_pool).result()
             self._async_pool.call_soon_threadsafe(stop_background_loop, self._async_pool)
             # print("joining thread")
             self._async_pool_thread.join()
@@ -618,6 +763,11 @@ class PipeIterator(Iterator[PipeItem]):
         if self._thread_pool:
             self._thread_pool.shutdown(wait=True)
             self._thread_pool = None
+        # close resources evaluated in the thread pool or on the event loop
+        for gen in self._head_gens:
+            if isinstance(gen, WrappedIterator):
+                gen.close()
+        self._head_gens.clear()
 
     def _ensure_async_pool(self) -> asyncio.AbstractEventLoop:
         # lazily create async pool is separate thread
@@ -635,6 +785,14 @@ class PipeIterator(Iterator[PipeItem]):
         # start or return async pool
         return self._async_pool
 
+    @staticmethod
+    async def _shutdown_async_pool() -> None:
+        # same as `asyncio.run` does when it closes the loop
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in asyncio.all_tasks(loop) if task is not asyncio.current_task()]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await loop.shutdown_asyncgens()
+
     def _ensure_thread_pool(self) -> ThreadPoolExecutor:
         # lazily start or return thread pool
         if self._thread_pool:
@@ -649,21 +807,79 @@ class PipeIterator(Iterator[PipeItem]):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: types.TracebackType) -> None:
         self.close()
 
-    def _next_future(self) -> int:
-        return next((i for i, val in enumerate(self._futures) if val.item.done()), -1)
+    def _add_future(self, future_item: FuturePipeItem) -> None:
+        pipe_id = future_item.pipe._pipe_id
+        ordered = future_item.pipe.parallelized == "ordered"
+        self._futures[future_item.item] = future_item
+        with self._futures_done:
+            self._pending_futures[pipe_id] = self._pending_futures.get(pipe_id, 0) + 1
+            if ordered:
+                self._ordered_futures.setdefault(pipe_id, deque()).append(future_item)
+
+        def _on_done(future: TItemFuture) -> None:
+            # called from the worker thread or the event loop thread
+            result_bytes: int = None
+            if self.max_parallel_bytes and not future.cancelled() and future.exception() is None:
+                result = future.result()
+                result_bytes = estimate_size(result.data if isinstance(result, DataItemWithMeta) else result)
+            with self._futures_done:
+                if result_bytes is not None:
+                    self._futures_bytes[pipe_id] = result_bytes
+                if ordered:
+                    # release all done futures at the head of the pipe queue
+                    queue = self._ordered_futures.get(pipe_id)
+                    while queue and queue[0].item.done():
+                        self._done_futures.append(queue.popleft())
+                else:
+                    self._done_futures.append(future_item)
+                # futures are cleared when iterator is closed
+                if pipe_id in self._pending_futures:
+                    self._pending_futures[pipe_id] -= 1
+                self._futures_done.notify_all()
+
+        # if future is already done, callback is invoked immediately
+        future_item.item.add_done_callback(_on_done)
+
+    def _has_pipe_slot(self, pipe: Pipe) -> bool:
+        """Checks if `pipe` may submit another future without exceeding its `max_parallel_items`"""
+        if not pipe.max_parallel_items:
+            return True
+        return self._pending_futures.get(pipe._pipe_id, 0) < pipe.max_parallel_items
+
+    def _get_waiting_item(self) -> Union[ResolvablePipeItem, SourcePipeItem]:
+        """Returns the first item that waited for a free slot of its pipe if the slot is now available"""
+        for source_id, pipe_item in self._waiting_items.items():
+            if self._has_pipe_slot(pipe_item.pipe):
+                return self._waiting_items.pop(source_id)
+        return None
+
+    def _is_source_waiting(self, index: int) -> bool:
+        """Checks if an item of the source at `index` waits for a free slot of its pipe"""
+        return id(self._sources[index].item) in self._waiting_items
+
+    def _is_over_memory_budget(self) -> bool:
+        """Checks if the estimated size of the results of the futures in flight exceeds `max_parallel_bytes`"""
+        if not self.max_parallel_bytes or len(self._futures) == 0:
+            return False
+        futures_bytes = sum(self._futures_bytes.get(future_item.pipe._pipe_id, 0) for future_item in self._futures.values())
+        return futures_bytes >= self.max_parallel_bytes
+
+    def _wait_for_futures(self, predicate: Callable[[], bool]) -> None:
+        """Blocks until `predicate` evaluated on completion of a future is True. Wakes up every `futures_poll_interval` to check for signals"""
+        while len(self._futures) > 0:
+            with self._futures_done:
+                if self._futures_done.wait_for(predicate, self.futures_poll_interval):
+                    return
+            raise_if_signalled()
 
     def _resolve_futures(self) -> ResolvablePipeItem:
-        # no futures at all
-        if len(self._futures) == 0:
-            return None
-
         # anything done?
-        idx = self._next_future()
-        if idx == -1:
+        if len(self._done_futures) == 0:
             # nothing done
             return None
 
-        future, step, pipe, meta = self._futures.pop(idx)
+        future, step, pipe, meta = self._done_futures.popleft()
+        self._futures.pop(future, None)
 
         if future.cancelled():
             # get next future
@@ -681,11 +897,42 @@ class PipeIterator(Iterator[PipeItem]):
         else:
             return ResolvablePipeItem(item, step, pipe, meta)
 
+    def drain(self) -> Iterator[PipeItem]:
+        """Yields the items that were taken from the resources but are not yet fully processed: results of the futures in flight and items of the iterators
+        created by transformers and other steps. The resources are not advanced, so when iteration stops, the state of the resources (ie. `Incremental`)
+        corresponds to the items yielded so far. Iteration may continue afterwards.
+        """
+        self._draining = True
+        try:
+            while True:
+                try:
+                    yield next(self)
+                except StopIteration:
+                    return
+        finally:
+            self._draining = False
+
     def _get_source_item(self) -> ResolvablePipeItem:
+        if self._draining:
+            return self._get_source_item_draining()
         if self._next_item_mode == "fifo":
             return self._get_source_item_current()
         elif self._next_item_mode == "round_robin":
             return self._get_source_item_round_robin()
+        else:
+            return self._get_source_item_scheduled()
+
+    def _get_source_item_draining(self) -> ResolvablePipeItem:
+        # items at step 0 of a resource were not yet processed by any step so they are left for later
+        idx = next((
+            idx for idx in range(len(self._sources) - 1, -1, -1)
+            if (self._sources[idx].step > 0 or self._sources[idx].pipe.parent is not None) and not self._is_source_waiting(idx)
+        ), -1)
+        if idx == -1:
+            return None
+        if idx < len(self._sources) - 1:
+            self._sources.append(self._sources.pop(idx))
+        return self._get_source_item_current()
 
     def _get_source_item_current(self) -> ResolvablePipeItem:
         # no more sources to iterate
@@ -700,6 +947,7 @@ class PipeIterator(Iterator[PipeItem]):
             item = None
             while item is None:
                 item = next(gen)
+            self._item_source_id = id(gen)
             # full pipe item may be returned, this is used by ForkPipe step
             # to redirect execution of an item to another pipe
             if isinstance(item, ResolvablePipeItem):
@@ -725,17 +973,28 @@ class PipeIterator(Iterator[PipeItem]):
         if sources_count == 0:
             return None
         # if there are currently more sources than added initially, we need to process the new ones first
-        if sources_count > self._initial_sources_count:
+        if sources_count > self._initial_sources_count and not self._is_source_waiting(-1):
             return self._get_source_item_current()
+        # initial sources are at the start of the list
+        initial_sources_count = self._initial_sources_count
         try:
             # print(f"got {pipe.name} {pipe._pipe_id}")
             # register current pipe name during the execution of gen
             item = None
+            skipped_count = 0
             while item is None:
-                self._round_robin_index = (self._round_robin_index + 1) % sources_count
+                if skipped_count == initial_sources_count:
+                    # all the sources wait for a free slot
+                    return None
+                self._round_robin_index = (self._round_robin_index + 1) % initial_sources_count
+                if self._is_source_waiting(self._round_robin_index):
+                    skipped_count += 1
+                    continue
+                skipped_count = 0
                 gen, step, pipe, meta = self._sources[self._round_robin_index]
                 set_current_pipe_name(pipe.name)
                 item = next(gen)
+            self._item_source_id = id(gen)
             # full pipe item may be returned, this is used by ForkPipe step
             # to redirect execution of an item to another pipe
             if isinstance(item, ResolvablePipeItem):
@@ -759,6 +1018,68 @@ class PipeIterator(Iterator[PipeItem]):
         except Exception as ex:
             raise ResourceExtractionError(pipe.name, gen, str(ex), "generator") from ex
 
+    def _get_source_item_scheduled(self) -> ResolvablePipeItem:
+        sources_count = len(self._sources)
+        # no more sources to iterate
+        if sources_count == 0:
+            return None
+        # as in round robin mode, the new sources are processed first
+        if sources_count > self._initial_sources_count and not self._is_source_waiting(-1):
+            return self._get_source_item_current()
+        try:
+            item = None
+            while item is None:
+                self._round_robin_index = self._next_scheduled_source_index()
+                if self._round_robin_index == -1:
+                    # all the sources wait for a free slot
+                    return None
+                gen, step, pipe, meta = self._sources[self._round_robin_index]
+                set_current_pipe_name(pipe.name)
+                started_at = time.monotonic()
+                item = next(gen)
+                # slow generators get less turns in weighted mode so they do not block the fast ones
+                self._sources_wait_time[id(gen)] = self._sources_wait_time.get(id(gen), 0.0) + time.monotonic() - started_at
+            self._item_source_id = id(gen)
+            # full pipe item may be returned, this is used by ForkPipe step
+            # to redirect execution of an item to another pipe
+            if isinstance(item, ResolvablePipeItem):
+                return item
+            else:
+                # keep the item assigned step and pipe when creating resolvable item
+                if isinstance(item, DataItemWithMeta):
+                    return ResolvablePipeItem(item.data, step, pipe, item.meta)
+                else:
+                    return ResolvablePipeItem(item, step, pipe, meta)
+        except StopIteration:
+            # remove empty iterator and try another source
+            self._sources.pop(self._round_robin_index)
+            self._sources_wait_time.pop(id(gen), None)
+            self._round_robin_index -= 1
+            self._initial_sources_count -= 1
+            return self._get_source_item_scheduled()
+        except (PipelineException, ExtractorException, DltSourceException, PipeException):
+            raise
+        except Exception as ex:
+            raise ResourceExtractionError(pipe.name, gen, str(ex), "generator") from ex
+
+    def _next_scheduled_source_index(self) -> int:
+        """Selects the next initial source in "weighted" or "priority" mode. Sources waiting for a free slot are skipped, returns -1 if all of them wait"""
+        sources = self._sources
+        # initial sources are at the start of the list
+        indexes = [idx for idx in range(self._initial_sources_count) if not self._is_source_waiting(idx)]
+        if not indexes:
+            return -1
+        if self._next_item_mode == "priority":
+            # round robin among the sources with the highest priority
+            top_priority = max(sources[idx].pipe.priority for idx in indexes)
+            for offset in range(1, self._initial_sources_count + 1):
+                index = (self._round_robin_index + offset) % self._initial_sources_count
+                if index in indexes and sources[index].pipe.priority == top_priority:
+                    return index
+        # the source with the least wait time relative to its weight
+        wait_time = self._sources_wait_time
+        return min(indexes, key=lambda idx: wait_time.get(id(sources[idx].item), 0.0) / sources[idx].pipe.weight)
+
     @staticmethod
     def clone_pipes(pipes: Sequence[Pipe]) -> List[Pipe]:
         """This will clone pipes and fix the parent/dependent references"""
@@ -1,6 +1,6 @@
 from copy import copy, deepcopy
 from collections.abc import Mapping as C_Mapping
-from typing import List, TypedDict, cast, Any
+from typing import List, Tuple, TypedDict, cast, Any
 
 from dlt.common.schema.utils import DEFAULT_WRITE_DISPOSITION, merge_columns, new_column, new_table
 from dlt.common.schema.typing import TColumnKey, TColumnProp, TColumnSchema, TPartialTableSchema, TTableSchemaColumns, TWriteDisposition
@@ -30,6 +30,8 @@ class DltResourceSchema:
         self._table_name_hint_fun: TFunHintTemplate[str] = None
         self._table_has_other_dynamic_hints: bool = False
         self._table_schema_template: TTableSchemaTemplate = None
+        self.evaluate_hints_per_item: bool = False
+        """Evaluates dynamic hints other than the table name for every data item. By default they are evaluated once for each table name"""
         if table_schema_template:
             self.set_template(table_schema_template)
 
@@ -58,13 +60,14 @@ class DltResourceSchema:
         # resolve a copy of a held template
         table_template = copy(self._table_schema_template)
         table_template["columns"] = copy(self._table_schema_template["columns"])
+        # incremental is not a table hint and must not be called with the item
+        table_template.pop("incremental", None)
 
         # if table template present and has dynamic hints, the data item must be provided
         if self._table_name_hint_fun and item is None:
             raise DataItemRequiredForDynamicTableHints(self._name)
         # resolve
         resolved_template: TTableSchemaTemplate = {k: self._resolve_hint(item, v) for k, v in table_template.items()}  # type: ignore
-        resolved_template.pop("incremental", None)
         table_schema = self._merge_keys(resolved_template)
         table_schema["resource"] = self._name
         validate_dict(TPartialTableSchema, table_schema, f"new_table/{self._name}")
@@ -128,9 +131,19 @@ class DltResourceSchema:
         else:
             self._table_name_hint_fun = None
         # check if any other hints in the table template should be inferred from data
-        self._table_has_other_dynamic_hints = any(callable(v) for k, v in table_schema_template.items() if k != "name")
+        self._table_has_other_dynamic_hints = any(callable(v) for k, v in table_schema_template.items() if k not in ("name", "incremental"))
         self._table_schema_template = table_schema_template
 
+    def dynamic_hints_key(self, item: TDataItem) -> Tuple[Any, ...]:
+        """Resolves dynamic hints other than the table name for `item` into a hashable key. Items with the same key produce the same table schema.
+        Used when `evaluate_hints_per_item` is set. Raises TypeError if a resolved hint cannot be hashed.
+        """
+        key = tuple(
+            self._freeze_hint(v(item)) for k, v in self._table_schema_template.items() if k not in ("name", "incremental") and callable(v)
+        )
+        hash(key)
+        return key
+
     @staticmethod
     def _resolve_hint(item: TDataItem, hint: TTableHintTemplate[Any]) -> Any:
             """Calls each dynamic hint passing a data item"""
@@ -139,6 +152,14 @@ class DltResourceSchema:
             else:
                 return hint
 
+    @staticmethod
+    def _freeze_hint(hint: Any) -> Any:
+        if isinstance(hint, C_Mapping):
+            return tuple((k, DltResourceSchema._freeze_hint(v)) for k, v in hint.items())
+        if isinstance(hint, list):
+            return tuple(DltResourceSchema._freeze_hint(v) for v in hint)
+        return hint
+
     @staticmethod
     def _merge_key(hint: TColumnProp, keys: TColumnKey, partial: TPartialTableSchema) -> None:
         if isinstance(keys, str):
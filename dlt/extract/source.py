@@ -17,7 +17,7 @@ from dlt.common.configuration.container import Container
 from dlt.common.pipeline import PipelineContext, StateInjectableContext, SupportsPipelineRun, resource_state, source_state, pipeline_state
 from dlt.common.utils import graph_find_scc_nodes, flatten_list_or_items, get_callable_name, graph_edges_to_nodes, multi_context_manager, uniq_id
 
-from dlt.extract.typing import DataItemWithMeta, ItemTransformFunc, ItemTransformFunctionWithMeta, TDecompositionStrategy, TableNameMeta, FilterItem, MapItem, YieldMapItem
+from dlt.extract.typing import DataItemWithMeta, ItemTransformFunc, ItemTransformFunctionWithMeta, TDecompositionStrategy, TParallelizedMode, TableNameMeta, FilterItem, MapItem, YieldMapItem
 from dlt.extract.pipe import Pipe, ManagedPipeIterator, TPipeStep
 from dlt.extract.schema import DltResourceSchema, TTableSchemaTemplate
 from dlt.extract.incremental import Incremental, IncrementalResourceWrapper
@@ -80,7 +80,7 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             name = name or get_callable_name(data)
 
         # if generator, take name from it
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
 
         # name is mandatory
@@ -88,7 +88,7 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             raise ResourceNameMissing()
 
         # several iterable types are not allowed and must be excluded right away
-        if isinstance(data, (AsyncIterator, AsyncIterable)):
+        if isinstance(data, AsyncIterable) and not isinstance(data, AsyncIterator):
             raise InvalidResourceDataTypeAsync(name, data, type(data))
         if isinstance(data, (str, dict)):
             raise InvalidResourceDataTypeBasic(name, data, type(data))
@@ -99,8 +99,8 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             DltResource._ensure_valid_transformer_resource(name, data)
             parent_pipe = DltResource._get_parent_pipe(name, depends_on)
 
-        # create resource from iterator, iterable or generator function
-        if isinstance(data, (Iterable, Iterator)) or callable(data):
+        # create resource from iterator, iterable, async iterator or generator function
+        if isinstance(data, (Iterable, Iterator, AsyncIterator)) or callable(data):
             pipe = Pipe.from_data(name, data, parent=parent_pipe)
             return cls(pipe, table_schema_template, selected, incremental=incremental, section=section)
         else:
@@ -126,6 +126,55 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
         except (TypeError, ParametrizedResourceUnbound):
             return True
 
+    @property
+    def max_parallel_items(self) -> int:
+        """Maximum number of items from this resource (awaitables, deferred functions and async generators) evaluated in parallel. None means that only the global `max_parallel_items` applies."""
+        return self._pipe.max_parallel_items
+
+    @max_parallel_items.setter
+    def max_parallel_items(self, value: int) -> None:
+        self._pipe.max_parallel_items = value
+
+    @property
+    def batch_size(self) -> int:
+        """Number of single data items yielded by the resource that are collected into a list before being passed to the transform steps. None disables batching"""
+        return self._pipe.batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int) -> None:
+        self._pipe.batch_size = value
+
+    @property
+    def parallelized(self) -> TParallelizedMode:
+        """Evaluates the resource generator or transformer function in the thread pool. Items are yielded in order of the calls ("ordered") or as soon as they are available ("unordered"). None disables parallelization"""
+        return self._pipe.parallelized
+
+    @parallelized.setter
+    def parallelized(self, value: Union[bool, TParallelizedMode]) -> None:
+        if value is True:
+            value = "unordered"
+        self._pipe.parallelized = value or None
+
+    @property
+    def weight(self) -> float:
+        """Share of the extraction time given to this resource relative to other resources when `next_item_mode` is "weighted". Defaults to 1"""
+        return self._pipe.weight
+
+    @weight.setter
+    def weight(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError(f"Weight of resource {self.name} must be positive, got {value}")
+        self._pipe.weight = value
+
+    @property
+    def priority(self) -> int:
+        """Resources with higher priority are extracted before the others when `next_item_mode` is "priority". Defaults to 0"""
+        return self._pipe.priority
+
+    @priority.setter
+    def priority(self, value: int) -> None:
+        self._pipe.priority = value
+
     @property
     def incremental(self) -> IncrementalResourceWrapper:
         """Gets incremental transform if it is in the pipe"""
@@ -309,7 +358,9 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
         if self._pipe and not self._pipe.is_empty and clone_pipe:
             pipe = pipe._clone(keep_pipe_id=keep_pipe_id)
         # incremental and parent are already in the pipe (if any)
-        return DltResource(pipe, self._table_schema_template, selected=self.selected, section=self.section)
+        resource = DltResource(pipe, self._table_schema_template, selected=self.selected, section=self.section)
+        resource.evaluate_hints_per_item = self.evaluate_hints_per_item
+        return resource
 
     def __call__(self, *args: Any, **kwargs: Any) -> "DltResource":
         """Binds the parametrized resources to passed arguments. Creates and returns a bound resource. Generators and iterators are not evaluated."""
@@ -6,6 +6,7 @@ from dlt.common.typing import TAny, TDataItem, TDataItems
 
 
 TDecompositionStrategy = Literal["none", "scc"]
+TParallelizedMode = Literal["ordered", "unordered"]
 TDeferredDataItems = Callable[[], TDataItems]
 TAwaitableDataItems = Awaitable[TDataItems]
 TPipedDataItems = Union[TDataItems, TDeferredDataItems, TAwaitableDataItems]
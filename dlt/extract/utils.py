@@ -1,7 +1,10 @@
-from typing import Union, List, Any, Sequence
+import inspect
+import threading
+from typing import Union, List, Any, Sequence, AsyncIterator, Awaitable, Iterator
 
-from dlt.extract.typing import TTableHintTemplate, TDataItem
+from dlt.extract.typing import DataItemWithMeta, TDeferredDataItems, TTableHintTemplate, TDataItem, TDataItems
 from dlt.common.schema.typing import TColumnKey
+from dlt.common.source import set_current_pipe_name
 
 
 def resolve_column_value(column_hint: TTableHintTemplate[TColumnKey], item: TDataItem) -> Union[Any, List[Any]]:
@@ -12,3 +15,113 @@ def resolve_column_value(column_hint: TTableHintTemplate[TColumnKey], item: TDat
     if isinstance(columns, str):
         return item[columns]
     return [item[k] for k in columns]
+
+
+class WrappedIterator(Iterator[Any]):
+    """Base of the iterators returned by `wrap_async_iterator` and `wrap_parallel_iterator`. Keeps the wrapped generator in `gen` so it can be closed
+    by `close` even if the pipe iterator already dropped the wrapper from its sources.
+    """
+    def __init__(self, gen: Any, items: Iterator[Any]) -> None:
+        self.gen = gen
+        self.closed = False
+        self._items = items
+
+    def __next__(self) -> Any:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stops the wrapped generator. No more items are fetched from it"""
+        self.closed = True
+
+
+class AsyncIteratorWrapper(WrappedIterator):
+    def __init__(self, gen: AsyncIterator[TDataItems]) -> None:
+        super().__init__(gen, self._next_items())
+
+    async def _anext(self) -> Iterator[Any]:
+        if self.closed:
+            # close on the event loop that advanced the generator
+            if inspect.isasyncgen(self.gen):
+                await self.gen.aclose()
+            return iter(())
+        try:
+            item = await self.gen.__anext__()
+        except StopAsyncIteration:
+            return iter(())
+        return self._next_items(item)
+
+    def _next_items(self, *items: Any) -> Iterator[Any]:
+        yield from items
+        yield self._anext()
+
+
+class ParallelIteratorWrapper(WrappedIterator):
+    def __init__(self, pipe_name: str, gen: Iterator[TDataItems]) -> None:
+        super().__init__(gen, iter((self._next,)))
+        self.pipe_name = pipe_name
+        self._lock = threading.Lock()
+
+    def _next(self) -> Iterator[Any]:
+        # register pipe name in the worker thread
+        set_current_pipe_name(self.pipe_name)
+        with self._lock:
+            if self.closed:
+                return iter(())
+            try:
+                item = next(self.gen)
+            except StopIteration:
+                return iter(())
+        return iter((item, self._next))
+
+    def close(self) -> None:
+        super().close()
+        # waits until the item being fetched in the thread pool is returned
+        with self._lock:
+            if inspect.isgenerator(self.gen):
+                self.gen.close()
+
+
+def wrap_async_iterator(gen: AsyncIterator[TDataItems]) -> AsyncIteratorWrapper:
+    """Wraps async iterator `gen` into a regular iterator that yields awaitables.
+
+    Each awaitable fetches the next item from `gen` and returns an iterator yielding that item followed by an awaitable fetching the next one.
+    The pipe iterator evaluates the awaitables on its event loop so `gen` is advanced by one item at a time and never concurrently.
+    Awaitables are created only when requested so none is left unawaited when the pipe is closed. `gen` is closed by the pipe iterator when it
+    shuts down its event loop or by the next awaitable after the wrapper was closed.
+    """
+    return AsyncIteratorWrapper(gen)
+
+
+def wrap_parallel_iterator(pipe_name: str, gen: Iterator[TDataItems]) -> ParallelIteratorWrapper:
+    """Wraps iterator `gen` into a regular iterator that yields deferred callables, similarly to `wrap_async_iterator`.
+
+    Each callable advances `gen` by one item in the thread pool and returns an iterator yielding that item followed by a callable fetching the next one.
+    `gen` is closed when the wrapper is closed.
+    """
+    return ParallelIteratorWrapper(pipe_name, gen)
+
+
+def batch_items(gen: Iterator[Any], batch_size: int) -> Iterator[Any]:
+    """Collects single data items yielded by `gen` into lists of up to `batch_size` items.
+
+    Lists, items with meta, iterators, awaitables and deferred callables are passed as they are, after the items collected so far are yielded.
+    """
+    batch: List[TDataItem] = []
+    try:
+        for item in gen:
+            if isinstance(item, (list, DataItemWithMeta, Iterator)) or callable(item) or inspect.isawaitable(item):
+                if batch:
+                    yield batch
+                    batch = []
+                yield item
+            else:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+    finally:
+        # close the wrapped generator when batching is closed early
+        if inspect.isgenerator(gen):
+            gen.close()
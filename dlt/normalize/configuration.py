@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dlt.common.configuration import configspec
 from dlt.common.destination import DestinationCapabilitiesContext
@@ -9,6 +9,10 @@ from dlt.common.storages import LoadStorageConfiguration, NormalizeStorageConfig
 @configspec(init=True)
 class NormalizeConfiguration(PoolRunnerConfiguration):
     pool_type: TPoolType = "process"
+    file_split_min_bytes: Optional[int] = 32 * 1024 * 1024
+    """Extracted files larger than that may be split into chunks normalized by several workers in parallel. None disables splitting"""
+    infer_schema_sample_items: Optional[int] = None
+    """Infers new tables and columns from that many items of each extracted file before the files are normalized in parallel. Prevents workers from inferring conflicting types of the sampled columns"""
     destination_capabilities: DestinationCapabilitiesContext = None  # injectable
     _schema_storage_config: SchemaStorageConfiguration
     _normalize_storage_config: NormalizeStorageConfiguration
@@ -19,6 +23,8 @@ class NormalizeConfiguration(PoolRunnerConfiguration):
             self,
             pool_type: TPoolType = "process",
             workers: int = None,
+            file_split_min_bytes: Optional[int] = 32 * 1024 * 1024,
+            infer_schema_sample_items: Optional[int] = None,
             _schema_storage_config: SchemaStorageConfiguration = None,
             _normalize_storage_config: NormalizeStorageConfiguration = None,
             _load_storage_config: LoadStorageConfiguration = None
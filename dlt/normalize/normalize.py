@@ -1,8 +1,12 @@
 import os
-from typing import Any, Callable, List, Dict, Sequence, Tuple, Set
+import heapq
+import threading
+from copy import deepcopy
+from queue import Empty, Queue
+from typing import IO, Any, Callable, Iterator, List, Dict, NamedTuple, Optional, Sequence, Tuple, Set, Union
 from multiprocessing.pool import AsyncResult, Pool as ProcessPool
 
-from dlt.common import pendulum, json, logger, sleep
+from dlt.common import pendulum, json, logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -12,13 +16,13 @@ from dlt.common.runners import TRunMetrics, Runnable
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.schema.typing import TStoredSchema, TTableSchemaColumns
-from dlt.common.schema.utils import merge_schema_updates
+from dlt.common.schema.utils import bump_version_if_modified, merge_schema_updates, new_table
 from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.storages import NormalizeStorage, SchemaStorage, LoadStorage, LoadStorageConfiguration, NormalizeStorageConfiguration
 from dlt.common.typing import TDataItem
 from dlt.common.schema import TSchemaUpdate, Schema
 from dlt.common.schema.exceptions import CannotCoerceColumnException
-from dlt.common.utils import chunks
+from dlt.common.utils import uniq_id_base64
 
 from dlt.normalize.configuration import NormalizeConfiguration
 
@@ -30,6 +34,42 @@ TMapFuncType = Callable[[Schema, str, Sequence[str]], TMapFuncRV]  # input param
 TWorkerRV = Tuple[List[TSchemaUpdate], int, List[str]]
 
 
+class FileChunk(NamedTuple):
+    """Byte range of an extracted file normalized by a single worker. The lines that start within the range belong to the chunk"""
+    file: str
+    start: int
+    end: Optional[int]
+    """End of the range, None to read until the end of the file"""
+
+
+# extracted file or a chunk of it processed by a worker
+TWorkerFile = Union[str, FileChunk]
+
+
+class WorkerSchema(NamedTuple):
+    """Schema used by the normalize worker. Workers keep compiled schemas by version hash between the tasks"""
+    version_hash: str
+    schema_updates: List[TSchemaUpdate]
+    """Updates applied on top of the schema with `version_hash`"""
+    stored_schema: Optional[TStoredSchema]
+    """Schema with `version_hash`. If not present, the worker loads it from the temp load package when it does not have it compiled"""
+
+
+# compiled schemas and storages kept by the worker process between the tasks
+_WORKER_SCHEMAS: Dict[Tuple[str, int, int], Schema] = {}
+_WORKER_STORAGES: Dict[Tuple[Any, ...], Tuple[LoadStorage, NormalizeStorage]] = {}
+MAX_WORKER_SCHEMAS = 8
+MAX_WORKER_STORAGES = 64
+
+
+class NormalizeStream(NamedTuple):
+    """Load package to which extracted files of a schema are normalized while extract is running"""
+    load_id: str
+    schema: Schema
+    tasks: List["AsyncResult[TWorkerRV]"]
+    files: List[str]
+
+
 class Normalize(Runnable[ProcessPool]):
 
     @with_config(spec=NormalizeConfiguration, sections=(known_sections.NORMALIZE,))
@@ -40,6 +80,7 @@ class Normalize(Runnable[ProcessPool]):
         self.normalize_storage: NormalizeStorage = None
         self.load_storage: LoadStorage = None
         self.schema_storage: SchemaStorage = None
+        self.streams: Dict[str, NormalizeStream] = {}
 
         # setup storages
         self.create_storages()
@@ -67,40 +108,52 @@ class Normalize(Runnable[ProcessPool]):
             normalize_storage_config: NormalizeStorageConfiguration,
             loader_storage_config: LoadStorageConfiguration,
             destination_caps: DestinationCapabilitiesContext,
-            stored_schema: TStoredSchema,
+            worker_schema: WorkerSchema,
             load_id: str,
-            extracted_items_files: Sequence[str],
+            extracted_items_files: Sequence[TWorkerFile],
         ) -> TWorkerRV:
 
         schema_updates: List[TSchemaUpdate] = []
         total_items = 0
         # process all files with data items and write to buffered item storage
         with Container().injectable_context(destination_caps):
-            schema = Schema.from_stored_schema(stored_schema)
-            load_storage = LoadStorage(False, destination_caps.preferred_loader_file_format, LoadStorage.ALL_SUPPORTED_FILE_FORMATS, loader_storage_config)
-            normalize_storage = NormalizeStorage(False, normalize_storage_config)
+            load_storage, normalize_storage = Normalize._w_get_storages(normalize_storage_config, loader_storage_config, destination_caps)
+            schema = Normalize._w_get_schema(load_storage, destination_caps, load_id, worker_schema)
 
             try:
                 root_tables: Set[str] = set()
                 populated_root_tables: Set[str] = set()
-                for extracted_items_file in extracted_items_files:
+                for worker_file in extracted_items_files:
+                    extracted_items_file, start, end = worker_file if isinstance(worker_file, FileChunk) else (worker_file, 0, None)
                     line_no: int = 0
                     root_table_name = NormalizeStorage.parse_normalize_file_name(extracted_items_file).table_name
-                    root_tables.add(root_table_name)
+                    # other chunks of the file will not write empty jobs
+                    if start == 0:
+                        root_tables.add(root_table_name)
                     logger.debug(f"Processing extracted items in {extracted_items_file} in load_id {load_id} with table name {root_table_name} and schema {schema.name}")
-                    with normalize_storage.storage.open_file(extracted_items_file) as f:
-                        # enumerate jsonl file line by line
-                        items_count = 0
-                        for line_no, line in enumerate(f):
-                            items: List[TDataItem] = json.loads(line)
-                            partial_update, items_count = Normalize._w_normalize_chunk(load_storage, schema, load_id, root_table_name, items)
-                            schema_updates.append(partial_update)
-                            total_items += items_count
-                            logger.debug(f"Processed {line_no} items from file {extracted_items_file}, items {items_count} of total {total_items}")
-                        # if any item found in the file
-                        if items_count > 0:
-                            populated_root_tables.add(root_table_name)
-                            logger.debug(f"Processed total {line_no + 1} lines from file {extracted_items_file}, total items {total_items}")
+                    if extracted_items_file.endswith("parquet"):
+                        # arrow tables extracted into parquet files
+                        partial_update, items_count = Normalize._w_normalize_arrow_file(
+                            load_storage, schema, load_id, root_table_name, normalize_storage.storage.make_full_path(extracted_items_file), destination_caps
+                        )
+                        schema_updates.append(partial_update)
+                        total_items += items_count
+                        logger.debug(f"Processed total {items_count} rows from file {extracted_items_file}, total items {total_items}")
+                    else:
+                        with normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
+                            # enumerate jsonl file line by line
+                            items_count = 0
+                            for line_no, line in enumerate(Normalize._read_lines(f, start, end)):
+                                items: List[TDataItem] = json.loadb(line)
+                                partial_update, items_count = Normalize._w_normalize_chunk(load_storage, schema, load_id, root_table_name, items)
+                                schema_updates.append(partial_update)
+                                total_items += items_count
+                                logger.debug(f"Processed {line_no} items from file {extracted_items_file}, items {items_count} of total {total_items}")
+                            if items_count > 0:
+                                logger.debug(f"Processed total {line_no + 1} lines from file {extracted_items_file}, total items {total_items}")
+                    # if any item found in the file
+                    if items_count > 0:
+                        populated_root_tables.add(root_table_name)
                 # write empty jobs for tables without items if table exists in schema
                 for table_name in root_tables - populated_root_tables:
                     if table_name not in schema.tables:
@@ -119,7 +172,70 @@ class Normalize(Runnable[ProcessPool]):
         return schema_updates, total_items, load_storage.closed_files()
 
     @staticmethod
-    def _w_normalize_chunk(load_storage: LoadStorage, schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int]:
+    def _w_get_schema(load_storage: LoadStorage, destination_caps: DestinationCapabilitiesContext, load_id: str, worker_schema: WorkerSchema) -> Schema:
+        """Returns a copy of the compiled schema with `version_hash` with the `schema_updates` applied"""
+        # naming convention of the schema depends on the destination
+        key = (worker_schema.version_hash, destination_caps.max_identifier_length, destination_caps.max_column_identifier_length)
+        schema = _WORKER_SCHEMAS.get(key)
+        if schema is None:
+            if worker_schema.stored_schema:
+                # stored schema may share the tables with a schema used in this process
+                schema = Schema.from_stored_schema(deepcopy(worker_schema.stored_schema))
+            else:
+                schema = load_storage.load_temp_schema(load_id)
+            if len(_WORKER_SCHEMAS) >= MAX_WORKER_SCHEMAS:
+                _WORKER_SCHEMAS.pop(next(iter(_WORKER_SCHEMAS)))
+            _WORKER_SCHEMAS[key] = schema
+        # the schema is modified during normalization, copying is cheaper than compiling a new one
+        schema = deepcopy(schema)
+        for schema_update in worker_schema.schema_updates:
+            for table_updates in schema_update.values():
+                for partial_table in table_updates:
+                    schema.update_schema(partial_table)
+        return schema
+
+    @staticmethod
+    def _w_get_storages(
+        normalize_storage_config: NormalizeStorageConfiguration,
+        loader_storage_config: LoadStorageConfiguration,
+        destination_caps: DestinationCapabilitiesContext
+    ) -> Tuple[LoadStorage, NormalizeStorage]:
+        # storages keep the writers state so they are not shared between threads
+        key = (threading.get_ident(), destination_caps.preferred_loader_file_format, loader_storage_config.load_volume_path, normalize_storage_config.normalize_volume_path)
+        storages = _WORKER_STORAGES.get(key)
+        if storages is None:
+            if len(_WORKER_STORAGES) >= MAX_WORKER_STORAGES:
+                # threads of closed pools
+                _WORKER_STORAGES.clear()
+            load_storage = LoadStorage(False, destination_caps.preferred_loader_file_format, LoadStorage.ALL_SUPPORTED_FILE_FORMATS, loader_storage_config)
+            normalize_storage = NormalizeStorage(False, normalize_storage_config)
+            storages = _WORKER_STORAGES[key] = (load_storage, normalize_storage)
+        # writers of the previous task were closed
+        storages[0].buffered_writers.clear()
+        return storages
+
+    @staticmethod
+    def worker_schema(schema: Schema, stored: bool = True) -> WorkerSchema:
+        """Creates the worker schema from `schema`. If not `stored`, the schema must be saved in the temp load package"""
+        stored_schema = schema.to_dict()
+        return WorkerSchema(bump_version_if_modified(stored_schema)[1], [], stored_schema if stored else None)
+
+    @staticmethod
+    def _read_lines(f: IO[bytes], start: int, end: Optional[int]) -> Iterator[bytes]:
+        """Yields the lines of `f` that start within [`start`, `end`) byte range"""
+        if start > 0:
+            # skip the line that started before the range
+            f.seek(start - 1)
+            f.readline()
+        while end is None or f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+
+    @staticmethod
+    def _w_normalize_chunk(load_storage: Optional[LoadStorage], schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int]:
+        """Normalizes `items` and writes the rows to `load_storage`. If storage is not present, only the schema is inferred"""
         column_schemas: Dict[str, TTableSchemaColumns] = {}  # quick access to column schema for writers below
         schema_update: TSchemaUpdate = {}
         schema_name = schema.name
@@ -144,19 +260,79 @@ class Normalize(Runnable[ProcessPool]):
                         table_updates.append(partial_table)
                         # update our columns
                         column_schemas[table_name] = schema.get_table_columns(table_name)
-                    # get current columns schema
-                    columns = column_schemas.get(table_name)
-                    if not columns:
-                        columns = schema.get_table_columns(table_name)
-                        column_schemas[table_name] = columns
-                    # store row
-                    # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
-                    load_storage.write_data_item(load_id, schema_name, table_name, row, columns)
+                    if load_storage is not None:
+                        # get current columns schema
+                        columns = column_schemas.get(table_name)
+                        if not columns:
+                            columns = schema.get_table_columns(table_name)
+                            column_schemas[table_name] = columns
+                        # store row
+                        # TODO: it is possible to write to single file from many processes using this: https://gitlab.com/warsaw/flufl.lock
+                        load_storage.write_data_item(load_id, schema_name, table_name, row, columns)
                     # count total items
                     items_count += 1
             signals.raise_if_signalled()
         return schema_update, items_count
 
+    @staticmethod
+    def _w_normalize_arrow_file(
+        load_storage: LoadStorage,
+        schema: Schema,
+        load_id: str,
+        table_name: str,
+        file_path: str,
+        destination_caps: DestinationCapabilitiesContext
+    ) -> Tuple[TSchemaUpdate, int]:
+        from dlt.common.libs.pyarrow import pyarrow, get_column_type_from_py_arrow, get_py_arrow_datatype, py_arrow_to_table_schema_columns, uniq_ids_base64_array
+
+        schema_update: TSchemaUpdate = {}
+        table = pyarrow.parquet.read_table(file_path)
+        if "parquet" not in destination_caps.supported_loader_file_formats:
+            # destination cannot load arrow data directly, normalize as python objects
+            return Normalize._w_normalize_chunk(load_storage, schema, load_id, table_name, table.to_pylist())
+
+        # normalize column names
+        table = table.rename_columns([schema.naming.normalize_identifier(name) for name in table.column_names])
+        # add dlt columns, infer their schema from a sample row so default hints apply
+        dlt_row = {"_dlt_load_id": load_id, "_dlt_id": uniq_id_base64(10)}
+        _, partial_table = schema.coerce_row(table_name, None, dlt_row)
+        existing_columns = schema.get_table_columns(table_name) if table_name in schema.tables else {}
+        # cast the columns already present in the schema with a different data type
+        for idx, field in enumerate(table.schema):
+            data_type = existing_columns.get(field.name, {}).get("data_type")
+            if data_type is None or get_column_type_from_py_arrow(field.type) == data_type:
+                continue
+            try:
+                table = table.set_column(idx, field.name, table.column(idx).cast(get_py_arrow_datatype(data_type, destination_caps)))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as ex:
+                raise CannotCoerceColumnException(table_name, field.name, get_column_type_from_py_arrow(field.type), data_type, None) from ex
+        # add columns that are not yet present in the schema
+        new_columns = [c for n, c in py_arrow_to_table_schema_columns(table.schema).items() if n not in existing_columns]
+        if new_columns:
+            if partial_table is None:
+                partial_table = new_table(table_name, columns=new_columns)
+            else:
+                partial_table["columns"].update({c["name"]: c for c in new_columns})
+        if partial_table:
+            schema.update_schema(partial_table)
+            schema_update.setdefault(table_name, []).append(partial_table)
+
+        num_rows = table.num_rows
+        table = table.append_column("_dlt_load_id", pyarrow.array([load_id] * num_rows, pyarrow.string()))
+        table = table.append_column("_dlt_id", uniq_ids_base64_array(num_rows, 10))
+        # order columns as in the schema, add columns not present in arrow table
+        columns = schema.get_table_columns(table_name)
+        table = pyarrow.Table.from_arrays(
+            [
+                table.column(name) if name in table.column_names else pyarrow.nulls(num_rows, get_py_arrow_datatype(column["data_type"], destination_caps))
+                for name, column in columns.items()
+            ],
+            names=list(columns.keys())
+        )
+        load_storage.write_data_item(load_id, schema.name, table_name, table, columns, file_format="arrow")
+        signals.raise_if_signalled()
+        return schema_update, num_rows
+
     def update_schema(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> None:
         for schema_update in schema_updates:
             for table_name, table_updates in schema_update.items():
@@ -166,71 +342,140 @@ class Normalize(Runnable[ProcessPool]):
                     schema.update_schema(partial_table)
 
     @staticmethod
-    def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-        # sort files so the same tables are in the same worker
-        files = list(sorted(files))
-
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -=1
-            l_idx = idx + 1
-        return chunk_files
+    def estimate_file_bytes(file_path: str) -> Tuple[int, bool]:
+        """Estimates the amount of work to normalize the file at `file_path` with its uncompressed size. Also tells if the file can be split into chunks"""
+        size = os.path.getsize(file_path)
+        if file_path.endswith("parquet"):
+            return size, False
+        with open(file_path, "rb") as f:
+            if f.read(2) == b"\x1f\x8b":
+                # gzip keeps the uncompressed size modulo 2^32 in the last 4 bytes
+                f.seek(-4, os.SEEK_END)
+                return max(int.from_bytes(f.read(4), "little"), size), True
+        return size, True
+
+    @staticmethod
+    def split_worker_files(files: Sequence[str], file_sizes: Sequence[Tuple[int, bool]], chunk_bytes: int) -> Tuple[List[TWorkerFile], List[int]]:
+        """Splits the files larger than `chunk_bytes` into byte range chunks of roughly that size. 0 does not split. Returns the worker files and their sizes"""
+        worker_files: List[TWorkerFile] = []
+        worker_sizes: List[int] = []
+        for file, (size, splittable) in zip(files, file_sizes):
+            no_chunks = -(-size // chunk_bytes) if chunk_bytes > 0 else 1
+            if not splittable or no_chunks < 2:
+                worker_files.append(file)
+                worker_sizes.append(size)
+                continue
+            chunk_size = -(-size // no_chunks)
+            for idx in range(no_chunks):
+                # last chunk reads until the end as the size of large gzip files is not exact
+                end = (idx + 1) * chunk_size if idx < no_chunks - 1 else None
+                worker_files.append(FileChunk(file, idx * chunk_size, end))
+                worker_sizes.append(min(chunk_size, size - idx * chunk_size))
+        return worker_files, worker_sizes
+
+    @staticmethod
+    def group_worker_files(files: Sequence[TWorkerFile], no_groups: int, file_sizes: Sequence[int] = None) -> List[List[TWorkerFile]]:
+        """Distributes `files` into at most `no_groups` groups with similar total size using longest processing time first bin packing.
+        All files have the same size if `file_sizes` are not provided. Files in a group are sorted so the same tables are processed together"""
+        def _sort_key(file: TWorkerFile) -> Tuple[str, int]:
+            return (file.file, file.start) if isinstance(file, FileChunk) else (file, 0)
+
+        if file_sizes is None:
+            file_sizes = [1] * len(files)
+        # heap of (total size, group index)
+        groups_heap = [(0, idx) for idx in range(min(no_groups, len(files)))]
+        groups: List[List[TWorkerFile]] = [[] for _ in groups_heap]
+        # largest files first, the same size is assigned in order of the names
+        for size, file in sorted(zip(file_sizes, files), key=lambda s_f: (-s_f[0], _sort_key(s_f[1]))):
+            total_size, idx = heapq.heappop(groups_heap)
+            groups[idx].append(file)
+            heapq.heappush(groups_heap, (total_size + size, idx))
+        return [sorted(group, key=_sort_key) for group in groups]
+
+    def infer_schema(self, schema: Schema, load_id: str, files: Sequence[str], sample_items: int) -> List[TSchemaUpdate]:
+        """Infers new tables and columns of `schema` from the first `sample_items` items of each extracted file.
+
+        Used before the files are normalized in parallel so the workers start with tables, columns and variants settled in the order of the files
+        instead of inferring conflicting types. Workers still infer the columns that are not in the sample and may conflict. Parquet files are skipped.
+        """
+        schema_updates: List[TSchemaUpdate] = []
+        for file in sorted(files):
+            if file.endswith("parquet"):
+                continue
+            root_table_name = NormalizeStorage.parse_normalize_file_name(file).table_name
+            items_left = sample_items
+            with self.normalize_storage.storage.open_file(file, "rb") as f:
+                for line in f:
+                    items: List[TDataItem] = json.loadb(line)[:items_left]
+                    schema_update, _ = Normalize._w_normalize_chunk(None, schema, load_id, root_table_name, items)
+                    if schema_update:
+                        schema_updates.append(schema_update)
+                    items_left -= len(items)
+                    if items_left <= 0:
+                        break
+        return schema_updates
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
         workers = self.pool._processes  # type: ignore
-        chunk_files = self.group_worker_files(files, workers)
-        schema_dict: TStoredSchema = schema.to_dict()
-        config_tuple = (self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, schema_dict)
-        param_chunk = [[*config_tuple, load_id, files] for files in chunk_files]
-        tasks: List[Tuple[AsyncResult[TWorkerRV], List[Any]]] = []
-
+        # distribute work by the size of the files and split the large files so many workers process them
+        file_sizes = [self.estimate_file_bytes(self.normalize_storage.storage.make_full_path(file)) for file in files]
+        chunk_bytes = max(self.config.file_split_min_bytes, sum(size for size, _ in file_sizes) // workers) if self.config.file_split_min_bytes else 0
+        worker_files, worker_sizes = self.split_worker_files(files, file_sizes, chunk_bytes)
+        chunk_files = self.group_worker_files(worker_files, workers, worker_sizes)
         # return stats
         schema_updates: List[TSchemaUpdate] = []
+        if self.config.infer_schema_sample_items:
+            schema_updates.extend(self.infer_schema(schema, load_id, files, self.config.infer_schema_sample_items))
+        inferred_updates_count = len(schema_updates)
+        # workers load the schema from the load package if they do not have it compiled
+        self.load_storage.save_temp_schema(schema, load_id)
+        worker_schema = self.worker_schema(schema, stored=False)
+        config_tuple = (self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, worker_schema)
+        param_chunk = [[*config_tuple, load_id, files] for files in chunk_files]
+        # workers put their results here as soon as they complete
+        completed: "Queue[Tuple[List[Any], bool, Any]]" = Queue()
+
+        def _submit(params: List[Any]) -> None:
+            self.pool.apply_async(
+                Normalize.w_normalize_files,
+                params,
+                callback=lambda result: completed.put((params, True, result)),
+                error_callback=lambda exc: completed.put((params, False, exc))
+            )
 
         # push all tasks to queue
         for params in param_chunk:
-            pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-            tasks.append((pending, params))
-
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.ready():
-                    if pending.successful():
-                        result: TWorkerRV = pending.get()
-                        try:
-                            # gather schema from all manifests, validate consistency and combine
-                            self.update_schema(schema, result[0])
-                            schema_updates.extend(result[0])
-                            # update metrics
-                            self.collector.update("Files", len(result[2]))
-                            self.collector.update("Items", result[1])
-                        except CannotCoerceColumnException as exc:
-                            # schema conflicts resulting from parallel executing
-                            logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
-                            # delete all files produced by the task
-                            for file in result[2]:
-                                os.remove(file)
-                            # schedule the task again
-                            schema_dict = schema.to_dict()
-                            # TODO: it's time for a named tuple
-                            params[3] = schema_dict
-                            retry_pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-                            tasks.append((retry_pending, params))
-                        # remove finished tasks
-                        tasks.remove(task)
-                    else:
-                        # raise the exception
-                        pending.get()
-                        raise AssertionError("unreachable code: pending.get must raise")
+            _submit(params)
+        pending_tasks = len(param_chunk)
+
+        while pending_tasks > 0:
+            try:
+                params, successful, result = completed.get(timeout=1.0)
+            except Empty:
+                # remain responsive to signals while waiting for long tasks
+                signals.raise_if_signalled()
+                continue
+            pending_tasks -= 1
+            if not successful:
+                # raise the worker exception
+                raise result
+            try:
+                # gather schema from all manifests, validate consistency and combine
+                self.update_schema(schema, result[0])
+                schema_updates.extend(result[0])
+                # update metrics
+                self.collector.update("Files", len(result[2]))
+                self.collector.update("Items", result[1])
+            except CannotCoerceColumnException as exc:
+                # schema conflicts resulting from parallel executing, the inferred schema does not cover columns first seen after the sample
+                logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                # delete all files produced by the task
+                for file in result[2]:
+                    os.remove(file)
+                # schedule the task again with the schema updates merged so far
+                params[3] = worker_schema._replace(schema_updates=schema_updates[inferred_updates_count:])
+                _submit(params)
+                pending_tasks += 1
 
         return schema_updates
 
@@ -239,7 +484,7 @@ class Normalize(Runnable[ProcessPool]):
             self.normalize_storage.config,
             self.load_storage.config,
             self.config.destination_capabilities,
-            schema.to_dict(),
+            self.worker_schema(schema),
             load_id,
             files,
         )
@@ -293,6 +538,85 @@ class Normalize(Runnable[ProcessPool]):
 
         return load_id
 
+    def stream_files(self, schema: Schema, partial_tables: TSchemaUpdate, files: Sequence[str]) -> None:
+        """Starts normalizing extracted `files` of the `schema` while the extract is still running.
+
+        The files are normalized in the process pool into a load package created for the `schema`, with the table hints from `partial_tables`.
+        Call `commit_streams` when extract is completed to seal the load packages.
+        """
+        assert self.pool is not None, "Process pool is required to normalize files during extract"
+        stream = self.streams.get(schema.name)
+        if stream is None:
+            load_id = str(pendulum.now().timestamp())
+            self.load_storage.create_temp_load_package(load_id)
+            logger.info(f"Created temp load folder {load_id} to normalize files of schema {schema.name} during extract")
+            stream = self.streams[schema.name] = NormalizeStream(load_id, schema.clone(), [], [])
+        # table hints are known when the first item of a table is extracted
+        for partials in partial_tables.values():
+            for partial in partials:
+                stream.schema.update_schema(stream.schema.normalize_table_identifiers(partial))
+        params = (self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, self.worker_schema(stream.schema), stream.load_id, files)
+        stream.tasks.append(self.pool.apply_async(Normalize.w_normalize_files, params))
+        stream.files.extend(files)
+
+    def commit_streams(self) -> None:
+        """Normalizes remaining extracted files of the streamed schemas and commits their load packages. Files of other schemas are left for `run`"""
+        try:
+            files = self.normalize_storage.list_files_to_normalize_sorted()
+            for schema_name, files_iter in self.normalize_storage.group_by_schema(files):
+                stream = self.streams.pop(schema_name, None)
+                if stream is None:
+                    continue
+                schema_files = list(files_iter)
+                logger.info(f"Found {len(schema_files)} files in schema {schema_name} load_id {stream.load_id}, {len(stream.files)} normalized during extract")
+                with self.collector(f"Normalize {schema_name} in {stream.load_id}"):
+                    self.collector.update("Files", 0, len(schema_files))
+                    self.collector.update("Items", 0)
+                    self.spool_stream_files(stream, schema_name, schema_files)
+        finally:
+            self.streams.clear()
+
+    def drop_streams(self) -> None:
+        """Deletes the files normalized during extract together with their load packages. Used when extract fails"""
+        for stream in self.streams.values():
+            # wait until workers stop writing to the load package
+            for task in stream.tasks:
+                task.wait()
+            for file in stream.files:
+                self.normalize_storage.storage.delete(file)
+            self.load_storage.storage.delete_folder(stream.load_id, recursively=True)
+        self.streams.clear()
+
+    def spool_stream_files(self, stream: NormalizeStream, schema_name: str, files: Sequence[str]) -> str:
+        map_parallel_f = self.map_parallel if self.pool else self.map_single
+        streamed_files = set(stream.files)
+
+        def _map_stream(schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
+            # wait for all the files normalized during extract before the schema is updated
+            results: List[TWorkerRV] = [task.get() for task in stream.tasks]
+            schema_updates: List[TSchemaUpdate] = []
+            for result in results:
+                self.update_schema(schema, result[0])
+                schema_updates.extend(result[0])
+                self.collector.update("Files", len(result[2]))
+                self.collector.update("Items", result[1])
+            # normalize files committed at the end of extract
+            remaining_files = [file for file in files if file not in streamed_files]
+            if remaining_files:
+                schema_updates.extend(map_parallel_f(schema, load_id, remaining_files))
+            return schema_updates
+
+        try:
+            self.spool_files(schema_name, stream.load_id, _map_stream, files)
+        except CannotCoerceColumnException as exc:
+            # files normalized during extract were inferred with partial schema
+            logger.warning(f"Schema conflict in files normalized during extract, switching to single thread ({str(exc)}")
+            # start from scratch
+            self.load_storage.create_temp_load_package(stream.load_id)
+            self.spool_files(schema_name, stream.load_id, self.map_single, files)
+
+        return stream.load_id
+
     def run(self, pool: ProcessPool) -> TRunMetrics:
         # keep the pool in class instance
         self.pool = pool
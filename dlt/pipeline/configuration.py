@@ -25,6 +25,18 @@ class PipelineConfiguration(BaseConfiguration):
     full_refresh: bool = False
     """When set to True, each instance of the pipeline with the `pipeline_name` starts from scratch when run and loads the data to a separate dataset."""
     progress: Optional[str] = None
+    pipelined_run: bool = False
+    """Normalizes the files extracted by the `run` method while extract is still running. Files are handed to normalize when they reach the `file_max_items` or `file_max_bytes` limit of the extract data writer"""
+    micro_batch_max_items: Optional[int] = None
+    """When set, the `run` method extracts the data in micro batches of up to that number of items. Each micro batch is normalized into a separate load package which is loaded while the next batch is extracted"""
+    micro_batch_max_seconds: Optional[float] = None
+    """When set, the `run` method ends a micro batch after that number of seconds"""
+    micro_batch_max_in_flight: int = 1
+    """Maximum number of micro batch packages being loaded while extract is running. Extract waits when this number is reached"""
+    extract_checkpoint_files: Optional[int] = None
+    """When set, extract commits the extracted files to be normalized and saves the pipeline state each time the data writers close that number of files"""
+    extract_checkpoint_seconds: Optional[float] = None
+    """When set, extract commits the extracted files and saves the pipeline state after that number of seconds"""
     runtime: RunConfiguration
 
     def on_resolved(self) -> None:
@@ -39,6 +39,12 @@ class PipelineStepFailed(PipelineException):
         super().__init__(pipeline.pipeline_name, f"Pipeline execution failed at stage {step} with exception:\n\n{type(exception)}\n{exception}")
 
 
+class MicroBatchReplaceNotSupported(PipelineException):
+    def __init__(self, pipeline_name: str, resource_name: str) -> None:
+        self.resource_name = resource_name
+        super().__init__(pipeline_name, f"Resource {resource_name} has replace write disposition and cannot be loaded in micro batches. Each micro batch would replace the data loaded by the previous one.")
+
+
 class PipelineStateEngineNoUpgradePathException(PipelineException):
     def __init__(self, pipeline_name: str, init_engine: int, from_engine: int, to_engine: int) -> None:
         self.init_engine = init_engine
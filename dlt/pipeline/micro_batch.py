@@ -0,0 +1,48 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List
+
+from dlt.common import logger
+from dlt.common.configuration.container import Container, TContexts
+from dlt.common.data_writers import TLoaderFileFormat
+from dlt.common.runners import pool_runner as runner
+
+from dlt.load import Load
+from dlt.load.configuration import LoaderConfiguration
+
+
+class MicroBatchLoader:
+    """Loads the packages of micro batches in a background thread while the next micro batch is being extracted"""
+
+    def __init__(self, max_in_flight: int, load_config: LoaderConfiguration, loader_file_format: TLoaderFileFormat = None) -> None:
+        self.load: Load = None
+        """Loader created when the first micro batch is normalized"""
+        self.load_config = load_config
+        """Resolved loader settings: number of workers and if failed jobs raise"""
+        self.max_in_flight = max(max_in_flight, 1)
+        self.loader_file_format = loader_file_format
+        """File format into which micro batches are normalized"""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dlt_micro_batch_load")
+        self._pending: List[Future] = []  # type: ignore[type-arg]
+
+    def submit(self) -> None:
+        """Starts loading all the normalized packages. Blocks while `max_in_flight` loads are still pending and raises if any of them failed"""
+        self._pending = [f for f in self._pending if not f.done() or f.exception() is not None]
+        while self._pending and (len(self._pending) >= self.max_in_flight or self._pending[0].done()):
+            logger.info(f"Waiting for {len(self._pending)} micro batch loads to complete")
+            # raises if load failed
+            self._pending.pop(0).result()
+        # load sees the contexts from the moment of submit, not the ones injected by the extract running in the meantime
+        self._pending.append(self._executor.submit(self._run_load, Container().snapshot_contexts()))
+
+    def wait(self) -> None:
+        """Waits until all pending loads complete and raises if any of them failed"""
+        while self._pending:
+            self._pending.pop(0).result()
+
+    def _run_load(self, contexts: TContexts) -> int:
+        with Container().thread_isolated_contexts(contexts):
+            return runner.run_pool(self.load.config, self.load)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._pending.clear()
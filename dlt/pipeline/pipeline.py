@@ -2,9 +2,10 @@ import contextlib
 import os
 import datetime  # noqa: 251
 from contextlib import contextmanager
-from functools import wraps
+from copy import deepcopy
+from functools import partial, wraps
 from collections.abc import Sequence as C_Sequence
-from typing import Any, Callable, ClassVar, List, Iterator, Optional, Sequence, Tuple, cast, get_type_hints, ContextManager
+from typing import Any, Callable, ClassVar, Dict, List, Iterator, Optional, Sequence, Tuple, cast, get_type_hints, ContextManager
 
 from dlt import version
 from dlt.common import json, logger, pendulum
@@ -13,7 +14,7 @@ from dlt.common.configuration.specs import RunConfiguration, CredentialsConfigur
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.exceptions import ConfigFieldMissingException, ContextDefaultCannotBeCreated
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
-from dlt.common.configuration.resolve import initialize_credentials
+from dlt.common.configuration.resolve import initialize_credentials, resolve_configuration
 from dlt.common.exceptions import (DestinationLoadingViaStagingNotSupported, DestinationNoStagingMode, MissingDependencyException,
                                    DestinationIncompatibleLoaderFileFormatException)
 from dlt.common.normalizers import default_normalizers, import_normalizers
@@ -27,7 +28,7 @@ from dlt.common.storages import LiveSchemaStorage, NormalizeStorage, LoadStorage
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import DestinationReference, JobClientBase, DestinationClientConfiguration, DestinationClientDwhConfiguration, TDestinationReferenceArg, DestinationClientStagingConfiguration, DestinationClientDwhConfiguration
 from dlt.common.destination.capabilities import INTERNAL_LOADER_FILE_FORMATS
-from dlt.common.pipeline import ExtractInfo, LoadInfo, NormalizeInfo, PipelineContext, SupportsPipeline, TPipelineLocalState, TPipelineState, StateInjectableContext
+from dlt.common.pipeline import ExtractInfo, ExtractMetrics, LoadInfo, NormalizeInfo, PipelineContext, SupportsPipeline, TPipelineLocalState, TPipelineState, StateInjectableContext
 from dlt.common.schema import Schema
 from dlt.common.utils import is_interactive
 from dlt.common.data_writers import TLoaderFileFormat
@@ -46,7 +47,9 @@ from dlt.load import Load
 
 from dlt.pipeline.configuration import PipelineConfiguration
 from dlt.pipeline.progress import _Collector, _NULL_COLLECTOR
-from dlt.pipeline.exceptions import CannotRestorePipelineException, InvalidPipelineName, PipelineConfigMissing, PipelineNotActive, PipelineStepFailed, SqlClientNotAvailable
+from dlt.pipeline.exceptions import (CannotRestorePipelineException, InvalidPipelineName, MicroBatchReplaceNotSupported, PipelineConfigMissing, PipelineNotActive,
+                                     PipelineStepFailed, SqlClientNotAvailable)
+from dlt.pipeline.micro_batch import MicroBatchLoader
 from dlt.pipeline.trace import PipelineTrace, PipelineStepTrace, load_trace, merge_traces, start_trace, start_trace_step, end_trace_step, end_trace, describe_extract_data
 from dlt.pipeline.typing import TPipelineStep
 from dlt.pipeline.state_sync import STATE_ENGINE_VERSION, load_state_from_destination, merge_state_if_changed, migrate_state, state_resource, json_encode_state, json_decode_state
@@ -211,6 +214,8 @@ class Pipeline(SupportsPipeline):
         self._trace: PipelineTrace = None
         self._last_trace: PipelineTrace = None
         self._state_restored: bool = False
+        self._extract_normalize: Normalize = None
+        self._micro_batch_loader: MicroBatchLoader = None
 
         initialize_runtime(self.runtime_config)
         # initialize pipeline working dir
@@ -272,6 +277,7 @@ class Pipeline(SupportsPipeline):
         # create extract storage to which all the sources will be extracted
         storage = ExtractorStorage(self._normalize_storage_config)
         extract_ids: List[str] = []
+        metrics = ExtractMetrics(dynamic_table_schemas=0, dynamic_table_schemas_cached=0)
         try:
             with self._maybe_destination_capabilities():
                 # extract all sources
@@ -280,16 +286,18 @@ class Pipeline(SupportsPipeline):
                         raise SourceExhausted(source.name)
                     # TODO: merge infos for all the sources
                     extract_ids.append(
-                        self._extract_source(storage, source, max_parallel_items, workers)
+                        self._extract_source(storage, source, max_parallel_items, workers, metrics)
                     )
                 # commit extract ids
                 # TODO: if we fail here we should probably wipe out the whole extract folder
                 for extract_id in extract_ids:
                     storage.commit_extract_files(extract_id)
-                return ExtractInfo(describe_extract_data(data))
+                return ExtractInfo(describe_extract_data(data), metrics)
+        except PipelineStepFailed:
+            # ie. load of a micro batch failed
+            raise
         except Exception as exc:
-            # TODO: provide metrics from extractor
-            raise PipelineStepFailed(self, "extract", exc, ExtractInfo(describe_extract_data(data))) from exc
+            raise PipelineStepFailed(self, "extract", exc, ExtractInfo(describe_extract_data(data), metrics)) from exc
 
     @with_runtime_trace
     @with_schemas_sync
@@ -306,20 +314,15 @@ class Pipeline(SupportsPipeline):
 
         # make sure destination capabilities are available
         self._get_destination_capabilities()
-        # create default normalize config
-        normalize_config = NormalizeConfiguration(
-            workers=workers,
-            pool_type="none" if workers == 1 else "process",
-            _schema_storage_config=self._schema_storage_config,
-            _normalize_storage_config=self._normalize_storage_config,
-            _load_storage_config=self._load_storage_config
-        )
         # run with destination context
         with self._maybe_destination_capabilities(loader_file_format=loader_file_format):
             # shares schema storage with the pipeline so we do not need to install
-            normalize = Normalize(collector=self.collector, config=normalize_config, schema_storage=self._schema_storage)
+            normalize = Normalize(collector=self.collector, config=self._get_normalize_config(workers), schema_storage=self._schema_storage)
             try:
                 with signals.delayed_signals():
+                    # seal load packages with files normalized during extract
+                    if self._extract_normalize:
+                        self._extract_normalize.commit_streams()
                     runner.run_pool(normalize.config, normalize)
                 return NormalizeInfo()
             except Exception as n_ex:
@@ -348,32 +351,7 @@ class Pipeline(SupportsPipeline):
         if not self.default_schema_name:
             return None
 
-        # make sure that destination is set and client is importable and can be instantiated
-        client = self._get_destination_client(self.default_schema)
-        staging_client = None
-        if self.staging:
-            staging_client = self._get_staging_client(self.default_schema)
-            # inject staging config into destination config,
-            # TODO: Not super clean I think? - DestinationClientDwhConfiguration must be refactored
-            # staging_credentials, dataset name and default schema name are arguments for the loader not parts of configuration
-            if isinstance(client.config, DestinationClientDwhConfiguration) and not client.config.staging_credentials:
-                client.config.staging_credentials = staging_client.config.credentials
-
-        # create default loader config and the loader
-        load_config = LoaderConfiguration(
-            workers=workers,
-            raise_on_failed_jobs=raise_on_failed_jobs,
-            _load_storage_config=self._load_storage_config
-        )
-        load = Load(
-            self.destination,
-            staging_destination=self.staging,
-            collector=self.collector,
-            is_storage_owner=False,
-            config=load_config,
-            initial_client_config=client.config,
-            initial_staging_client_config=staging_client.config if staging_client else None
-        )
+        load = self._get_load(workers, raise_on_failed_jobs, self.collector)
         try:
             with signals.delayed_signals():
                 runner.run_pool(load.config, load)
@@ -475,9 +453,16 @@ class Pipeline(SupportsPipeline):
 
         # extract from the source
         if data is not None:
-            self.extract(data, table_name=table_name, write_disposition=write_disposition, columns=columns, primary_key=primary_key, schema=schema)
-            self.normalize(loader_file_format=loader_file_format)
-            return self.load(destination, dataset_name, credentials=credentials)
+            with self._maybe_load_micro_batches(loader_file_format, credentials) as batch_loader:
+                with self._maybe_normalize_during_extract(loader_file_format):
+                    self.extract(data, table_name=table_name, write_disposition=write_disposition, columns=columns, primary_key=primary_key, schema=schema)
+                    self.normalize(loader_file_format=loader_file_format)
+            info = self.load(destination, dataset_name, credentials=credentials)
+            if batch_loader and batch_loader.load:
+                # add packages of micro batches loaded in the background
+                batches_info = self._get_load_info(batch_loader.load)
+                info = info._replace(loads_ids=batches_info.loads_ids + info.loads_ids, load_packages=batches_info.load_packages + info.load_packages)
+            return info
         else:
             return None
 
@@ -847,12 +832,40 @@ class Pipeline(SupportsPipeline):
 
         return sources
 
-    def _extract_source(self, storage: ExtractorStorage, source: DltSource, max_parallel_items: int, workers: int) -> str:
+    def _extract_source(self, storage: ExtractorStorage, source: DltSource, max_parallel_items: int, workers: int, metrics: ExtractMetrics = None) -> str:
         # discover the schema from source
         source_schema = source.schema
 
-        extract_id = extract_with_schema(storage, source, source_schema, self.collector, max_parallel_items, workers)
+        # normalize files that reached the size limits while extract is running
+        on_files_closed = partial(self._extract_normalize.stream_files, source_schema) if self._extract_normalize else None
+        on_batch_end = None
+        batch_limits: Dict[str, Any] = {}
+        use_checkpoints = bool(self.config.extract_checkpoint_files or self.config.extract_checkpoint_seconds)
+        if use_checkpoints and (self._micro_batch_loader or on_files_closed):
+            logger.warning(
+                f"Extract checkpoints of source {source_schema.name} are disabled: they cannot be used together with pipelined_run and micro batches."
+                " Micro batches save the pipeline state with each batch instead."
+            )
+        if self._micro_batch_loader:
+            # tables with replace write disposition would be replaced by each micro batch
+            for resource in source.resources.selected.values():
+                with contextlib.suppress(DataItemRequiredForDynamicTableHints):
+                    if resource.write_disposition == "replace":
+                        raise MicroBatchReplaceNotSupported(self.pipeline_name, resource.name)
+            on_batch_end = partial(self._end_micro_batch, source_schema)
+            batch_limits = {"batch_max_items": self.config.micro_batch_max_items, "batch_max_seconds": self.config.micro_batch_max_seconds}
+        elif use_checkpoints and not on_files_closed:
+            # commit files and state periodically so a failed extract may resume from the last checkpoint
+            on_batch_end = partial(self._extract_checkpoint, source_schema)
+            batch_limits = {"batch_max_files": self.config.extract_checkpoint_files, "batch_max_seconds": self.config.extract_checkpoint_seconds}
+        extract_id = extract_with_schema(
+            storage, source, source_schema, self.collector, max_parallel_items, workers, metrics=metrics, on_files_closed=on_files_closed,
+            on_batch_end=on_batch_end, **batch_limits
+        )
+        self._update_pipeline_schema(source_schema)
+        return extract_id
 
+    def _update_pipeline_schema(self, source_schema: Schema) -> None:
         # if source schema does not exist in the pipeline
         if source_schema.name not in self._schema_storage:
             # save schema into the pipeline
@@ -873,8 +886,6 @@ class Pipeline(SupportsPipeline):
         for table in source_schema.data_tables(include_incomplete=True):
             pipeline_schema.update_schema(pipeline_schema.normalize_table_identifiers(table))
 
-        return extract_id
-
     def _get_destination_client_initial_config(self, destination: DestinationReference = None, credentials: Any = None, as_staging: bool = False) -> DestinationClientConfiguration:
         destination = destination or self.destination
         if not destination:
@@ -991,6 +1002,125 @@ class Pipeline(SupportsPipeline):
             raise DestinationNoStagingMode(staging_module.__name__)
         self.staging = staging_module or self.staging
 
+    def _get_load(self, workers: int, raise_on_failed_jobs: bool, collector: _Collector) -> Load:
+        # make sure that destination is set and client is importable and can be instantiated
+        client = self._get_destination_client(self.default_schema)
+        staging_client = None
+        if self.staging:
+            staging_client = self._get_staging_client(self.default_schema)
+            # inject staging config into destination config,
+            # TODO: Not super clean I think? - DestinationClientDwhConfiguration must be refactored
+            # staging_credentials, dataset name and default schema name are arguments for the loader not parts of configuration
+            if isinstance(client.config, DestinationClientDwhConfiguration) and not client.config.staging_credentials:
+                client.config.staging_credentials = staging_client.config.credentials
+
+        # create default loader config and the loader
+        load_config = LoaderConfiguration(
+            workers=workers,
+            raise_on_failed_jobs=raise_on_failed_jobs,
+            _load_storage_config=self._load_storage_config
+        )
+        return Load(
+            self.destination,
+            staging_destination=self.staging,
+            collector=collector,
+            is_storage_owner=False,
+            config=load_config,
+            initial_client_config=client.config,
+            initial_staging_client_config=staging_client.config if staging_client else None
+        )
+
+    def _get_normalize_config(self, workers: int) -> NormalizeConfiguration:
+        # create default normalize config
+        return NormalizeConfiguration(
+            workers=workers,
+            pool_type="none" if workers == 1 else "process",
+            _schema_storage_config=self._schema_storage_config,
+            _normalize_storage_config=self._normalize_storage_config,
+            _load_storage_config=self._load_storage_config
+        )
+
+    @contextmanager
+    def _maybe_normalize_during_extract(self, loader_file_format: TLoaderFileFormat = None) -> Iterator[None]:
+        """Normalizes files extracted in the context while extract is running if `pipelined_run` is enabled. Load packages are sealed by `normalize`"""
+        if not self.config.pipelined_run or self._micro_batch_loader:
+            yield
+            return
+        if is_interactive():
+            # process pool cannot be used in notebooks, files are normalized after extract
+            logger.warning("Pipelined run is not supported in interactive mode ie. in notebook. The data will be normalized after extract is done.")
+            yield
+            return
+        # make sure destination capabilities are available
+        self._get_destination_capabilities()
+        with self._maybe_destination_capabilities(loader_file_format=loader_file_format):
+            with inject_section(ConfigSectionContext(pipeline_name=self.pipeline_name, sections=(known_sections.NORMALIZE,))):
+                # use configured number of workers
+                normalize_config = resolve_configuration(self._get_normalize_config(1), sections=(known_sections.NORMALIZE,))
+                # files are normalized in separate processes so extract is not blocked
+                normalize_config.pool_type = "process"
+                normalize = Normalize(collector=self.collector, config=normalize_config, schema_storage=self._schema_storage)
+        normalize.pool = runner.create_pool(normalize.config)
+        self._extract_normalize = normalize
+        try:
+            yield
+        finally:
+            self._extract_normalize = None
+            # extract failed, drop the files and load packages
+            if normalize.streams:
+                normalize.drop_streams()
+            if normalize.pool:
+                normalize.pool.terminate()
+
+    @contextmanager
+    def _maybe_load_micro_batches(self, loader_file_format: TLoaderFileFormat = None, credentials: Any = None) -> Iterator[MicroBatchLoader]:
+        """Loads micro batches in the background while extract is running if `micro_batch_max_items` or `micro_batch_max_seconds` is set"""
+        if not self.config.micro_batch_max_items and not self.config.micro_batch_max_seconds:
+            yield None
+            return
+        # make sure destination capabilities are available
+        self._get_destination_capabilities()
+        self.credentials = credentials or self.credentials
+        with inject_section(ConfigSectionContext(pipeline_name=self.pipeline_name, sections=(known_sections.LOAD,))):
+            load_config = resolve_configuration(LoaderConfiguration(), sections=(known_sections.LOAD,))
+        batch_loader = self._micro_batch_loader = MicroBatchLoader(self.config.micro_batch_max_in_flight, load_config, loader_file_format)
+        try:
+            yield batch_loader
+            try:
+                batch_loader.wait()
+            except Exception as l_ex:
+                raise PipelineStepFailed(self, "load", l_ex, self._get_load_info(batch_loader.load)) from l_ex
+        finally:
+            self._micro_batch_loader = None
+            batch_loader.close()
+
+    def _end_micro_batch(self, source_schema: Schema) -> None:
+        """Commits the pipeline state, normalizes the extracted micro batch and starts loading it in the background"""
+        batch_loader = self._micro_batch_loader
+        self._update_pipeline_schema(source_schema)
+        self._checkpoint_state()
+        with self._maybe_destination_capabilities(loader_file_format=batch_loader.loader_file_format):
+            with inject_section(ConfigSectionContext(pipeline_name=self.pipeline_name, sections=(known_sections.NORMALIZE,))):
+                normalize = Normalize(collector=self.collector, config=self._get_normalize_config(1), schema_storage=self._schema_storage)
+                with signals.delayed_signals():
+                    runner.run_pool(normalize.config, normalize)
+            if batch_loader.load is None:
+                with inject_section(ConfigSectionContext(pipeline_name=self.pipeline_name, sections=(known_sections.LOAD,))):
+                    # collector is not thread safe
+                    load_config = batch_loader.load_config
+                    batch_loader.load = self._get_load(load_config.workers, load_config.raise_on_failed_jobs, _NULL_COLLECTOR)
+        try:
+            batch_loader.submit()
+        except Exception as l_ex:
+            raise PipelineStepFailed(self, "load", l_ex, self._get_load_info(batch_loader.load)) from l_ex
+
+    def _extract_checkpoint(self, source_schema: Schema) -> None:
+        """Saves the schema and the pipeline state after the extracted files were committed to be normalized"""
+        self._update_pipeline_schema(source_schema)
+        self._schema_storage.commit_live_schema(source_schema.name)
+        self._checkpoint_state()
+        logger.info(f"Extract checkpoint of source {source_schema.name} saved")
+
     @contextmanager
     def _maybe_destination_capabilities(self, loader_file_format: TLoaderFileFormat = None) -> Iterator[DestinationCapabilitiesContext]:
         try:
@@ -1184,29 +1314,42 @@ class Pipeline(SupportsPipeline):
             # raise original exception
             raise
         else:
-            self._props_to_state(state)
+            self._commit_state(state, extract_state)
 
-            backup_state = self._get_state()
-            # do not compare local states
-            local_state = state.pop("_local")
-            backup_state.pop("_local")
-
-            # check if any state element was changed
-            merged_state = merge_state_if_changed(backup_state, state)
-            # extract state only when there's change in the state or state was not yet extracted AND we actually want to do it
-            if (merged_state or "_last_extracted_at" not in local_state) and extract_state:
-                # print(f'EXTRACT STATE merged: {bool(merged_state)} extracted timestamp in {"_last_extracted_at" not in local_state}')
-                merged_state = self._extract_state(merged_state or state)
-                local_state["_last_extracted_at"] = pendulum.now()
-
-            # if state is modified and is not being extracted, mark it to be extracted next time
-            if not extract_state and merged_state:
-                local_state.pop("_last_extracted_at", None)
-
-            # always save state locally as local_state is not compared
-            merged_state = merged_state or state
-            merged_state["_local"] = local_state
-            self._save_state(merged_state)
+    def _commit_state(self, state: TPipelineState, extract_state: bool) -> TPipelineState:
+        """Saves the `state` if changed and optionally extracts it into the load package. Returns the saved state"""
+        self._props_to_state(state)
+
+        backup_state = self._get_state()
+        # do not compare local states
+        local_state = state.pop("_local")
+        backup_state.pop("_local")
+
+        # check if any state element was changed
+        merged_state = merge_state_if_changed(backup_state, state)
+        # extract state only when there's change in the state or state was not yet extracted AND we actually want to do it
+        if (merged_state or "_last_extracted_at" not in local_state) and extract_state:
+            # print(f'EXTRACT STATE merged: {bool(merged_state)} extracted timestamp in {"_last_extracted_at" not in local_state}')
+            merged_state = self._extract_state(merged_state or state)
+            local_state["_last_extracted_at"] = pendulum.now()
+
+        # if state is modified and is not being extracted, mark it to be extracted next time
+        if not extract_state and merged_state:
+            local_state.pop("_last_extracted_at", None)
+
+        # always save state locally as local_state is not compared
+        merged_state = merged_state or state
+        merged_state["_local"] = local_state
+        self._save_state(merged_state)
+        return merged_state
+
+    def _checkpoint_state(self) -> None:
+        """Commits a copy of the active state so it is loaded together with the files extracted so far"""
+        state = self._container[StateInjectableContext].state
+        saved_state = self._commit_state(deepcopy(state), self.config.restore_from_destination)
+        # continue with the saved version so the same state is not extracted again
+        state["_state_version"] = saved_state["_state_version"]
+        state["_local"].update(saved_state["_local"])
 
     def _state_to_props(self, state: TPipelineState) -> None:
         """Write `state` to pipeline props."""
@@ -0,0 +1,144 @@
+"""Paginators that request the next pages of an http endpoint while the current page is being processed"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterator, Optional, Union
+
+from requests import Response
+
+from dlt.common.typing import DictStrAny
+from dlt.sources.helpers.requests import Client, client as default_client
+
+
+TDataSelector = Callable[[Response], Any]
+"""Selects the data items from the page response"""
+TNextPage = Callable[[Response], Optional[Union[str, DictStrAny]]]
+"""Returns the url of the next page, the query params of the next page (ie. cursor) or None if there are no more pages"""
+
+
+def json_data(response: Response) -> Any:
+    return response.json()
+
+
+def next_link_header(response: Response) -> Optional[str]:
+    """Returns the `next` url from the `Link` header"""
+    return response.links.get("next", {}).get("url")
+
+
+def paginate(
+    url: str,
+    page_params: Callable[[int], DictStrAny],
+    *,
+    prefetch: int = 4,
+    page_size: int = None,
+    max_pages: int = None,
+    data_selector: TDataSelector = json_data,
+    method: str = "GET",
+    client: Client = None,
+    **request_kwargs: Any
+) -> Iterator[Any]:
+    """Requests the pages of `url` and yields the data of each page in order of the pages.
+
+    ### Summary
+    The query params of a page are created by `page_params` from the page index, starting at 0. Up to `prefetch` pages are requested concurrently
+    with the `client` (by default the `dlt.sources.helpers.requests` client) in a thread pool, so the network latency overlaps with processing of the
+    yielded pages. Pagination stops on the first page without data, on a page with less than `page_size` items or after `max_pages`. The pages that
+    were prefetched past the last page are discarded.
+
+    >>> @dlt.resource
+    >>> def issues():
+    >>>     yield from paginate_offset("https://api.example.com/issues", limit=100, data_selector=lambda r: r.json()["items"])
+
+    ### Args:
+        url: Url of the paginated endpoint
+        page_params: Creates the query params of a page from the page index
+        prefetch: Number of pages requested concurrently
+        page_size: Stop when a page contains less items than that
+        max_pages: Maximum number of pages to request
+        data_selector: Selects the data from the response. By default the json body is used
+        method: Http method
+        client: Client used to send the requests
+        request_kwargs: Extra arguments passed to `client.request`, ie. `headers`. `params` are merged with the page params
+    """
+    client = client or default_client
+    base_params = request_kwargs.pop("params", None) or {}
+
+    def _fetch(page_index: int) -> Response:
+        return client.request(method, url, params={**base_params, **page_params(page_index)}, **request_kwargs)
+
+    pending: Deque["Future[Response]"] = deque()
+    pool = ThreadPoolExecutor(max_workers=max(prefetch, 1), thread_name_prefix="dlt_paginator")
+    next_page = 0
+    try:
+        while True:
+            while len(pending) < max(prefetch, 1) and (max_pages is None or next_page < max_pages):
+                pending.append(pool.submit(_fetch, next_page))
+                next_page += 1
+            if not pending:
+                return
+            data = data_selector(pending.popleft().result())
+            if not data:
+                return
+            yield data
+            if page_size and len(data) < page_size:
+                return
+    finally:
+        # do not wait for the pages past the last one, requests in flight finish in the background
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def paginate_offset(url: str, *, limit: int = 100, offset_param: str = "offset", limit_param: str = "limit", **kwargs: Any) -> Iterator[Any]:
+    """Paginates `url` with `offset` and `limit` query params. See `paginate` for the other arguments"""
+    return paginate(url, lambda page_index: {offset_param: page_index * limit, limit_param: limit}, page_size=limit, **kwargs)
+
+
+def paginate_page_number(url: str, *, page_param: str = "page", first_page: int = 1, **kwargs: Any) -> Iterator[Any]:
+    """Paginates `url` with page number query param. See `paginate` for the other arguments"""
+    return paginate(url, lambda page_index: {page_param: first_page + page_index}, **kwargs)
+
+
+def paginate_links(
+    url: str,
+    *,
+    next_page: TNextPage = next_link_header,
+    data_selector: TDataSelector = json_data,
+    method: str = "GET",
+    client: Client = None,
+    **request_kwargs: Any
+) -> Iterator[Any]:
+    """Follows the next page links or cursors starting from `url` and yields the data of each page.
+
+    ### Summary
+    `next_page` takes the response and returns the url of the next page or the query params of the next page (ie. with a cursor) which are merged
+    with the `params` passed in `request_kwargs`. By default the `next` link from the `Link` header is followed. The next page is requested in a background
+    thread as soon as its link is known, so it is being fetched while the current page is processed.
+
+    >>> yield from paginate_links(url, next_page=lambda r: {"cursor": r.json()["next_cursor"]} if r.json()["has_more"] else None)
+    """
+    client = client or default_client
+    base_params = request_kwargs.pop("params", None) or {}
+
+    def _fetch(page_url: str, params: DictStrAny) -> Response:
+        return client.request(method, page_url, params=params, **request_kwargs)
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dlt_paginator")
+    future: "Future[Response]" = pool.submit(_fetch, url, base_params)
+    try:
+        while future is not None:
+            response = future.result()
+            next_url_or_params = next_page(response)
+            # prefetch the next page
+            if isinstance(next_url_or_params, str):
+                future = pool.submit(_fetch, next_url_or_params, None)
+            elif next_url_or_params:
+                future = pool.submit(_fetch, url, {**base_params, **next_url_or_params})
+            else:
+                future = None
+            data = data_selector(response)
+            if data:
+                yield data
+    finally:
+        if future is not None:
+            future.cancel()
+        pool.shutdown(wait=False)
@@ -0,0 +1,233 @@
+import asyncio
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+
+from tenacity import AsyncRetrying, RetryCallState, retry_any, retry_base, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from dlt.common.configuration import with_config
+from dlt.common.configuration.specs import RunConfiguration
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.time import to_seconds
+from dlt.common.typing import TimedeltaSeconds
+
+from dlt.sources.helpers.requests.retry import DEFAULT_RETRY_STATUS, retry_if_status, wait_exponential_retry_after
+from dlt.sources.helpers.requests.session import DEFAULT_TIMEOUT
+
+try:
+    from aiohttp import ClientConnectionError, ClientPayloadError, ClientResponse, ClientSession, ClientTimeout, TCPConnector
+except ModuleNotFoundError:
+    raise MissingDependencyException("DLT Async Requests Client", ["aiohttp"], "AsyncClient sends the requests with aiohttp.")
+
+
+DEFAULT_ASYNC_RETRY_EXCEPTIONS = (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError)
+
+AsyncRetryPredicate = Callable[[Optional[ClientResponse], Optional[BaseException]], bool]
+
+
+def _get_async_retry_response(retry_state: RetryCallState) -> Optional[ClientResponse]:
+    if retry_state.outcome.failed:
+        return None
+    result = retry_state.outcome.result()
+    return result if isinstance(result, ClientResponse) else None
+
+
+class async_retry_if_status(retry_if_status):
+    """Retry for given `aiohttp` response status codes"""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        response = _get_async_retry_response(retry_state)
+        if response is None:
+            return False
+        return response.status in self.status_codes
+
+
+class async_retry_if_predicate(retry_base):
+    def __init__(self, predicate: AsyncRetryPredicate) -> None:
+        self.predicate = predicate
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        response = _get_async_retry_response(retry_state)
+        exception = retry_state.outcome.exception()
+        return self.predicate(response, exception)
+
+
+class async_wait_exponential_retry_after(wait_exponential_retry_after):
+    def _get_retry_after(self, retry_state: RetryCallState) -> Optional[float]:
+        response = _get_async_retry_response(retry_state)
+        if response is None:
+            return None
+        header = response.headers.get("Retry-After")
+        if not header:
+            return None
+        return self._parse_retry_after(header)
+
+
+def _make_async_retry(
+    status_codes: Sequence[int],
+    exceptions: Sequence[Type[Exception]],
+    max_attempts: int,
+    condition: Union[AsyncRetryPredicate, Sequence[AsyncRetryPredicate], None],
+    backoff_factor: float,
+    respect_retry_after_header: bool,
+    max_delay: TimedeltaSeconds,
+) -> AsyncRetrying:
+    retry_conds = [async_retry_if_status(status_codes), retry_if_exception_type(tuple(exceptions))]
+    if condition is not None:
+        conditions = [condition] if callable(condition) else condition
+        retry_conds.extend([async_retry_if_predicate(c) for c in conditions])
+
+    wait_cls = async_wait_exponential_retry_after if respect_retry_after_header else wait_exponential
+    return AsyncRetrying(
+        wait=wait_cls(multiplier=backoff_factor, max=max_delay),
+        retry=(retry_any(*retry_conds)),
+        stop=stop_after_attempt(max_attempts),
+        reraise=True,
+        retry_error_callback=lambda state: state.outcome.result(),
+    )
+
+
+def _make_client_timeout(timeout: Optional[Union[TimedeltaSeconds, Tuple[TimedeltaSeconds, TimedeltaSeconds]]]) -> ClientTimeout:
+    if timeout is None:
+        return ClientTimeout(total=None)
+    if isinstance(timeout, tuple):
+        # same meaning as (connect, read) timeout in requests
+        return ClientTimeout(total=None, sock_connect=to_seconds(timeout[0]), sock_read=to_seconds(timeout[1]))
+    return ClientTimeout(total=to_seconds(timeout))
+
+
+class AsyncClient:
+    """Asyncio counterpart of `Client` that sends the requests with `aiohttp` and retries them with the same rules.
+
+    ### Summary
+    Use it in async resources and transformers which are evaluated on the event loop of the pipe iterator. A separate `aiohttp.ClientSession` is
+    created for each event loop. The session pools the connections and opens at most `max_connections` of them to a single host, so up to that many
+    requests to a host are sent concurrently and the others wait for a free connection. The session is closed when the event loop shuts down its
+    async generators, ie. when the pipe iterator closes or at the end of `asyncio.run`, or when `close` is awaited.
+
+    >>> client = AsyncClient(max_connections=20)
+    >>>
+    >>> @dlt.transformer(data_from=players)
+    >>> async def player_profile(player):
+    >>>     response = await client.get(f"{chess_url}player/{player}")
+    >>>     yield await response.json()
+
+    The body of the response is read before the connection is returned to the pool, so `text()`, `json()` and `read()` may be awaited after the request.
+    The retry is triggered on the same conditions as in `Client`. Custom predicates receive `aiohttp.ClientResponse` instead of `requests.Response`.
+
+    ### Args:
+        request_timeout: Total timeout for requests in seconds or a tuple with (connect, read) timeouts. May be passed as `timedelta` or `float/int` number of seconds.
+        max_connections: Max connections per host in the connection pool. Limits the number of concurrent requests to a single host
+        max_connections_total: Max connections in the connection pool. 0 means no limit
+        raise_for_status: Whether to raise `aiohttp.ClientResponseError` on error status codes when retries are exhausted
+        status_codes: Retry when response has any of these status codes. Default `429` and all `5xx` codes. Pass an empty list to disable retry based on status.
+        exceptions: Retry on exception of given type(s). Default `(aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)`. Pass an empty list to disable retry on exceptions.
+        request_max_attempts: Max number of retry attempts before giving up
+        retry_condition: A predicate or a list of predicates to decide whether to retry. If any predicate returns `True` the request is retried
+        request_backoff_factor: Multiplier used for exponential delay between retries
+        request_max_retry_delay: Maximum delay when using exponential backoff
+        respect_retry_after_header: Whether to use the `Retry-After` response header (when available) to determine the retry delay
+        session_attrs: Extra keyword arguments passed to `aiohttp.ClientSession`, e.g. `{headers: {'Authorization': 'api-key'}}`
+    """
+
+    @with_config(spec=RunConfiguration)
+    def __init__(
+        self,
+        request_timeout: Optional[Union[TimedeltaSeconds, Tuple[TimedeltaSeconds, TimedeltaSeconds]]] = DEFAULT_TIMEOUT,
+        max_connections: int = 50,
+        max_connections_total: int = 0,
+        raise_for_status: bool = True,
+        status_codes: Sequence[int] = DEFAULT_RETRY_STATUS,
+        exceptions: Sequence[Type[Exception]] = DEFAULT_ASYNC_RETRY_EXCEPTIONS,
+        request_max_attempts: int = RunConfiguration.request_max_attempts,
+        retry_condition: Union[AsyncRetryPredicate, Sequence[AsyncRetryPredicate], None] = None,
+        request_backoff_factor: float = RunConfiguration.request_backoff_factor,
+        request_max_retry_delay: TimedeltaSeconds = RunConfiguration.request_max_retry_delay,
+        respect_retry_after_header: bool = True,
+        session_attrs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_connections_total = max_connections_total
+        self.raise_for_status = raise_for_status
+        self._timeout = request_timeout
+        self._retry_kwargs: Dict[str, Any] = dict(
+            status_codes=status_codes,
+            exceptions=exceptions,
+            max_attempts=request_max_attempts,
+            condition=retry_condition,
+            backoff_factor=request_backoff_factor,
+            respect_retry_after_header=respect_retry_after_header,
+            max_delay=request_max_retry_delay
+        )
+        self._session_attrs = session_attrs or {}
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[ClientSession, AsyncGenerator[None, None]]] = {}
+        """Session of each event loop with an async generator that closes it"""
+
+    async def get_session(self) -> ClientSession:
+        """Returns the session of the running event loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is None or entry[0].closed:
+            # drop sessions of the event loops that were closed without shutting down the async generators
+            for closed_loop in [session_loop for session_loop in self._sessions if session_loop.is_closed()]:
+                del self._sessions[closed_loop]
+            connector = TCPConnector(limit=self.max_connections_total, limit_per_host=self.max_connections)
+            session = ClientSession(connector=connector, **self._session_attrs)
+            closer = self._close_on_shutdown(loop, session)
+            entry = self._sessions[loop] = (session, closer)
+            # start the generator so the event loop closes it on shutdown
+            await closer.__anext__()
+        return entry[0]
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> ClientResponse:
+        kwargs.setdefault("timeout", _make_client_timeout(self._timeout))
+        response: ClientResponse = await _make_async_retry(**self._retry_kwargs)(self._send, method, url, **kwargs)
+        if self.raise_for_status:
+            response.raise_for_status()
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("HEAD", url, **kwargs)
+
+    async def options(self, url: str, **kwargs: Any) -> ClientResponse:
+        return await self.request("OPTIONS", url, **kwargs)
+
+    async def close(self) -> None:
+        """Closes the session of the running event loop"""
+        entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, session: ClientSession) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            if self._sessions.get(loop, (None, None))[0] is session:
+                del self._sessions[loop]
+            await session.close()
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> ClientResponse:
+        session = await self.get_session()
+        async with session.request(method, url, **kwargs) as response:
+            # read the body so the connection goes back to the pool
+            await response.read()
+            return response
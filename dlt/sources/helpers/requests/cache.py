@@ -0,0 +1,202 @@
+import os
+import hashlib
+import contextlib
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from requests import PreparedRequest, Request, Response, Session
+from requests.structures import CaseInsensitiveDict
+
+from dlt.common import json, pendulum
+from dlt.common.configuration.container import Container
+from dlt.common.pipeline import PipelineContext
+from dlt.common.time import to_seconds
+from dlt.common.typing import DictStrAny, TimedeltaSeconds
+from dlt.common.utils import uniq_id
+
+
+CACHE_FOLDER = "http_cache"
+CACHED_STATUS_CODES = (200,)
+# headers that describe the raw response stream which is not kept in the cache
+SKIPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+# request headers that select the credentials or the representation of the response
+KEY_HEADERS = ("Authorization", "Proxy-Authorization", "Cookie", "Accept", "Accept-Language")
+
+
+class RequestsCache:
+    """On-disk cache of http responses used by `Session` to skip or revalidate repeated requests.
+
+    ### Summary
+    Responses with status code 200 are stored in `cache_dir`, keyed by the method, url (including the query params), body and `key_headers` of the request.
+    The auth and cookie headers are part of the key so requests sent with different credentials do not share the cached responses.
+    By default the cache is kept in `http_cache` folder in the working dir of the active pipeline and is bypassed when no pipeline is active.
+
+    A cached response younger than `ttl` seconds is returned without sending the request. An older response is revalidated: the request is sent with
+    `If-None-Match` and `If-Modified-Since` headers taken from the `ETag` and `Last-Modified` of the cached response and on `304 Not Modified` the cached
+    response is returned. `ttl` of 0 revalidates every request and `None` never expires the cached responses.
+
+    ### Args:
+        cache_dir: Folder where responses are stored. Defaults to `http_cache` in the working dir of the active pipeline
+        ttl: Seconds for which a cached response is returned without revalidation. May be passed as `timedelta`
+        max_bytes: When total size of the cached responses exceeds this number, the least recently used responses are evicted
+        methods: Http methods of the requests that are cached
+        key_headers: Request headers that are part of the cache key. Add the headers that carry credentials or change the response, e.g. custom api key headers
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = None,
+        ttl: Optional[TimedeltaSeconds] = 0,
+        max_bytes: Optional[int] = None,
+        methods: Sequence[str] = ("GET", "HEAD"),
+        key_headers: Sequence[str] = KEY_HEADERS
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = to_seconds(ttl) if ttl is not None else None
+        self.max_bytes = max_bytes
+        self.methods = {m.upper() for m in methods}
+        self.key_headers = key_headers
+
+    def get_cache_dir(self) -> Optional[str]:
+        """Returns the explicit cache dir or the cache dir in the working dir of the active pipeline. None if cache is not available"""
+        if self.cache_dir:
+            return self.cache_dir
+        context = Container()[PipelineContext]
+        if not context.is_active():
+            return None
+        return os.path.join(context.pipeline().working_dir, CACHE_FOLDER)
+
+    def request_key(self, request: PreparedRequest) -> Optional[str]:
+        """Creates a cache key from the method, url, key headers and body of the `request`. Returns None if the body is a stream that cannot be hashed"""
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if body is not None and not isinstance(body, bytes):
+            return None
+        digest = hashlib.sha256(f"{request.method}\n{request.url}\n".encode("utf-8"))
+        for header in self.key_headers:
+            value = request.headers.get(header)
+            if value is not None:
+                digest.update(f"{header.lower()}: {value}\n".encode("utf-8"))
+        if body:
+            digest.update(body)
+        return digest.hexdigest()
+
+    def request(self, session: Session, send_request: Callable[..., Response], method: str, url: str, **kwargs: Any) -> Response:
+        """Sends the request with `send_request` unless a fresh response is cached. Revalidates stale responses and caches the new ones.
+        `kwargs` are the same as in `requests.Session.request`"""
+        method = method.upper()
+        cache_dir = self.get_cache_dir() if method in self.methods else None
+        request: PreparedRequest = None
+        if cache_dir:
+            request = session.prepare_request(Request(
+                method=method,
+                url=url,
+                headers=kwargs.get("headers"),
+                files=kwargs.get("files"),
+                data=kwargs.get("data") or {},
+                json=kwargs.get("json"),
+                params=kwargs.get("params") or {},
+                auth=kwargs.get("auth"),
+                cookies=kwargs.get("cookies"),
+            ))
+        key = self.request_key(request) if request else None
+        if key is None:
+            return send_request(method, url, **kwargs)
+
+        entry_path = os.path.join(cache_dir, key)
+        entry = self._read_entry(entry_path)
+        if entry is not None:
+            meta, body = entry
+            if self.ttl is None or pendulum.now().timestamp() - meta["stored_at"] < self.ttl:
+                self._touch_entry(entry_path)
+                return self._to_response(meta, body, request)
+            # revalidate the cached response
+            cached_headers = CaseInsensitiveDict(meta["headers"])
+            headers = dict(kwargs.get("headers") or {})
+            if cached_headers.get("ETag"):
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if cached_headers.get("Last-Modified"):
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+            kwargs["headers"] = headers
+
+        response = send_request(method, url, **kwargs)
+        if entry is not None and response.status_code == 304:
+            meta, body = entry
+            # keep the validators sent with 304 and start the ttl again
+            cached_headers = CaseInsensitiveDict(meta["headers"])
+            for header in ("ETag", "Last-Modified"):
+                if header in response.headers:
+                    cached_headers[header] = response.headers[header]
+            meta["headers"] = dict(cached_headers)
+            self._write_entry(cache_dir, entry_path, meta, body)
+            return self._to_response(meta, body, request)
+        if response.status_code in CACHED_STATUS_CODES and "no-store" not in response.headers.get("Cache-Control", ""):
+            meta = {
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "url": response.url,
+                "encoding": response.encoding,
+                "headers": {k: v for k, v in response.headers.items() if k.lower() not in SKIPPED_HEADERS},
+            }
+            self._write_entry(cache_dir, entry_path, meta, response.content)
+        return response
+
+    def clear(self) -> None:
+        """Removes all the cached responses"""
+        cache_dir = self.get_cache_dir()
+        if cache_dir and os.path.isdir(cache_dir):
+            for entry in os.scandir(cache_dir):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(entry.path)
+
+    @staticmethod
+    def _to_response(meta: DictStrAny, body: bytes, request: PreparedRequest) -> Response:
+        response = Response()
+        response.status_code = meta["status_code"]
+        response.reason = meta["reason"]
+        response.url = meta["url"]
+        response.encoding = meta["encoding"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = body
+        response.request = request
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+    @staticmethod
+    def _read_entry(entry_path: str) -> Optional[Tuple[DictStrAny, bytes]]:
+        try:
+            with open(entry_path, "rb") as f:
+                # first line holds the metadata, the rest is the body
+                meta = json.loads(f.readline().decode("utf-8"))
+                return meta, f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _touch_entry(entry_path: str) -> None:
+        # modification time is used to evict least recently used entries
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry_path)
+
+    def _write_entry(self, cache_dir: str, entry_path: str, meta: DictStrAny, body: bytes) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        meta["stored_at"] = pendulum.now().timestamp()
+        # write to temp file and rename so concurrent readers never see partial entries
+        temp_path = f"{entry_path}.{uniq_id(8)}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(json.dumpb(meta))
+            f.write(b"\n")
+            f.write(body)
+        os.replace(temp_path, entry_path)
+        if self.max_bytes:
+            self._evict(cache_dir)
+
+    def _evict(self, cache_dir: str) -> None:
+        entries = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in os.scandir(cache_dir) if not e.name.endswith(".tmp")]
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total_bytes -= size
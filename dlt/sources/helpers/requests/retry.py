@@ -11,6 +11,7 @@ from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, Retr
 from tenacity.retry import retry_base
 
 from dlt.sources.helpers.requests.session import Session, DEFAULT_TIMEOUT
+from dlt.sources.helpers.requests.cache import RequestsCache
 from dlt.sources.helpers.requests.typing import TRequestTimeout
 from dlt.common.typing import TimedeltaSeconds
 from dlt.common.configuration.specs import RunConfiguration
@@ -147,6 +148,9 @@ class Client:
         request_max_retry_delay: Maximum delay when using exponential backoff
         respect_retry_after_header: Whether to use the `Retry-After` response header (when available) to determine the retry delay
         session_attrs: Extra attributes that will be set on the session instance, e.g. `{headers: {'Authorization': 'api-key'}}` (see `requests.sessions.Session` for possible attributes)
+        request_cache: Whether to cache the responses on disk, in the working dir of the active pipeline. See `RequestsCache`
+        request_cache_ttl: Seconds for which a cached response is used without revalidation. 0 revalidates every request, None never expires the responses
+        request_cache_max_bytes: Evicts the least recently used responses when the cache exceeds this size
     """
     _session_attrs: Dict[str, Any]
 
@@ -164,10 +168,14 @@ class Client:
         request_max_retry_delay: TimedeltaSeconds = RunConfiguration.request_max_retry_delay,
         respect_retry_after_header: bool = True,
         session_attrs: Optional[Dict[str, Any]] = None,
+        request_cache: bool = RunConfiguration.request_cache,
+        request_cache_ttl: Optional[TimedeltaSeconds] = RunConfiguration.request_cache_ttl,
+        request_cache_max_bytes: Optional[int] = RunConfiguration.request_cache_max_bytes,
     ) -> None:
         self._adapter = HTTPAdapter(pool_maxsize=max_connections)
         self._local = local()
-        self._session_kwargs = dict(timeout=request_timeout, raise_for_status=raise_for_status)
+        cache = RequestsCache(ttl=request_cache_ttl, max_bytes=request_cache_max_bytes) if request_cache else None
+        self._session_kwargs = dict(timeout=request_timeout, raise_for_status=raise_for_status, cache=cache)
         self._retry_kwargs: Dict[str, Any] = dict(
             status_codes=status_codes,
             exceptions=exceptions,
@@ -206,6 +214,7 @@ class Client:
         self._retry_kwargs['backoff_factor'] = config.request_backoff_factor
         self._retry_kwargs['max_delay'] = config.request_max_retry_delay
         self._retry_kwargs['max_attempts'] = config.request_max_attempts
+        self._session_kwargs['cache'] = RequestsCache(ttl=config.request_cache_ttl, max_bytes=config.request_cache_max_bytes) if config.request_cache else None
         self._config_version += 1
 
     def _make_session(self) -> Session:
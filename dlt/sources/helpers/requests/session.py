@@ -3,6 +3,7 @@ from tenacity import Retrying, retry_if_exception_type
 from typing import Optional, TYPE_CHECKING, Sequence, Union, Tuple, Type, TypeVar
 
 from dlt.sources.helpers.requests.typing import TRequestTimeout
+from dlt.sources.helpers.requests.cache import RequestsCache
 from dlt.common.typing import TimedeltaSeconds
 from dlt.common.time import to_seconds
 
@@ -24,22 +25,28 @@ class Session(BaseSession):
         timeout: Timeout for requests in seconds. May be passed as `timedelta` or `float/int` number of seconds.
             May be a single value or a tuple for separate (connect, read) timeout.
         raise_for_status: Whether to raise exception on error status codes (using `response.raise_for_status()`)
+        cache: Optional `RequestsCache` that returns or revalidates the cached responses
     """
     def __init__(
         self,
         timeout: Optional[Union[TimedeltaSeconds, Tuple[TimedeltaSeconds, TimedeltaSeconds]]] = DEFAULT_TIMEOUT,
         raise_for_status: bool = True,
+        cache: Optional[RequestsCache] = None,
     ) -> None:
         super().__init__()
         self.timeout = _timeout_to_seconds(timeout)
         self.raise_for_status = raise_for_status
+        self.cache = cache
 
     if TYPE_CHECKING:
         request = BaseSession.request
 
     def request(self, *args, **kwargs):  # type: ignore[no-untyped-def,no-redef]
         kwargs.setdefault('timeout', self.timeout)
-        resp = super().request(*args, **kwargs)
+        if self.cache is not None:
+            resp = self.cache.request(self, super().request, *args, **kwargs)
+        else:
+            resp = super().request(*args, **kwargs)
         if self.raise_for_status:
             resp.raise_for_status()
         return resp
@@ -448,6 +448,9 @@ def test_configuration_is_mutable_mapping(environment: Any, env_provider: Config
         'request_max_attempts': 5,
         'request_backoff_factor': 1,
         'request_max_retry_delay': 300,
+        'request_cache': False,
+        'request_cache_ttl': 0,
+        'request_cache_max_bytes': None,
         'config_files_storage_path': 'storage',
         "secret_value": None
     }
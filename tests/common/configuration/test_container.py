@@ -1,4 +1,6 @@
 import pytest
+import threading
+from multiprocessing.pool import ThreadPool
 from typing import Any, ClassVar, Literal, Optional
 
 from dlt.common.configuration import configspec
@@ -129,6 +131,41 @@ def test_container_injectable_context_mangled(container: Container) -> None:
     assert py_ex.value.expected_config == context
 
 
+def test_container_thread_isolated_contexts(container: Container) -> None:
+    container[InjectableTestContext] = InjectableTestContext(current_value="main")
+    injected_in_main = threading.Event()
+    seen_in_thread = threading.Event()
+    seen = []
+
+    def _isolated(contexts: Any) -> None:
+        with container.thread_isolated_contexts(contexts):
+            injected_in_main.wait()
+            # the value injected in the main thread is not visible
+            seen.append(container[InjectableTestContext].current_value)
+            with container.injectable_context(InjectableTestContext(current_value="isolated")):
+                # threads of the pool share the isolated contexts
+                pool = ThreadPool(2, initializer=container.thread_pool_initializer())
+                seen.extend(pool.map(lambda _: container[InjectableTestContext].current_value, range(2)))
+                pool.close()
+                pool.join()
+                seen_in_thread.set()
+                seen.append(container[InjectableTestContext].current_value)
+
+    # no initializer outside of the isolated thread
+    assert container.thread_pool_initializer() is None
+    thread = threading.Thread(target=_isolated, args=(container.snapshot_contexts(), ))
+    thread.start()
+    with container.injectable_context(InjectableTestContext(current_value="extract")):
+        injected_in_main.set()
+        seen_in_thread.wait()
+        # the value injected in the isolated thread is not visible
+        assert container[InjectableTestContext].current_value == "extract"
+    thread.join()
+    assert seen == ["main", "isolated", "isolated", "isolated"]
+    assert container[InjectableTestContext].current_value == "main"
+    assert len(container.thread_contexts) == 0
+
+
 def test_container_provider(container: Container) -> None:
     provider = ContextProvider()
     # default value will be created
@@ -139,3 +139,34 @@ def test_pool_runner_process_methods(method) -> None:
     )
     assert runs_count == 1
     assert [v[0] for v in r.rv] == list(range(4))
+
+
+def test_persistent_pool() -> None:
+    pools = []
+
+    def _get_pool(pool: multiprocessing.pool.Pool) -> runner.TRunMetrics:
+        pools.append(pool)
+        return runner.TRunMetrics(True, 0)
+
+    config = configure(ThreadPoolConfiguration)
+    config.persistent_pool = True
+    config.workers = 2
+    try:
+        runner.run_pool(config, _get_pool)
+        runner.run_pool(config, _get_pool)
+        # pool is reused and not terminated
+        assert pools[0] is pools[1]
+        assert pools[0].apply(idle_run, (None, )) == runner.TRunMetrics(True, 0)
+        # other number of workers gets other pool
+        config.workers = 3
+        runner.run_pool(config, _get_pool)
+        assert pools[2] is not pools[0]
+        # failed run terminates the pool
+        with pytest.raises(DltException):
+            runner.run_pool(config, failing_run)
+        runner.run_pool(config, _get_pool)
+        assert pools[3] is not pools[2]
+    finally:
+        runner.close_persistent_pools()
+    with pytest.raises(ValueError):
+        pools[0].apply(idle_run, (None, ))
@@ -172,3 +172,15 @@ def test_writer_optional_schema(disable_compression: bool) -> None:
             writer.write_data_item([{"col1": 1}], None)
             writer.write_data_item([{"col1": 1}], None)
 
+
+
+def test_buffer_max_bytes() -> None:
+    file_template = os.path.join(TEST_STORAGE_ROOT, "jsonl.%s")
+    with BufferedDataWriter("jsonl", file_template, buffer_max_items=1000, buffer_max_bytes=10000) as writer:
+        writer.write_data_item({"col1": "x" * 3000}, None)
+        assert len(writer._buffered_items) == 1
+        # buffer is flushed on exceeding the estimated size
+        writer.write_data_item([{"col1": "x" * 3000}] * 3, None)
+        assert len(writer._buffered_items) == 0
+        writer.write_data_item({"col1": 1}, None)
+        assert len(writer._buffered_items) == 1
@@ -1,4 +1,5 @@
 import os
+import binascii
 import pytest
 import pyarrow.parquet as pq
 from dlt.common.arithmetics import Decimal
@@ -165,4 +166,42 @@ def test_parquet_writer_config() -> None:
 
             # flavor can't be testet
             assert writer._writer.parquet_version == "2.0"
-            assert writer._writer.parquet_data_page_size == 1024 * 512
\ No newline at end of file
+            assert writer._writer.parquet_data_page_size == 1024 * 512
+
+def test_arrow_writer() -> None:
+    import pyarrow as pa
+    from dlt.common.libs.pyarrow import py_arrow_to_table_schema_columns
+
+    table = pa.table({"col1": [1, 2], "col2": ["a", None], "col3": [[1], [2, 3]]})
+    columns = py_arrow_to_table_schema_columns(table.schema)
+    assert {n: c["data_type"] for n, c in columns.items()} == {"col1": "bigint", "col2": "text", "col3": "complex"}
+
+    with get_writer("arrow", file_max_items=None) as writer:
+        writer.write_data_item(table, None)
+        writer.write_data_item([table.to_batches()[0], table], None)
+
+    assert len(writer.closed_files) == 1
+    assert writer.closed_files[0].endswith(".parquet")
+    with open(writer.closed_files[0], "rb") as f:
+        written = pq.read_table(f)
+        assert written.num_rows == 6
+        assert written.column("col2").to_pylist() == ["a", None] * 3
+
+    # a new arrow schema starts a new file
+    with get_writer("arrow", file_max_items=None) as writer:
+        writer.write_data_item(table, None)
+        writer.write_data_item(table.append_column("col4", pa.array([1.0, 2.0])), None)
+    assert len(writer.closed_files) == 2
+
+
+def test_uniq_ids_base64_array() -> None:
+    from dlt.common.libs.pyarrow import uniq_ids_base64_array
+    from dlt.common.utils import uniq_id_base64
+
+    assert len(uniq_ids_base64_array(0)) == 0
+    for len_ in (10, 12, 16):
+        ids = uniq_ids_base64_array(1000, len_).to_pylist()
+        assert len(set(ids)) == 1000
+        # same format as single ids
+        assert {len(id_) for id_ in ids} == {len(uniq_id_base64(len_))}
+        assert all(binascii.a2b_base64(id_ + "==") for id_ in ids)
@@ -5,7 +5,7 @@ import pytest
 
 from dlt.common.runners import Venv
 from dlt.common.utils import (graph_find_scc_nodes, flatten_list_of_str_or_dicts, digest128, graph_edges_to_nodes, map_nested_in_place,
-                              reveal_pseudo_secret, obfuscate_pseudo_secret, get_module_name, concat_strings_with_limit)
+                              reveal_pseudo_secret, obfuscate_pseudo_secret, get_module_name, concat_strings_with_limit, estimate_size)
 
 
 def test_flatten_list_of_str_or_dicts() -> None:
@@ -125,3 +125,17 @@ def test_graph_edges_to_nodes() -> None:
     assert graph_edges_to_nodes([]) == {}
     # ignores double edge
     assert graph_edges_to_nodes([('A', 'B'), ('A', 'B')]) == {'A': {'B'}, 'B': set()}
+
+
+def test_estimate_size() -> None:
+    row = {"id": 1, "name": "x" * 1000, "nested": {"value": "y" * 1000}}
+    assert 2000 < estimate_size(row) < 3000
+    # lists are extrapolated from a sample
+    assert estimate_size([row] * 1000) == pytest.approx(1000 * estimate_size(row), rel=0.01)
+    assert estimate_size([]) > 0
+
+
+def test_estimate_size_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"id": list(range(1000))})
+    assert estimate_size(table) == table.nbytes
@@ -1,7 +1,10 @@
 import os
+import asyncio
+import threading
 import pytest
 
 import dlt
+from dlt.common import sleep
 from dlt.common.configuration import known_sections
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.inject import get_fun_spec
@@ -125,6 +128,122 @@ def test_transformer_no_parens() -> None:
     assert list(t("m")) == ["m", "mm", "mmm"]
 
 
+def test_async_generator_resource() -> None:
+
+    @dlt.resource
+    async def async_data(n: int = 3):
+        for i in range(n):
+            await asyncio.sleep(0.01)
+            yield i
+
+    assert list(async_data) == [0, 1, 2]
+    assert list(async_data(5)) == [0, 1, 2, 3, 4]
+
+    # async generator objects are accepted as data
+    r = dlt.resource(async_gen_data(2))
+    assert r.name == "async_gen_data"
+    assert list(r) == [0, 1]
+
+    @dlt.transformer(data_from=async_data)
+    async def async_tx(item):
+        for _ in range(item):
+            await asyncio.sleep(0.01)
+            yield item * 10
+
+    assert list(async_tx) == [10, 20, 20]
+
+
+def test_async_transformer_max_parallel_items() -> None:
+    running = 0
+    max_running = 0
+
+    @dlt.transformer(data_from=dlt.resource(range(20), name="numbers"), max_parallel_items=3)
+    async def slow_tx(item):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        yield item
+
+    assert slow_tx.max_parallel_items == 3
+    assert sorted(slow_tx) == list(range(20))
+    assert max_running == 3
+
+
+@pytest.mark.parametrize("parallelized", [True, "ordered"])
+def test_parallelized_transformer(parallelized) -> None:
+    threads = set()
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    @dlt.transformer(data_from=dlt.resource(range(20), name="numbers"), parallelized=parallelized)
+    def slow_tx(item):
+        nonlocal running, max_running
+        threads.add(threading.get_ident())
+        with lock:
+            running += 1
+            max_running = max(running, max_running)
+        # pipe name is available in the worker thread
+        dlt.current.resource_state().setdefault("items", []).append(item)
+        sleep(0.05 if item % 2 == 0 else 0.01)
+        with lock:
+            running -= 1
+        yield item * 2
+        yield item * 2 + 1
+
+    assert slow_tx.parallelized == ("ordered" if parallelized == "ordered" else "unordered")
+    with Container().injectable_context(StateInjectableContext(state={})):
+        items = list(slow_tx)
+    # items were evaluated concurrently in the thread pool
+    assert len(threads) > 1
+    assert max_running > 1
+    if parallelized == "ordered":
+        assert items == list(range(40))
+    else:
+        assert sorted(items) == list(range(40))
+
+
+def test_parallelized_resources() -> None:
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def slow_gen(n):
+        nonlocal running, max_running
+        for i in range(n):
+            with lock:
+                running += 1
+                max_running = max(running, max_running)
+            sleep(0.05)
+            with lock:
+                running -= 1
+            yield i
+
+    source = DltSource("parallel", "module", Schema("parallel"), [dlt.resource(slow_gen(5), name="a", parallelized=True), dlt.resource(slow_gen(5), name="b", parallelized=True)])
+    assert sorted(source) == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    # both resources were evaluated at the same time
+    assert max_running == 2
+
+
+def test_resource_priority() -> None:
+    os.environ["EXTRACT__NEXT_ITEM_MODE"] = "priority"
+
+    source = DltSource("priority", "module", Schema("priority"), [dlt.resource([1, 2], name="a"), dlt.resource([3, 4], name="b", priority=1, weight=2)])
+    assert source.resources["b"].priority == 1
+    assert source.resources["b"].weight == 2
+    assert list(source) == [3, 4, 1, 2]
+
+    with pytest.raises(ValueError):
+        source.resources["a"].weight = 0
+
+
+async def async_gen_data(n: int):
+    for i in range(n):
+        yield i
+
+
 def test_source_name_is_invalid_schema_name() -> None:
 
     # inferred from function name, names must be small caps etc.
@@ -1,3 +1,5 @@
+import os
+
 import dlt
 from dlt.common import json
 from dlt.common.storages import NormalizeStorageConfiguration
@@ -72,3 +74,28 @@ def test_extract_select_tables() -> None:
 
     schema = expect_tables(table_name_with_lambda)
     assert "table_name_with_lambda" not in schema.tables
+
+
+def test_commit_closed_files() -> None:
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "2"
+    os.environ["DATA_WRITER__BUFFER_MAX_ITEMS"] = "2"
+    clean_test_storage()
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    extract_id = storage.create_extract_id()
+    assert storage.commit_closed_files(extract_id) == []
+    for i in range(5):
+        storage.write_data_item(extract_id, "closed", "numbers", [i], None)
+    # two files were closed when the writer rotated
+    committed_files = storage.commit_closed_files(extract_id)
+    assert len(committed_files) == 2
+    assert set(storage.list_files_to_normalize_sorted()) == set(committed_files)
+    # files are committed only once
+    assert storage.commit_closed_files(extract_id) == []
+    storage.write_data_item(extract_id, "closed", "numbers", [5], None)
+    assert len(storage.commit_closed_files(extract_id)) == 1
+    # the file still being written is committed with the rest of the files
+    storage.write_data_item(extract_id, "closed", "numbers", [6], None)
+    storage.close_writers(extract_id)
+    assert len(storage.commit_extract_files(extract_id)) == 1
+    assert len(storage.list_files_to_normalize_sorted()) == 4
+    assert storage.commit_closed_files(extract_id) == []
@@ -1,6 +1,10 @@
 import os
+import gc
 import asyncio
+import warnings
 import inspect
+import threading
+from types import SimpleNamespace
 from typing import List, Sequence
 import time
 
@@ -11,7 +15,10 @@ from dlt.common import sleep
 from dlt.common.typing import TDataItems
 from dlt.extract.exceptions import CreatePipeException, ResourceExtractionError
 from dlt.extract.typing import DataItemWithMeta, FilterItem, MapItem, YieldMapItem
-from dlt.extract.pipe import ManagedPipeIterator, Pipe, PipeItem, PipeIterator
+from dlt.extract import pipe as pipe_module
+from dlt.extract.pipe import ManagedPipeIterator, Pipe, PipeItem, PipeIterator, TPipeNextItemMode
+
+from tests.utils import skipifnotbenchmark
 
 
 def test_next_item_mode() -> None:
@@ -49,6 +56,106 @@ def test_next_item_mode() -> None:
     assert [pi.item for pi in _l] == [1, 11, 20, 2, 12, 21, 55, 56, 77, 88, 89, 13, 3, 14, 4, 15]
 
 
+def test_weighted_and_priority_next_item_mode() -> None:
+
+    def nested_gen():
+        yield from [55, 56]
+
+    def source_gen1():
+        yield from [1, 2, nested_gen(), 3, 4]
+
+    def source_gen2():
+        yield from range(11, 16)
+
+    def source_gen3():
+        yield from range(20, 22)
+
+    def get_pipes():
+        pipes = [
+            Pipe.from_data("data1", source_gen1()),
+            Pipe.from_data("data2", source_gen2()),
+            Pipe.from_data("data3", source_gen3()),
+            ]
+        pipes[1].priority = 1
+        return pipes
+
+    # highest priority first, then round robin among the sources with the same priority
+    _l = list(PipeIterator.from_pipes(get_pipes(), next_item_mode="priority"))
+    assert [pi.item for pi in _l] == [11, 12, 13, 14, 15, 20, 1, 21, 2, 55, 56, 3, 4]
+
+    # all items are yielded in weighted mode, nested iterators appear inline
+    _l = list(PipeIterator.from_pipes(get_pipes(), next_item_mode="weighted"))
+    assert sorted(pi.item for pi in _l) == [1, 2, 3, 4, 11, 12, 13, 14, 15, 20, 21, 55, 56]
+    assert [pi.item for pi in _l if pi.item in (1, 2, 55, 56, 3)] == [1, 2, 55, 56, 3]
+
+
+def test_weighted_next_item_mode_wait_time(monkeypatch) -> None:
+    # wait time is measured with a fake clock advanced by the generators
+    clock = [0.0]
+    monkeypatch.setattr(pipe_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    def slow_gen():
+        for i in range(5):
+            clock[0] += 0.05
+            yield "slow"
+
+    def fast_gen():
+        for i in range(1000):
+            clock[0] += 0.00001
+            yield "fast"
+
+    # the fast generator is not blocked by the slow one
+    _l = list(PipeIterator.from_pipes([Pipe.from_data("slow", slow_gen()), Pipe.from_data("fast", fast_gen())], next_item_mode="weighted"))
+    assert [pi.item for pi in _l].index("fast") == 1
+    assert [pi.item for pi in _l[:1002]].count("fast") == 1000
+
+    # the slow generator gets most of the time with a high weight
+    slow_pipe = Pipe.from_data("slow", slow_gen())
+    slow_pipe.weight = 1000000
+    _l = list(PipeIterator.from_pipes([slow_pipe, Pipe.from_data("fast", fast_gen())], next_item_mode="weighted"))
+    assert [pi.item for pi in _l[:10]].count("slow") == 5
+
+
+@pytest.mark.parametrize("next_item_mode", ["round_robin", "weighted", "priority"])
+def test_saturated_pipe_does_not_block_sources(next_item_mode: TPipeNextItemMode) -> None:
+    released = threading.Event()
+
+    def pages():
+        for n in range(3):
+            yield lambda n=n: released.wait(5) and f"page_{n}"
+
+    def items():
+        yield from range(5)
+        # pages are released only when all the items were taken
+        released.set()
+
+    pages_pipe = Pipe.from_data("pages", pages())
+    pages_pipe.max_parallel_items = 1
+    # pages wait for a free slot while the other source is iterated
+    _l = list(PipeIterator.from_pipes([pages_pipe, Pipe.from_data("items", items())], next_item_mode=next_item_mode))
+    assert [pi.item for pi in _l] == [0, 1, 2, 3, 4, "page_0", "page_1", "page_2"]
+
+
+def test_max_parallel_bytes() -> None:
+    in_flight = []
+
+    def get_page(n):
+        sleep(0.01)
+        return b"x" * 1024 * 1024
+
+    def pages():
+        for n in range(60):
+            in_flight.append(len(_it._futures))
+            yield lambda: get_page(n)
+
+    _it = PipeIterator.from_pipes([Pipe.from_data("pages", pages())], max_parallel_items=20, max_parallel_bytes=int(2.5 * 1024 * 1024))
+    with _it:
+        assert len(list(_it)) == 60
+    # when the size of the pages is known, the source is paused until the pages in flight are consumed
+    assert max(in_flight[:20]) > 2
+    assert max(in_flight[30:]) <= 2
+
+
 def test_rotation_on_none() -> None:
 
     global started
@@ -100,6 +207,96 @@ def test_rotation_on_none() -> None:
 
 
 
+@pytest.mark.parametrize("next_item_mode", ["fifo", "round_robin"])
+def test_deferred_items_resolved_on_completion(next_item_mode: str, monkeypatch) -> None:
+    items_count = 1000
+
+    @dlt.defer
+    def _deferred(i: int) -> int:
+        time.sleep(0.01)
+        return i
+
+    async def _awaitable(i: int) -> int:
+        await asyncio.sleep(0.01)
+        return i
+
+    def deferred_gen():
+        for i in range(items_count):
+            yield _deferred(i)
+
+    def async_gen():
+        for i in range(items_count):
+            yield _awaitable(i)
+
+    # signals are checked only when waiting for futures times out
+    signal_checks = []
+    monkeypatch.setattr("dlt.extract.pipe.raise_if_signalled", lambda: signal_checks.append(1))
+
+    for gen, workers in [(deferred_gen, 100), (async_gen, 1)]:
+        # iterator that polls would wait a full poll interval before resolving a future
+        _l = list(PipeIterator.from_pipes([Pipe.from_data("data", gen())], max_parallel_items=items_count, workers=workers, futures_poll_interval=600, next_item_mode=next_item_mode))
+        assert sorted(_f_items(_l)) == list(range(items_count))
+    # iterator was always woken up by completed futures
+    assert signal_checks == []
+
+
+@skipifnotbenchmark
+@pytest.mark.parametrize("next_item_mode", ["fifo", "round_robin"])
+def test_deferred_items_throughput(next_item_mode: str) -> None:
+    items_count = 1000
+
+    @dlt.defer
+    def _deferred(i: int) -> int:
+        time.sleep(0.01)
+        return i
+
+    async def _awaitable(i: int) -> int:
+        await asyncio.sleep(0.01)
+        return i
+
+    def deferred_gen():
+        for i in range(items_count):
+            yield _deferred(i)
+
+    def async_gen():
+        for i in range(items_count):
+            yield _awaitable(i)
+
+    for gen, workers in [(deferred_gen, 100), (async_gen, 1)]:
+        started = time.time()
+        _l = list(PipeIterator.from_pipes([Pipe.from_data("data", gen())], max_parallel_items=items_count, workers=workers, next_item_mode=next_item_mode))
+        elapsed = time.time() - started
+        assert sorted(_f_items(_l)) == list(range(items_count))
+        print(f"{gen.__name__}: {items_count / elapsed:.0f} items/sec in {elapsed:.3f}s")
+
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_parallelized_gen_closed(fail: bool) -> None:
+    closed = []
+
+    def gen():
+        try:
+            yield from range(100)
+        finally:
+            closed.append(True)
+
+    def _fail(item):
+        raise ValueError(item)
+
+    pipe = Pipe.from_data("data", gen())
+    pipe.parallelized = "unordered"
+    if fail:
+        pipe.append_step(_fail)
+        with pytest.raises(ResourceExtractionError):
+            list(ManagedPipeIterator.from_pipe(pipe))
+    else:
+        with PipeIterator.from_pipe(pipe) as pipe_iter:
+            assert next(pipe_iter).item == 0
+    # the generator evaluated in the thread pool was closed
+    assert closed == [True]
+
+
 def test_add_step() -> None:
     data = [1, 2, 3]
     data_iter = iter(data)
@@ -608,6 +805,33 @@ def test_close_on_thread_pool_exception() -> None:
     assert_pipes_closed(raise_gen, long_gen)
 
 
+def test_close_on_async_generator_exception() -> None:
+    async def long_gen():
+        global close_pipe_got_exit, close_pipe_yielding
+
+        # will be closed by PipeIterator when it shuts down the event loop
+        try:
+            close_pipe_yielding = True
+            for i in range(0, 10000):
+                await asyncio.sleep(0)
+                yield i
+            close_pipe_yielding = False
+        except GeneratorExit:
+            close_pipe_got_exit = True
+
+    def raise_gen(item: int):
+        if item == 10:
+            raise RuntimeError("we fail")
+        yield item
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert_pipes_closed(raise_gen, long_gen)
+        gc.collect()
+    # no awaitable fetching the next item was left unawaited
+    assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+
 def test_close_on_sync_exception() -> None:
 
     def long_gen():
@@ -1,4 +1,6 @@
 import os
+import hashlib
+import time
 from time import sleep
 from typing import Optional, Any
 from datetime import datetime  # noqa: I251
@@ -15,11 +17,13 @@ from dlt.common.pendulum import pendulum, timedelta
 from dlt.common.pipeline import StateInjectableContext, resource_state
 from dlt.common.schema.schema import Schema
 from dlt.common.utils import uniq_id, digest128, chunks
-from dlt.common.json import json
+from dlt.common.json import json, custom_pua_encode
 
 from dlt.extract.source import DltSource
 from dlt.sources.helpers.transform import take_first
-from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
+from dlt.extract.incremental import IncrementalCursorPathHasValueNone, IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing, UNIQUE_HASH_LEN
+
+from tests.utils import skipifnotbenchmark
 
 
 def test_single_items_last_value_state_is_updated() -> None:
@@ -142,6 +146,26 @@ def test_nested_cursor_path() -> None:
     assert s['last_value'] == 2
 
 
+@pytest.mark.parametrize("cursor_path", ["data.created_at", "$.data.created_at", "data.*"])
+def test_key_chain_cursor_path(cursor_path: str) -> None:
+    @dlt.resource
+    def some_data(created_at=dlt.sources.incremental(cursor_path)):
+        yield [{'data': {'created_at': i}} for i in range(5)]
+        yield {'data': {'created_at': 5}}
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    s = some_data.state['incremental'][cursor_path]
+    assert s['last_value'] == 5
+
+    @dlt.resource
+    def missing_data(created_at=dlt.sources.incremental(cursor_path)):
+        yield [{'data': {'created_at': 1}}, {'data': 'created_at'}]
+
+    with pytest.raises(IncrementalCursorPathMissing):
+        list(missing_data)
+
+
 def test_explicit_initial_value() -> None:
     @dlt.resource
     def some_data(created_at=dlt.sources.incremental('created_at')):
@@ -339,7 +363,7 @@ def test_descending_order_unique_hashes() -> None:
 
     s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
 
-    last_hash = digest128(json.dumps({'created_at': 24}))
+    last_hash = hashlib.shake_128(json.dumps({'created_at': 24}).encode()).digest(UNIQUE_HASH_LEN)
 
     assert s['unique_hashes'] == [last_hash]
 
@@ -347,6 +371,111 @@ def test_descending_order_unique_hashes() -> None:
     assert list(some_data()) == []
 
 
+def test_many_rows_with_last_value_are_deduplicated() -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at'), max_id: int = 5000):
+        yield [{'created_at': 1, 'id': i} for i in range(max_id)]
+
+    pipeline_name = uniq_id()
+    p = dlt.pipeline(pipeline_name=pipeline_name)
+    p.extract(some_data())
+    s = some_data.state['incremental']['created_at']
+    # binary digests are stored in a few chunks
+    assert all(isinstance(h, bytes) for h in s['unique_hashes'])
+    assert sum(len(h) for h in s['unique_hashes']) == 5000 * UNIQUE_HASH_LEN
+    assert len(s['unique_hashes']) < 10
+
+    # state is restored from the working dir
+    p = dlt.pipeline(pipeline_name=pipeline_name)
+    p.activate()
+    assert list(some_data()) == []
+    assert [i['id'] for i in some_data(max_id=5002)] == [5000, 5001]
+
+
+def test_legacy_unique_hashes_state() -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at')):
+        yield [{'created_at': 1, 'id': i} for i in range(3)]
+
+    # base64 encoded digests were stored before
+    legacy_state = {"initial_value": None, "last_value": 1, "unique_hashes": [digest128(json.dumps(0)), digest128(json.dumps(1))]}
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        r.state["incremental"] = {"created_at": legacy_state}
+        assert [i['id'] for i in r] == [2]
+    assert len(legacy_state["unique_hashes"]) == 2
+    assert all(isinstance(h, bytes) for h in legacy_state["unique_hashes"])
+
+
+@pytest.mark.parametrize("encoding", ["typed", "plain", "pua"])
+def test_unique_hashes_chunks_serialization(encoding: str) -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at'), max_id: int = 100):
+        yield [{'created_at': 1, 'id': i} for i in range(max_id)]
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        assert len(list(r)) == 100
+        state = r.state["incremental"]["created_at"]
+    # chunks may come back as strings if state was serialized without type information
+    if encoding == "typed":
+        state = json.typed_loads(json.typed_dumps(state))
+    elif encoding == "plain":
+        state = json.loads(json.dumps(state))
+    else:
+        state = {k: [custom_pua_encode(c) for c in v] if k == "unique_hashes" else v for k, v in state.items()}
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data(max_id=102)
+        r.state["incremental"] = {"created_at": state}
+        assert [i['id'] for i in r] == [100, 101]
+    assert all(isinstance(h, bytes) for h in state["unique_hashes"])
+    assert sum(len(h) for h in state["unique_hashes"]) == 102 * UNIQUE_HASH_LEN
+
+
+@skipifnotbenchmark
+def test_unique_hashes_throughput() -> None:
+    rows_count = 1000000
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at')):
+        # all the rows have the same cursor value so all of them are hashed
+        yield from chunks([{'created_at': 1, 'id': i} for i in range(rows_count)], 10000)
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        started = time.time()
+        assert sum(1 for _ in r) == rows_count
+        print(f"first run: {rows_count / (time.time() - started):.0f} rows/sec")
+        state = r.state["incremental"]["created_at"]
+        started = time.time()
+        encoded_state = json.typed_dumps(state)
+        state = json.typed_loads(encoded_state)
+        print(f"state of {len(encoded_state)} bytes in {len(state['unique_hashes'])} chunks encoded and decoded in {time.time() - started:.3f}s")
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        r.state["incremental"] = {"created_at": state}
+        started = time.time()
+        # all the rows are deduplicated
+        assert list(r) == []
+        print(f"next run: {rows_count / (time.time() - started):.0f} rows/sec")
+
+
+def test_max_unique_hashes() -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at', max_unique_hashes=3)):
+        yield [{'created_at': 1, 'id': i} for i in range(5)]
+        # duplicates above the limit are deduplicated in the same run
+        yield [{'created_at': 1, 'id': i} for i in range(5)]
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    s = some_data.state['incremental']['created_at']
+    assert sum(len(h) for h in s['unique_hashes']) == 3 * UNIQUE_HASH_LEN
+    # rows above the limit are not deduplicated
+    assert [i['id'] for i in some_data()] == [3, 4]
+
+
 def test_unique_keys_json_identifiers() -> None:
     """Uses primary key name that is matching the name of the JSON element in the original namespace but gets converted into destination namespace"""
     @dlt.resource(primary_key="DelTa")
@@ -837,3 +966,188 @@ def test_out_of_range_flags() -> None:
     pipeline.extract(descending_single_item())
 
     pipeline.extract(ascending_single_item())
+
+
+@pytest.mark.parametrize("item_type", ["arrow", "pandas"])
+def test_arrow_items(item_type: str) -> None:
+    import pyarrow as pa
+    import pandas as pd
+
+    def _to_item(rows: Any) -> Any:
+        return pa.Table.from_pylist(rows) if item_type == "arrow" else pd.DataFrame(rows)
+
+    @dlt.resource(primary_key="id")
+    def some_data(last_id: int, created_at=dlt.sources.incremental('created_at', initial_value=1)):
+        yield _to_item([{'id': i, 'created_at': i // 3} for i in range(last_id)])
+
+    def _ids(items: Any) -> Any:
+        ids = []
+        for item in items:
+            assert isinstance(item, pa.Table if item_type == "arrow" else pd.DataFrame)
+            ids.extend(item["id"].to_pylist() if item_type == "arrow" else item["id"].tolist())
+        return ids
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data(10)
+        # rows lower than initial value are filtered out
+        assert _ids(r) == list(range(3, 10))
+        s = r.state['incremental']['created_at']
+        assert s['last_value'] == 3
+        assert sum(len(h) for h in s['unique_hashes']) == UNIQUE_HASH_LEN
+        # rows with the last value are deduplicated
+        assert _ids(some_data(10)) == []
+        assert _ids(some_data(14)) == [10, 11, 12, 13]
+        assert s['last_value'] == 4
+        assert sum(len(h) for h in s['unique_hashes']) == 2 * UNIQUE_HASH_LEN
+
+    @dlt.resource
+    def end_value_data(created_at=dlt.sources.incremental('created_at', initial_value=1, end_value=3)):
+        yield _to_item([{'id': i, 'created_at': i // 3} for i in range(12)])
+
+    r = end_value_data()
+    assert _ids(r) == list(range(3, 9))
+    assert r.incremental._incremental.end_out_of_range is True
+
+    @dlt.resource
+    def missing_cursor_data(created_at=dlt.sources.incremental('updated_at')):
+        yield _to_item([{'id': 1, 'created_at': 1}])
+
+    with pytest.raises(IncrementalCursorPathMissing):
+        list(missing_cursor_data())
+
+
+@pytest.mark.parametrize("item_type", ["object", "arrow", "pandas"])
+def test_cursor_value_none(item_type: str) -> None:
+    import pyarrow as pa
+    import pandas as pd
+
+    rows = [{'id': 1, 'created_at': 1}, {'id': 2, 'created_at': None}, {'id': 3, 'created_at': 3}]
+
+    @dlt.resource
+    def none_cursor_data(created_at=dlt.sources.incremental('created_at', initial_value=1)):
+        if item_type == "arrow":
+            yield pa.Table.from_pylist(rows)
+        elif item_type == "pandas":
+            yield pd.DataFrame(rows)
+        else:
+            yield rows
+
+    # rows with None cursor are not dropped silently, object and arrow items raise the same error
+    with pytest.raises(IncrementalCursorPathHasValueNone) as py_ex:
+        list(none_cursor_data())
+    assert py_ex.value.json_path == "created_at"
+
+
+def test_split_range() -> None:
+    created_at = dlt.sources.incremental("created_at", initial_value=0, end_value=100)
+    parts = created_at.split(3)
+    assert [(p.initial_value, p.end_value) for p in parts] == [(0, 33), (33, 66), (66, 100)]
+    assert all(p.cursor_path == "created_at" for p in parts)
+    # empty ranges are skipped
+    assert len(dlt.sources.incremental("created_at", initial_value=0, end_value=2).split(4)) == 2
+    parts = dlt.sources.incremental("created_at", initial_value="2022-01-01T00:00:00Z", end_value="2022-01-03T00:00:00Z").split(2)
+    assert [(p.initial_value, p.end_value) for p in parts] == [
+        ("2022-01-01T00:00:00Z", "2022-01-02T00:00:00Z"), ("2022-01-02T00:00:00Z", "2022-01-03T00:00:00Z")
+    ]
+    # boundaries keep the format of the initial value
+    parts = dlt.sources.incremental("created_at", initial_value="2022-01-01T00:00:00+00:00", end_value="2022-01-02T00:00:00+00:00").split(3)
+    assert [(p.initial_value, p.end_value) for p in parts] == [
+        ("2022-01-01T00:00:00+00:00", "2022-01-01T08:00:00+00:00"),
+        ("2022-01-01T08:00:00+00:00", "2022-01-01T16:00:00+00:00"),
+        ("2022-01-01T16:00:00+00:00", "2022-01-02T00:00:00+00:00"),
+    ]
+    parts = dlt.sources.incremental("created_at", initial_value="2022-01-01T00:00:00.000+0200", end_value="2022-01-01T00:00:01.000+0200").split(2)
+    assert [(p.initial_value, p.end_value) for p in parts] == [
+        ("2022-01-01T00:00:00.000+0200", "2022-01-01T00:00:00.500+0200"), ("2022-01-01T00:00:00.500+0200", "2022-01-01T00:00:01.000+0200")
+    ]
+    # date only ranges are split on whole days
+    parts = dlt.sources.incremental("created_at", initial_value="2022-01-01", end_value="2022-01-05").split(2)
+    assert [(p.initial_value, p.end_value) for p in parts] == [("2022-01-01", "2022-01-03"), ("2022-01-03", "2022-01-05")]
+    parts = dlt.sources.incremental("created_at", initial_value="2022-01-01", end_value="2022-01-03").split(4)
+    assert [(p.initial_value, p.end_value) for p in parts] == [("2022-01-01", "2022-01-02"), ("2022-01-02", "2022-01-03")]
+    with pytest.raises(ValueError):
+        dlt.sources.incremental("created_at", initial_value=0).split(2)
+
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        # the source returns a bit more than requested
+        for i in range(max(created_at.start_value - 5, 0), created_at.end_value + 5):
+            yield {"id": i, "created_at": i}
+
+    @dlt.source
+    def backfill():
+        for i, part in enumerate(created_at.split(4)):
+            yield dlt.resource(some_data, name=f"some_data_{i}", table_name="some_data", parallelized=True)(created_at=part)
+
+    p = dlt.pipeline(pipeline_name=uniq_id(), destination="duckdb", credentials=duckdb.connect(':memory:'))
+    p.run(backfill())
+    with p.sql_client() as c:
+        with c.execute_query("SELECT id FROM some_data ORDER BY id") as cur:
+            assert [row[0] for row in cur.fetchall()] == list(range(100))
+
+
+@pytest.mark.parametrize("item_type", ["object", "arrow"])
+def test_row_order_closes_generator(item_type: str) -> None:
+    import pyarrow as pa
+
+    requested_pages = []
+
+    def _pages(values: Any) -> Any:
+        for page in chunks(list(values), 10):
+            requested_pages.append(page[0])
+            rows = [{"updated_at": i} for i in page]
+            yield pa.Table.from_pylist(rows) if item_type == "arrow" else rows
+
+    @dlt.resource
+    def ascending(updated_at=dlt.sources.incremental("updated_at", initial_value=10, end_value=35, row_order="asc")):
+        yield from _pages(range(0, 100))
+
+    assert sum(len(i) if isinstance(i, pa.Table) else 1 for i in ascending()) == 25
+    # the generator was closed on the page that contains the end value
+    assert requested_pages == [0, 10, 20, 30]
+
+    @dlt.resource
+    def descending(updated_at=dlt.sources.incremental("updated_at", initial_value=75, row_order="desc")):
+        yield from _pages(reversed(range(0, 100)))
+
+    requested_pages.clear()
+    assert sum(len(i) if isinstance(i, pa.Table) else 1 for i in descending()) == 25
+    assert requested_pages == [99, 89, 79]
+
+    # with min function the ascending rows leave the range at the start value
+    @dlt.resource
+    def ascending_min(updated_at=dlt.sources.incremental("updated_at", initial_value=25, last_value_func=min, row_order="asc")):
+        yield from _pages(range(0, 100))
+
+    requested_pages.clear()
+    assert sum(len(i) if isinstance(i, pa.Table) else 1 for i in ascending_min()) == 26
+    assert requested_pages == [0, 10, 20]
+
+
+@pytest.mark.parametrize("mode", ["async", "parallelized"])
+def test_row_order_closes_async_and_parallelized_generator(mode: str) -> None:
+    requested_pages = []
+    closed = []
+
+    if mode == "async":
+        @dlt.resource
+        async def ascending(updated_at=dlt.sources.incremental("updated_at", initial_value=10, end_value=35, row_order="asc")):
+            try:
+                for page in chunks(list(range(0, 100)), 10):
+                    requested_pages.append(page[0])
+                    yield [{"updated_at": i} for i in page]
+            finally:
+                closed.append(True)
+    else:
+        @dlt.resource(parallelized=True)
+        def ascending(updated_at=dlt.sources.incremental("updated_at", initial_value=10, end_value=35, row_order="asc")):
+            try:
+                for page in chunks(list(range(0, 100)), 10):
+                    requested_pages.append(page[0])
+                    yield [{"updated_at": i} for i in page]
+            finally:
+                closed.append(True)
+
+    assert len(list(ascending())) == 25
+    # the resource generator itself was closed on the page that contains the end value
+    assert requested_pages == [0, 10, 20, 30]
+    assert closed == [True]
@@ -8,7 +8,7 @@ from dlt.common.pipeline import StateInjectableContext, source_state
 from dlt.common.schema import Schema
 from dlt.common.typing import TDataItems
 from dlt.extract.exceptions import InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, ResourcesNotFoundError
-from dlt.extract.pipe import Pipe
+from dlt.extract.pipe import Pipe, PipeIterator
 from dlt.extract.typing import FilterItem, MapItem
 from dlt.extract.source import DltResource, DltSource
 
@@ -712,6 +712,28 @@ def test_add_transform_steps_pipe() -> None:
     assert list(r) == ['1', '2', '2', '3', '3', '3']
 
 
+def test_resource_batch_size() -> None:
+    @dlt.resource(batch_size=4)
+    def numbers():
+        yield from range(5)
+        # lists and items with meta are not batched
+        yield [100, 101]
+        yield dlt.mark.with_table_name(200, "other")
+        yield from range(5, 10)
+
+    r = numbers()
+    assert r.batch_size == 4
+    # filters and maps are applied to batches
+    pipe_items = [pi.item for pi in PipeIterator.from_pipe(r.add_filter(lambda i: i % 2 == 0).add_map(lambda i: i * 10)._pipe)]
+    assert pipe_items == [[0, 20], [40], [1000], 2000, [60, 80]]
+    pipe_items = [pi.item for pi in PipeIterator.from_pipe(numbers()._pipe)]
+    assert pipe_items == [[0, 1, 2, 3], [4], [100, 101], 200, [5, 6, 7, 8], [9]]
+
+    # limit counts the original items
+    r = dlt.resource(itertools.count(), name="infinity", batch_size=3).add_limit(7)
+    assert list(r) == list(range(7))
+
+
 def test_limit_infinite_counter() -> None:
     r = dlt.resource(itertools.count(), name="infinity").add_limit(10)
     assert list(r) == list(range(10))
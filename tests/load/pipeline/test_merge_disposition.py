@@ -1,4 +1,5 @@
 from copy import copy
+import hashlib
 import itertools
 import random
 from typing import List
@@ -11,7 +12,7 @@ from dlt.common import json, pendulum
 from dlt.common.configuration.container import Container
 from dlt.common.pipeline import StateInjectableContext
 from dlt.common.typing import AnyFun, StrAny
-from dlt.common.utils import digest128
+from dlt.extract.incremental import UNIQUE_HASH_LEN
 from dlt.extract.source import DltResource
 from dlt.sources.helpers.transform import skip_first, take_first
 
@@ -290,13 +291,13 @@ def test_merge_with_dispatch_and_incremental(destination_name: str, github_resou
         assert len(list(_get_shuffled_events(True) | github_resource)) == 100
         incremental_state = github_resource.state
         assert incremental_state["incremental"]["created_at"]["last_value"] == newest_issue["created_at"]
-        assert incremental_state["incremental"]["created_at"]["unique_hashes"] == [digest128(f'"{newest_issue["id"]}"')]
+        assert incremental_state["incremental"]["created_at"]["unique_hashes"] == [hashlib.shake_128(f'"{newest_issue["id"]}"'.encode()).digest(UNIQUE_HASH_LEN)]
         # subsequent load will skip all elements
         assert len(list(_get_shuffled_events(True) | github_resource)) == 0
         # add one more issue
         assert len(list(_new_event("new_node") | github_resource)) == 1
         assert incremental_state["incremental"]["created_at"]["last_value"] > newest_issue["created_at"]
-        assert incremental_state["incremental"]["created_at"]["unique_hashes"] != [digest128(str(newest_issue["id"]))]
+        assert incremental_state["incremental"]["created_at"]["unique_hashes"] != [hashlib.shake_128(f'"{newest_issue["id"]}"'.encode()).digest(UNIQUE_HASH_LEN)]
 
     # load to destination
     p = dlt.pipeline(destination=destination_name, dataset_name="github_3", full_refresh=True)
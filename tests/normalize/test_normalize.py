@@ -1,4 +1,7 @@
+import os
+import gzip
 import pytest
+import time
 from fnmatch import fnmatch
 from typing import Dict, Iterator, List, Sequence, Tuple
 from multiprocessing import get_start_method, Pool
@@ -6,18 +9,20 @@ from multiprocessing.dummy import Pool as ThreadPool
 
 from dlt.common import json
 from dlt.common.schema.schema import Schema
+from dlt.common.schema.utils import new_table
 from dlt.common.utils import uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
-from dlt.common.storages import NormalizeStorage, LoadStorage
+from dlt.common.storages import FileStorage, NormalizeStorage, LoadStorage
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.configuration.container import Container
 
 from dlt.extract.extract import ExtractorStorage
 from dlt.normalize import Normalize
+from dlt.normalize.normalize import _WORKER_SCHEMAS, FileChunk
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
-from tests.utils import TEST_DICT_CONFIG_PROVIDER, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging
+from tests.utils import TEST_DICT_CONFIG_PROVIDER, TEST_STORAGE_ROOT, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging
 from tests.normalize.utils import json_case_path, INSERT_CAPS, JSONL_CAPS, DEFAULT_CAPS, ALL_CAPABILITIES
 
 
@@ -323,6 +328,119 @@ def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_
     assert_schema(schema)
 
 
+def test_map_parallel_small_packages_latency(raw_normalize: Normalize) -> None:
+    # many small packages must not wait for polling intervals between the worker results
+    packages = 5
+    with ThreadPool(processes=4) as pool:
+        started = time.time()
+        for idx in range(packages):
+            for table_idx in range(8):
+                extract_items(raw_normalize.normalize_storage, [{"id": idx, "value": table_idx}], "small", f"table_{table_idx}")
+            raw_normalize.run(pool)
+        elapsed = time.time() - started
+    assert len(raw_normalize.load_storage.list_packages()) == packages
+    # each package paid at least 300ms when map_parallel polled the tasks
+    assert elapsed < packages * 0.3
+
+
+def test_worker_schema_cache(raw_normalize: Normalize) -> None:
+    schema = Schema("cached")
+    schema.update_schema(new_table("items", columns=[{"name": "id", "data_type": "bigint", "nullable": False}]))
+    worker_schema = Normalize.worker_schema(schema)
+    caps = raw_normalize.config.destination_capabilities
+    w_schema = Normalize._w_get_schema(raw_normalize.load_storage, caps, "load_id", worker_schema)
+    assert w_schema.version_hash == schema.version_hash
+    # compiled once, workers get copies
+    cached = [s for s in _WORKER_SCHEMAS.values() if s.name == "cached"]
+    assert len(cached) == 1
+    w_schema.update_schema(new_table("other"))
+    w_schema_2 = Normalize._w_get_schema(raw_normalize.load_storage, caps, "load_id", worker_schema._replace(stored_schema=None))
+    assert "other" not in w_schema_2.tables
+    assert [s for s in _WORKER_SCHEMAS.values() if s.name == "cached"] == cached
+    # updates are applied to the copy
+    partial = new_table("items", columns=[{"name": "value", "data_type": "text", "nullable": True}])
+    w_schema_3 = Normalize._w_get_schema(raw_normalize.load_storage, caps, "load_id", worker_schema._replace(schema_updates=[{"items": [partial]}]))
+    assert "value" in w_schema_3.get_table_columns("items")
+    assert "value" not in cached[0].get_table_columns("items")
+
+
+def test_normalize_reuses_worker_schema(raw_normalize: Normalize, monkeypatch) -> None:
+    loaded_schemas: List[str] = []
+    load_temp_schema = LoadStorage.load_temp_schema
+
+    def _load_temp_schema(self: LoadStorage, load_id: str) -> Schema:
+        loaded_schemas.append(load_id)
+        return load_temp_schema(self, load_id)
+
+    monkeypatch.setattr(LoadStorage, "load_temp_schema", _load_temp_schema)
+    with ThreadPool(processes=2) as pool:
+        extract_items(raw_normalize.normalize_storage, [{"id": 1}], "reused", "items")
+        raw_normalize.run(pool)
+        assert len(loaded_schemas) == 1
+        # schema changed so workers load it again
+        extract_items(raw_normalize.normalize_storage, [{"id": 2}], "reused", "items")
+        raw_normalize.run(pool)
+        assert len(loaded_schemas) == 2
+        # schema is the same, workers use the compiled schema
+        extract_items(raw_normalize.normalize_storage, [{"id": 3}], "reused", "items")
+        raw_normalize.run(pool)
+        assert len(loaded_schemas) == 2
+    assert len(raw_normalize.load_storage.list_packages()) == 3
+
+
+@pytest.mark.parametrize("sample_items", (None, 10))
+def test_normalize_infer_schema_sample(raw_normalize: Normalize, sample_items: int, monkeypatch) -> None:
+    tasks: List[Sequence[str]] = []
+    w_normalize_files = Normalize.w_normalize_files
+
+    def _w_normalize_files(*args):
+        tasks.append(args[-1])
+        return w_normalize_files(*args)
+
+    monkeypatch.setattr(Normalize, "w_normalize_files", _w_normalize_files)
+    # workers infer conflicting types of the same new column
+    extract_items(raw_normalize.normalize_storage, [{"id": 1, "value": 1}], "conflict", "items")
+    extract_items(raw_normalize.normalize_storage, [{"id": 2, "value": "text"}], "conflict", "items")
+    raw_normalize.config.infer_schema_sample_items = sample_items
+    with ThreadPool(processes=2) as pool:
+        raw_normalize.run(pool)
+    schema = raw_normalize.load_or_create_schema(raw_normalize.schema_storage, "conflict")
+    columns = schema.get_table_columns("items")
+    assert "value" in columns
+    assert len(raw_normalize.load_storage.list_packages()) == 1
+    if sample_items:
+        # schema was settled before the files were sent to the workers so no task was retried
+        assert len(tasks) == 2
+        # type is inferred from the first file, text is a variant of bigint but int is coerced into text
+        expected_columns = {"value", "value__v_text"} if columns["value"]["data_type"] == "bigint" else {"value"}
+        assert {name for name in columns if name.startswith("value")} == expected_columns
+        load_id = raw_normalize.load_storage.list_packages()[0]
+        schema_update = raw_normalize.load_storage.begin_schema_update(load_id)
+        assert expected_columns <= set(schema_update["items"]["columns"])
+
+
+def test_normalize_infer_schema_sample_fallback(raw_normalize: Normalize, monkeypatch) -> None:
+    tasks: List[Sequence[str]] = []
+    w_normalize_files = Normalize.w_normalize_files
+
+    def _w_normalize_files(*args):
+        tasks.append(args[-1])
+        return w_normalize_files(*args)
+
+    monkeypatch.setattr(Normalize, "w_normalize_files", _w_normalize_files)
+    # conflicting column is first seen after the sample
+    extract_items(raw_normalize.normalize_storage, [{"id": 1}, {"id": 2, "value": 1}], "conflict", "items")
+    extract_items(raw_normalize.normalize_storage, [{"id": 3}, {"id": 4, "value": "text"}], "conflict", "items")
+    raw_normalize.config.infer_schema_sample_items = 1
+    with ThreadPool(processes=2) as pool:
+        raw_normalize.run(pool)
+    schema = raw_normalize.load_or_create_schema(raw_normalize.schema_storage, "conflict")
+    # workers inferred the column and the conflicting task was normalized again
+    assert "value" in schema.get_table_columns("items")
+    assert len(tasks) == 3
+    assert len(raw_normalize.load_storage.list_packages()) == 1
+
+
 def test_group_worker_files() -> None:
 
     files = ["f%03d" % idx for idx in range(0, 100)]
@@ -331,14 +449,74 @@ def test_group_worker_files() -> None:
     assert Normalize.group_worker_files(["f001"], 1) == [["f001"]]
     assert Normalize.group_worker_files(["f001"], 100) == [["f001"]]
     assert Normalize.group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert Normalize.group_worker_files(files[:5], 4) == [["f000"], ["f001"], ["f002"], ["f003", "f004"]]
-    assert Normalize.group_worker_files(files[:8], 4) == [["f000", "f001"], ["f002", "f003"], ["f004", "f005"], ["f006", "f007"]]
-    assert Normalize.group_worker_files(files[:8], 3) == [["f000", "f001"], ["f002", "f003", "f006"], ["f004", "f005", "f007"]]
-    assert Normalize.group_worker_files(files[:5], 3) == [["f000"], ["f001", "f003"], ["f002", "f004"]]
+    assert Normalize.group_worker_files(files[:5], 4) == [["f000", "f004"], ["f001"], ["f002"], ["f003"]]
+    assert Normalize.group_worker_files(files[:8], 4) == [["f000", "f004"], ["f001", "f005"], ["f002", "f006"], ["f003", "f007"]]
+    assert Normalize.group_worker_files(files[:5], 3) == [["f000", "f003"], ["f001", "f004"], ["f002"]]
 
     # check if sorted
     files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert Normalize.group_worker_files(files, 3) == [["chd.3"], ["chd.4", "tab1.2"], ["tab1.1", "tab1.3"]]
+    assert Normalize.group_worker_files(files, 3) == [["chd.3", "tab1.2"], ["chd.4", "tab1.3"], ["tab1.1"]]
+
+    # large files get their own groups, small files are packed together
+    files = ["big", "s1", "s2", "s3", "medium"]
+    assert Normalize.group_worker_files(files, 2, [100, 10, 10, 10, 60]) == [["big"], ["medium", "s1", "s2", "s3"]]
+    assert Normalize.group_worker_files(files, 3, [100, 10, 10, 10, 60]) == [["big"], ["medium"], ["s1", "s2", "s3"]]
+    # chunks of the same file are kept in order
+    chunks = [FileChunk("big", 0, 50), FileChunk("big", 50, None)]
+    assert Normalize.group_worker_files(chunks + ["small"], 1, [50, 50, 10]) == [chunks + ["small"]]
+
+
+@pytest.mark.parametrize("compressed", (True, False))
+def test_split_worker_files(compressed: bool) -> None:
+    lines = [json.dumpb([{"idx": idx, "pad": "x" * (idx % 7)}]) + b"\n" for idx in range(200)]
+    file_path = os.path.join(TEST_STORAGE_ROOT, "items.jsonl")
+    os.makedirs(TEST_STORAGE_ROOT, exist_ok=True)
+    with (gzip.open if compressed else open)(file_path, "wb") as f:  # type: ignore[operator]
+        f.write(b"".join(lines))
+    size, splittable = Normalize.estimate_file_bytes(file_path)
+    assert splittable is True
+    assert size == sum(len(line) for line in lines)
+
+    worker_files, worker_sizes = Normalize.split_worker_files([file_path], [(size, splittable)], size // 5)
+    assert len(worker_files) == 6
+    assert sum(worker_sizes) == size
+    assert worker_files[0].start == 0
+    assert worker_files[-1].end is None
+    # every line is read exactly once
+    read_lines = []
+    for chunk in worker_files:
+        with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+            read_lines.extend(Normalize._read_lines(f, chunk.start, chunk.end))
+    assert read_lines == lines
+
+    # small files and parquet files are not split
+    assert Normalize.split_worker_files([file_path], [(size, True)], size) == ([file_path], [size])
+    assert Normalize.split_worker_files([file_path], [(size, False)], 1) == ([file_path], [size])
+    assert Normalize.split_worker_files([file_path], [(size, True)], 0) == ([file_path], [size])
+
+
+@pytest.mark.parametrize("caps", JSONL_CAPS[:1], indirect=True)
+def test_normalize_split_large_file(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    # write many lines into single extracted file
+    extractor = ExtractorStorage(raw_normalize.normalize_storage.config)
+    extract_id = extractor.create_extract_id()
+    with TEST_DICT_CONFIG_PROVIDER().values({"data_writer": {"buffer_max_items": 10}}):
+        for idx in range(0, 1000, 10):
+            extractor.write_data_item(extract_id, "split", "items", [{"id": i, "value": str(i)} for i in range(idx, idx + 10)], None)
+    extractor.close_writers(extract_id)
+    extractor.commit_extract_files(extract_id)
+    raw_normalize.config.file_split_min_bytes = 1
+    with ThreadPool(processes=4) as pool:
+        raw_normalize.run(pool)
+    load_id = raw_normalize.load_storage.list_packages()[0]
+    jobs = [job for job in raw_normalize.load_storage.list_new_jobs(load_id) if raw_normalize.load_storage.parse_job_file_name(job).table_name == "items"]
+    # chunks of the file were normalized by several workers
+    assert len(jobs) == 4
+    ids = []
+    for job in jobs:
+        with FileStorage.open_zipsafe_ro(raw_normalize.load_storage.storage.make_full_path(job)) as f:
+            ids.extend(json.loads(line)["id"] for line in f if line.strip())
+    assert sorted(ids) == list(range(1000))
 
 
 EXPECTED_ETH_TABLES = ["blocks", "blocks__transactions", "blocks__transactions__logs", "blocks__transactions__logs__topics",
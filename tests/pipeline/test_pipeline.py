@@ -1,25 +1,27 @@
 import logging
+import multiprocessing
 import os
 import random
+import sys
 from typing import Any
 from tenacity import retry_if_exception, Retrying, stop_after_attempt
 
 import pytest
 
 import dlt
-from dlt.common import json, sleep
+from dlt.common import json, logger, sleep
 from dlt.common.configuration.container import Container
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.exceptions import DestinationHasFailedJobs, DestinationTerminalException, PipelineStateNotAvailable, UnknownDestinationModule
 from dlt.common.pipeline import PipelineContext
 from dlt.common.runtime.collector import AliveCollector, EnlightenCollector, LogCollector, TqdmCollector
-from dlt.common.schema.exceptions import InvalidDatasetName
+from dlt.common.schema.exceptions import CannotCoerceColumnException, InvalidDatasetName
 from dlt.common.utils import uniq_id
-from dlt.extract.exceptions import SourceExhausted
+from dlt.extract.exceptions import ProcessExtractNotSupported, SourceExhausted
 from dlt.extract.extract import ExtractorStorage
 from dlt.extract.source import DltResource, DltSource
 from dlt.load.exceptions import LoadClientJobFailed
-from dlt.pipeline.exceptions import InvalidPipelineName, PipelineNotActive, PipelineStepFailed
+from dlt.pipeline.exceptions import InvalidPipelineName, MicroBatchReplaceNotSupported, PipelineNotActive, PipelineStepFailed
 from dlt.pipeline.helpers import retry_load
 from dlt.pipeline.state_sync import STATE_TABLE_NAME
 from dlt.common.configuration.specs.exceptions import NativeValueError
@@ -916,6 +918,137 @@ def test_extract_add_tables() -> None:
     assert schema.tables["_wide_peacock"]["resource"] == "🦚WidePeacock"
 
 
+def test_extract_in_processes() -> None:
+    os.environ["EXTRACT__PROCESS_WORKERS"] = "2"
+
+    @dlt.source
+    def numbers():
+
+        @dlt.resource
+        def odd():
+            dlt.current.resource_state()["last"] = 9
+            dlt.current.source_state()["odd_runs"] = dlt.current.source_state().get("odd_runs", 0) + 1
+            dlt.current.source_state().setdefault("seen", {})["odd"] = True
+            yield [1, 3, 5, 7, 9]
+
+        @dlt.resource
+        def even():
+            dlt.current.resource_state()["last"] = 8
+            dlt.current.source_state().setdefault("seen", {})["even"] = True
+            yield [0, 2, 4, 6, 8]
+
+        @dlt.transformer(data_from=even, table_name=lambda i: "doubled_" + str(i["value"] % 8))
+        def doubled(items):
+            dlt.current.resource_state()["count"] = len(items)
+            for i in items:
+                yield {"value": i * 2}
+
+        return odd, even, doubled
+
+    pipeline = dlt.pipeline(pipeline_name="extract_processes_" + uniq_id(), destination="dummy")
+    pipeline.extract(numbers())
+    # all shards committed together with the pipeline state
+    storage = ExtractorStorage(pipeline._normalize_storage_config)
+    assert len(storage.list_files_to_normalize_sorted()) == 5
+    expect_extracted_file(storage, "numbers", "odd", json.dumps([1,3,5,7,9]))
+    expect_extracted_file(storage, "numbers", "even", json.dumps([0,2,4,6,8]))
+    # dynamic tables from the other process got into the schema
+    assert "doubled_0" in pipeline.default_schema.tables
+    assert "doubled_4" in pipeline.default_schema.tables
+    # resource state from all processes merged
+    resources_state = pipeline.state["sources"]["numbers"]["resources"]
+    assert resources_state == {"odd": {"last": 9}, "even": {"last": 8}, "doubled": {"count": 5}}
+    # source scoped keys changed in one process are not overwritten by the other
+    assert pipeline.state["sources"]["numbers"]["seen"] == {"odd": True, "even": True}
+    pipeline.extract(numbers())
+    assert pipeline.state["sources"]["numbers"]["odd_runs"] == 2
+
+
+@pytest.mark.parametrize("option", ["PIPELINED_RUN", "MICRO_BATCH_MAX_ITEMS", "EXTRACT_CHECKPOINT_FILES"])
+def test_extract_in_processes_unsupported_options(option: str) -> None:
+    os.environ["EXTRACT__PROCESS_WORKERS"] = "2"
+    os.environ[option] = "true" if option == "PIPELINED_RUN" else "10"
+
+    pipeline = dlt.pipeline(pipeline_name="extract_processes_" + uniq_id(), destination="dummy")
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        pipeline.run([dlt.resource([1, 2, 3], name="odd"), dlt.resource([2, 4], name="even")])
+    assert isinstance(py_ex.value.exception, ProcessExtractNotSupported)
+    assert py_ex.value.exception.process_workers == 2
+
+
+def test_extract_in_processes_failed_shard() -> None:
+    os.environ["EXTRACT__PROCESS_WORKERS"] = "2"
+
+    @dlt.source
+    def numbers():
+
+        @dlt.resource
+        def odd():
+            yield [1, 3, 5]
+
+        @dlt.resource
+        def failing():
+            yield [0, 2]
+            raise RuntimeError("shard failed")
+
+        return odd, failing
+
+    pipeline = dlt.pipeline(pipeline_name="extract_processes_" + uniq_id(), destination="dummy")
+    with pytest.raises(PipelineStepFailed):
+        pipeline.extract(numbers())
+    # extract folders of the shards are removed, only the folder of the source is left
+    storage = ExtractorStorage(pipeline._normalize_storage_config)
+    assert len(storage.storage.list_folder_dirs(ExtractorStorage.EXTRACT_FOLDER, to_root=False)) == 1
+
+
+def test_extract_dynamic_hints_cached() -> None:
+
+    @dlt.resource(
+        table_name=lambda i: "events_" + i["type"],
+        primary_key=lambda i: "id" if i["type"] == "push" else "event_id",
+        write_disposition="merge"
+    )
+    def events():
+        for n in range(100):
+            yield {"id": n, "event_id": n, "type": "push" if n % 2 else "pull"}
+
+    @dlt.resource(table_name=lambda i: "numbers_" + str(i % 3))
+    def numbers():
+        yield from range(30)
+
+    pipeline = dlt.pipeline(pipeline_name="extract_hints_" + uniq_id(), destination="dummy")
+    info = pipeline.extract([events(), numbers()])
+    # table schema computed once per table name and hints values
+    assert info.metrics == {"dynamic_table_schemas": 5, "dynamic_table_schemas_cached": 125}
+    assert pipeline.last_trace.steps[-1].step_info.metrics == info.metrics
+    schema = pipeline.default_schema
+    assert schema.tables["events_push"]["columns"]["id"]["primary_key"] is True
+    assert schema.tables["events_pull"]["columns"]["event_id"]["primary_key"] is True
+    assert schema.tables["numbers_2"]["resource"] == "numbers"
+
+    @dlt.resource(table_name=lambda i: "keys", primary_key=lambda i: "id" if i["id"] < 50 else "event_id")
+    def keys():
+        for n in range(100):
+            yield {"id": n, "event_id": n}
+
+    # other dynamic hints are evaluated only for the first item of a table
+    pipeline = dlt.pipeline(pipeline_name="extract_hints_" + uniq_id(), destination="dummy")
+    info = pipeline.extract(keys())
+    assert info.metrics == {"dynamic_table_schemas": 1, "dynamic_table_schemas_cached": 99}
+    assert list(pipeline.default_schema.tables["keys"]["columns"]) == ["id"]
+
+    # unless evaluation for each item is requested
+    keys_per_item = keys()
+    keys_per_item.evaluate_hints_per_item = True
+    assert keys_per_item.clone().evaluate_hints_per_item is True
+    pipeline = dlt.pipeline(pipeline_name="extract_hints_" + uniq_id(), destination="dummy")
+    info = pipeline.extract(keys_per_item)
+    assert info.metrics == {"dynamic_table_schemas": 2, "dynamic_table_schemas_cached": 98}
+    columns = pipeline.default_schema.tables["keys"]["columns"]
+    assert columns["id"]["primary_key"] is True
+    assert columns["event_id"]["primary_key"] is True
+
+
 def test_emojis_resource_names() -> None:
     pipeline = dlt.pipeline(pipeline_name="emojis", destination="duckdb")
     info = pipeline.run(airtable_emojis())
@@ -941,3 +1074,248 @@ def test_emojis_resource_names() -> None:
     assert_load_info(info)
     table = info.load_packages[0].schema_update["_wide_peacock"]
     assert table["resource"] == "🦚WidePeacock"
+
+
+def test_pipelined_run() -> None:
+    os.environ["PIPELINED_RUN"] = "true"
+    os.environ["SOURCES__DATA_WRITER__FILE_MAX_ITEMS"] = "100"
+    streamed_files = []
+
+    @dlt.resource(primary_key="id", write_disposition="merge")
+    def items(fail_at: int = None):
+        for n in range(1000):
+            if n == fail_at:
+                raise RuntimeError("extract failed")
+            if n == 500:
+                # files are being normalized while extract is running
+                streams = dlt.current.pipeline()._extract_normalize.streams
+                streamed_files.extend(streams["pipelined"].files)
+            yield {"id": n, "nested": [n]}
+
+    pipeline = dlt.pipeline(pipeline_name="pipelined_" + uniq_id(), destination="duckdb")
+    info = pipeline.run(items(), schema=dlt.Schema("pipelined"))
+    # data and state in single package
+    assert_load_info(info)
+    assert len(streamed_files) == 5
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM items")[0][0] == 1000
+        assert client.execute_sql("SELECT COUNT(1) FROM items__nested")[0][0] == 1000
+    assert pipeline.default_schema.get_table("items")["write_disposition"] == "merge"
+
+    # files extracted before failure are dropped
+    with pytest.raises(PipelineStepFailed):
+        pipeline.run(items(fail_at=700), schema=dlt.Schema("pipelined"))
+    assert pipeline.list_extracted_resources() == []
+    assert pipeline.list_normalized_load_packages() == []
+    # no temp load packages left
+    assert set(os.listdir(os.path.join(pipeline.working_dir, "load"))) == {"loaded", "normalized", ".version"}
+
+
+def test_pipelined_run_settings(monkeypatch) -> None:
+    os.environ["PIPELINED_RUN"] = "true"
+    os.environ["NORMALIZE__WORKERS"] = "3"
+    pipelined_workers = []
+
+    @dlt.resource
+    def items():
+        extract_normalize = dlt.current.pipeline()._extract_normalize
+        pipelined_workers.append(extract_normalize.config.workers if extract_normalize else None)
+        yield from ({"id": n} for n in range(100))
+
+    # configured normalize workers are used
+    pipeline = dlt.pipeline(pipeline_name="pipelined_" + uniq_id(), destination="duckdb")
+    assert_load_info(pipeline.run(items()))
+    assert pipelined_workers == [3]
+
+    # in notebook data is normalized after extract
+    monkeypatch.setattr(sys.modules["dlt.pipeline.pipeline"], "is_interactive", lambda: True)
+    os.environ["NORMALIZE__WORKERS"] = "1"
+    assert_load_info(pipeline.run(items()))
+    assert pipelined_workers == [3, None]
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM items")[0][0] == 200
+
+
+def test_micro_batches_run() -> None:
+    os.environ["MICRO_BATCH_MAX_ITEMS"] = "300"
+    loaded_batches = []
+
+    @dlt.resource(write_disposition="append")
+    def items(updated_at=dlt.sources.incremental("id")):
+        for n in range(1000):
+            if n % 300 == 0:
+                # previous batches are loaded in the background
+                loaded_batches.append(len(pipeline.list_completed_load_packages()))
+            yield {"id": n}
+
+    pipeline = dlt.pipeline(pipeline_name="micro_batches_" + uniq_id(), destination="duckdb")
+    info = pipeline.run(items())
+    assert_load_info(info, expected_load_packages=4)
+    assert loaded_batches[0] == 0
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM items")[0][0] == 1000
+        # state with incremental checkpoint loaded with each batch
+        versions = [row[0] for row in client.execute_sql("SELECT version FROM _dlt_pipeline_state ORDER BY version")]
+    assert len(versions) == len(set(versions)) == 4
+    state = pipeline.state["sources"][pipeline.default_schema_name]["resources"]["items"]["incremental"]["id"]
+    assert state["last_value"] == 999
+
+    # nothing new to load
+    info = pipeline.run(items())
+    assert len(info.loads_ids) <= 1
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM items")[0][0] == 1000
+
+    # replaced tables would lose data loaded by previous batches
+    replaced_items = items()
+    replaced_items.apply_hints(write_disposition="replace")
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        pipeline.run(replaced_items)
+    assert isinstance(py_ex.value.exception, MicroBatchReplaceNotSupported)
+
+
+
+def test_micro_batches_failed_jobs(monkeypatch) -> None:
+    os.environ["MICRO_BATCH_MAX_ITEMS"] = "300"
+    os.environ["FAIL_PROB"] = "1.0"
+    os.environ["LOAD__WORKERS"] = "3"
+
+    @dlt.resource(write_disposition="append")
+    def items():
+        yield from ({"id": n} for n in range(1000))
+
+    # failed jobs of the micro batches are reported in load info
+    pipeline = dlt.pipeline(pipeline_name="micro_batches_" + uniq_id(), destination="dummy")
+    load_settings = []
+    get_load = pipeline._get_load
+
+    def _get_load(workers, raise_on_failed_jobs, collector):
+        load_settings.append((workers, raise_on_failed_jobs))
+        return get_load(workers, raise_on_failed_jobs, collector)
+
+    monkeypatch.setattr(pipeline, "_get_load", _get_load)
+    info = pipeline.run(items())
+    # background loads use the configured loader settings
+    assert load_settings[0] == (3, False)
+    assert len(info.loads_ids) == 4
+    assert info.has_failed_jobs is True
+    assert all(package.jobs["failed_jobs"] for package in info.load_packages)
+
+    # or raised when the micro batch loads are joined
+    os.environ["RAISE_ON_FAILED_JOBS"] = "true"
+    pipeline = dlt.pipeline(pipeline_name="micro_batches_" + uniq_id(), destination="dummy")
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        pipeline.run(items())
+    assert py_ex.value.step == "load"
+    assert isinstance(py_ex.value.__context__, LoadClientJobFailed)
+    assert pipeline.get_load_package_info(py_ex.value.step_info.loads_ids[0]).state == "aborted"
+
+
+def test_extract_checkpoints() -> None:
+    os.environ["EXTRACT_CHECKPOINT_FILES"] = "3"
+    os.environ["SOURCES__DATA_WRITER__FILE_MAX_ITEMS"] = "100"
+    pipeline_name = "extract_checkpoints_" + uniq_id()
+    kill_at = 750
+
+    @dlt.resource
+    def items(updated_at=dlt.sources.incremental("id")):
+        for n in range(1000):
+            if n == kill_at:
+                # kill the process without any cleanup
+                os._exit(1)
+            yield {"id": n}
+
+    # items are still in flight in the thread pool when a checkpoint is due
+    @dlt.transformer(data_from=items, parallelized=True)
+    def slow_items(item):
+        sleep(0.001)
+        yield item
+
+    def _run() -> None:
+        dlt.pipeline(pipeline_name=pipeline_name, destination="duckdb").run(slow_items)
+
+    process = multiprocessing.get_context("fork").Process(target=_run)
+    process.start()
+    process.join()
+    assert process.exitcode == 1
+
+    pipeline = dlt.pipeline(pipeline_name=pipeline_name, destination="duckdb")
+    # two checkpoints of at least 3 files were committed with the incremental state
+    assert len(pipeline.list_extracted_resources()) >= 6
+    last_value = pipeline.state["sources"][pipeline.default_schema_name]["resources"]["items"]["incremental"]["id"]["last_value"]
+    assert 599 <= last_value < kill_at
+
+    # pending checkpoints contain all the items up to the checkpointed state
+    kill_at = None
+    pipeline.normalize()
+    info = pipeline.load()
+    assert_load_info(info)
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1), MAX(id) FROM slow_items")[0] == (last_value + 1, last_value)
+    # then extract resumes from the last checkpoint
+    info = pipeline.run(slow_items)
+    assert_load_info(info)
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1), COUNT(DISTINCT id) FROM slow_items")[0] == (1000, 1000)
+
+
+def test_extract_checkpoints_pipelined_run(monkeypatch) -> None:
+    os.environ["EXTRACT_CHECKPOINT_FILES"] = "3"
+    os.environ["PIPELINED_RUN"] = "true"
+    os.environ["SOURCES__DATA_WRITER__FILE_MAX_ITEMS"] = "100"
+    warnings = []
+    monkeypatch.setattr(logger, "warning", lambda msg, *args, **kwargs: warnings.append(msg), raising=False)
+
+    @dlt.resource
+    def items():
+        yield from ({"id": n} for n in range(1000))
+
+    pipeline = dlt.pipeline(pipeline_name="extract_checkpoints_" + uniq_id(), destination="duckdb")
+    checkpoints = []
+    monkeypatch.setattr(pipeline, "_extract_checkpoint", lambda *args: checkpoints.append(args))
+    info = pipeline.run(items())
+    assert_load_info(info)
+    # checkpoints are disabled with a warning and all the items are loaded in a single package
+    assert checkpoints == []
+    assert len(warnings) == 1
+    assert "checkpoints" in warnings[0]
+    assert len(info.loads_ids) == 1
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT COUNT(1) FROM items")[0][0] == 1000
+
+
+def test_arrow_and_pandas_passthrough() -> None:
+    pa = pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+
+    table = pa.table({"id": [1, 2, 3], "name": ["a", "b", None]})
+    df = pd.DataFrame({"id": [4, 5], "name": ["d", "e"], "value": [1.5, 2.5]})
+
+    @dlt.resource
+    def arrow_items():
+        yield table.to_batches()[0]
+        yield df
+
+    pipeline = dlt.pipeline(pipeline_name="arrow_" + uniq_id(), destination="duckdb")
+    info = pipeline.run(arrow_items())
+    assert_load_info(info)
+    columns = pipeline.default_schema.get_table_columns("arrow_items")
+    assert {n: c["data_type"] for n, c in columns.items()} == {
+        "id": "bigint", "name": "text", "value": "double", "_dlt_load_id": "text", "_dlt_id": "text"
+    }
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql("SELECT id, name, value, _dlt_load_id, _dlt_id FROM arrow_items ORDER BY id")
+    assert [r[:3] for r in rows] == [(1, "a", None), (2, "b", None), (3, None, None), (4, "d", 1.5), (5, "e", 2.5)]
+    assert all(r[3] == info.loads_ids[0] for r in rows)
+    assert len({r[4] for r in rows}) == 5
+
+    # arrow columns are cast to the data types already in the schema
+    info = pipeline.run(dlt.resource([pa.table({"id": [6.0], "name": [7]})], name="arrow_items"))
+    assert_load_info(info)
+    assert pipeline.default_schema.get_table_columns("arrow_items")["id"]["data_type"] == "bigint"
+    with pipeline.sql_client() as client:
+        assert client.execute_sql("SELECT id, name FROM arrow_items WHERE id = 6") == [(6, "7")]
+    # or the normalize fails if they cannot be cast
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        pipeline.run(dlt.resource([pa.table({"id": [6.5]})], name="arrow_items"))
+    assert isinstance(py_ex.value.__context__, CannotCoerceColumnException)
@@ -4,16 +4,18 @@ import pytest
 
 import dlt
 
+from dlt.common.configuration.container import Container
 from dlt.common.exceptions import PipelineStateNotAvailable, ResourceNameNotAvailable
 from dlt.common.schema import Schema
 from dlt.common.source import get_current_pipe_name
 from dlt.common.storages import FileStorage
 from dlt.common import pipeline as state_module
+from dlt.common.pipeline import StateInjectableContext
 from dlt.common.utils import uniq_id
 
 from dlt.pipeline.exceptions import PipelineStateEngineNoUpgradePathException, PipelineStepFailed
 from dlt.pipeline.pipeline import Pipeline
-from dlt.pipeline.state_sync import migrate_state, STATE_ENGINE_VERSION
+from dlt.pipeline.state_sync import json_decode_state, json_encode_state, load_state_from_destination, migrate_state, STATE_ENGINE_VERSION
 
 from tests.utils import test_storage
 from tests.pipeline.utils import json_case_path, load_json_case, airtable_emojis
@@ -442,3 +444,27 @@ def test_resource_state_name_not_normalized() -> None:
         state = load_state_from_destination(pipeline.pipeline_name, client)
         assert "airtable_emojis" in state["sources"]
         assert state["sources"]["airtable_emojis"]["resources"] == {"🦚Peacock": {"🦚🦚🦚": "🦚"}}
+
+
+def test_incremental_unique_hashes_state_sync() -> None:
+    @dlt.resource(primary_key="id")
+    def items(created_at=dlt.sources.incremental("created_at"), max_id: int = 2000):
+        yield [{"created_at": 1, "id": i} for i in range(max_id)]
+
+    pipeline = dlt.pipeline(pipeline_name="unique_hashes_" + uniq_id(), destination="duckdb")
+    pipeline.run(items())
+    incremental_state = pipeline.state["sources"][pipeline.default_schema_name]["resources"]["items"]["incremental"]["created_at"]
+    unique_hashes = incremental_state["unique_hashes"]
+    assert all(isinstance(chunk, bytes) for chunk in unique_hashes)
+
+    # binary chunks of digests survive the state encoding
+    state = json_decode_state(json_encode_state(pipeline.state))
+    assert state["sources"][pipeline.default_schema_name]["resources"]["items"]["incremental"]["created_at"]["unique_hashes"] == unique_hashes
+    # and the state stored in the destination
+    with pipeline.sql_client() as client:
+        state = load_state_from_destination(pipeline.pipeline_name, client)
+    assert state["sources"][pipeline.default_schema_name]["resources"]["items"]["incremental"]["created_at"]["unique_hashes"] == unique_hashes
+
+    # state restored from destination deduplicates the rows
+    with Container().injectable_context(StateInjectableContext(state=state)):
+        assert [i["id"] for i in items(max_id=2002)] == [2000, 2001]
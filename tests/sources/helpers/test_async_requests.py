@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import dlt
+from dlt.common.configuration.specs import RunConfiguration
+from dlt.sources.helpers.requests.async_client import (
+    DEFAULT_ASYNC_RETRY_EXCEPTIONS, AsyncClient, _make_async_retry, async_retry_if_status, async_wait_exponential_retry_after
+)
+
+from aiohttp import ClientResponseError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            status = server.statuses.pop(0) if server.statuses else 200
+        try:
+            time.sleep(server.delay)
+            body = ('{"path": "%s"}' % self.path).encode("utf-8")
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.requests: List[str] = []
+        self.statuses: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+def test_async_client_get(server: _Server) -> None:
+    async def _get() -> Dict[str, Any]:
+        async with AsyncClient() as client:
+            response = await client.get(server.url + "/item/1")
+            assert response.status == 200
+            return await response.json()  # type: ignore[no-any-return]
+
+    assert _run(_get()) == {"path": "/item/1"}
+
+
+@pytest.mark.parametrize("status", (503, 429))
+def test_async_client_retry_on_status(server: _Server, status: int) -> None:
+    server.statuses = [status, status]
+
+    async def _get() -> int:
+        async with AsyncClient(request_backoff_factor=0.01) as client:
+            response = await client.get(server.url + "/retry")
+            return response.status
+
+    assert _run(_get()) == 200
+    assert len(server.requests) == 3
+
+
+def test_async_client_raise_after_max_attempts(server: _Server) -> None:
+    server.statuses = [500] * 10
+
+    async def _get() -> None:
+        async with AsyncClient(request_backoff_factor=0.01, request_max_attempts=3) as client:
+            await client.get(server.url + "/fail")
+
+    with pytest.raises(ClientResponseError) as py_ex:
+        _run(_get())
+    assert py_ex.value.status == 500
+    assert len(server.requests) == 3
+
+    # no raise returns the last response
+    server.statuses = [500] * 10
+
+    async def _get_no_raise() -> int:
+        async with AsyncClient(request_backoff_factor=0.01, request_max_attempts=2, raise_for_status=False) as client:
+            return (await client.get(server.url + "/fail")).status
+
+    assert _run(_get_no_raise()) == 500
+
+
+def test_async_client_retry_condition(server: _Server) -> None:
+    def should_retry(response: Any, exception: BaseException) -> bool:
+        return response is not None and response.url.path == "/condition" and len(server.requests) < 2
+
+    async def _get() -> None:
+        async with AsyncClient(request_backoff_factor=0.01, retry_condition=should_retry) as client:
+            await client.get(server.url + "/condition")
+
+    _run(_get())
+    assert len(server.requests) == 2
+
+
+def test_async_client_retry_on_connection_error() -> None:
+    # nothing listens on the port
+    server = _Server()
+    url = server.url
+    server.server_close()
+
+    async def _get() -> None:
+        async with AsyncClient(request_backoff_factor=0.01, request_max_attempts=2) as client:
+            await client.get(url)
+
+    with pytest.raises(DEFAULT_ASYNC_RETRY_EXCEPTIONS):
+        _run(_get())
+
+
+def test_async_client_per_host_limit(server: _Server) -> None:
+    server.delay = 0.05
+
+    async def _get_all() -> None:
+        async with AsyncClient(max_connections=3) as client:
+            await asyncio.gather(*[client.get(server.url + f"/item/{i}") for i in range(12)])
+
+    _run(_get_all())
+    assert len(server.requests) == 12
+    assert server.max_in_flight == 3
+
+
+def test_async_client_config() -> None:
+    client = AsyncClient()
+    retry = _make_async_retry(**client._retry_kwargs)
+    assert retry.stop.max_attempt_number == RunConfiguration.request_max_attempts  # type: ignore[attr-defined]
+    assert isinstance(retry.retry.retries[0], async_retry_if_status)  # type: ignore[attr-defined]
+    assert isinstance(retry.wait, async_wait_exponential_retry_after)
+
+
+def test_async_client_in_transformer(server: _Server) -> None:
+    server.delay = 0.05
+    client = AsyncClient(max_connections=5)
+
+    @dlt.transformer(data_from=dlt.resource(range(20), name="ids"))
+    async def details(item_id: int):
+        response = await client.get(server.url + f"/item/{item_id}")
+        yield await response.json()
+
+    started = time.time()
+    items = list(details)
+    assert sorted(item["path"] for item in items) == sorted(f"/item/{i}" for i in range(20))
+    # requests were sent concurrently on the pipe iterator event loop but not more than the per host limit
+    assert server.max_in_flight == 5
+    assert time.time() - started < 20 * 0.05
+
+    # session of the pipe iterator event loop was closed with the loop
+    assert client._sessions == {}
+
+
+def test_async_client_session_closed(server: _Server) -> None:
+    client = AsyncClient()
+    sessions = []
+
+    async def _get() -> None:
+        await client.get(server.url + "/item/1")
+        sessions.append(await client.get_session())
+        # same session is reused on the same event loop
+        await client.get(server.url + "/item/2")
+        assert await client.get_session() is sessions[-1]
+
+    # session is closed when asyncio.run shuts down the event loop
+    _run(_get())
+    _run(_get())
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+    assert client._sessions == {}
+
+    async def _get_and_close() -> None:
+        await _get()
+        await client.close()
+        assert sessions[-1].closed
+        assert client._sessions == {}
+
+    _run(_get_and_close())
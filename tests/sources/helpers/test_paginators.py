@@ -0,0 +1,170 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import dlt
+from dlt.common import json
+from dlt.sources.helpers.paginators import paginate_links, paginate_offset, paginate_page_number
+
+TOTAL_ITEMS = 95
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        server = self.server
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            # first page of the offset and links endpoints is not delayed by `delay_after_first`
+            is_first = query.get("offset", "0") == "0" and query.get("page", "0") == "0"
+            time.sleep(server.delay if is_first else server.delay + server.delay_after_first)
+            headers = {}
+            if parsed.path == "/offset":
+                offset, limit = int(query["offset"]), int(query["limit"])
+                body: Any = list(range(offset, min(offset + limit, TOTAL_ITEMS)))
+            elif parsed.path == "/page":
+                page = int(query["page"])
+                body = {"items": list(range((page - 1) * 10, min(page * 10, TOTAL_ITEMS)))}
+            elif parsed.path == "/links":
+                page = int(query.get("page", 0))
+                body = [page]
+                if page < 4:
+                    headers["Link"] = f'<{server.url}/links?page={page + 1}>; rel="next"'
+            else:
+                cursor = int(query.get("cursor", 0))
+                body = {"items": [cursor], "next_cursor": cursor + 1 if cursor < 4 else None}
+            data = json.dumpb(body)
+            self.send_response(200)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.requests: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+        self.delay_after_first = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_paginate_offset(server: _Server) -> None:
+    server.delay = 0.05
+    started = time.time()
+    pages = list(paginate_offset(server.url + "/offset", limit=10, prefetch=4))
+    # pages are yielded in order
+    assert [item for page in pages for item in page] == list(range(TOTAL_ITEMS))
+    assert len(pages) == 10
+    # pages were requested concurrently
+    assert server.max_in_flight == 4
+    assert time.time() - started < 10 * 0.05
+    # pages past the last one were requested but not yielded
+    assert len(server.requests) <= 13
+
+
+def test_paginate_page_number(server: _Server) -> None:
+    pages = list(paginate_page_number(server.url + "/page", prefetch=3, data_selector=lambda r: r.json()["items"], params={"filter": "all"}))
+    assert [item for page in pages for item in page] == list(range(TOTAL_ITEMS))
+    assert all("filter=all" in r for r in server.requests)
+    # max pages
+    pages = list(paginate_page_number(server.url + "/page", max_pages=2, data_selector=lambda r: r.json()["items"]))
+    assert len(pages) == 2
+
+
+def test_paginate_stops_early(server: _Server) -> None:
+    # pages past the first one are slow
+    server.delay_after_first = 1.0
+    for gen in (paginate_offset(server.url + "/offset", limit=10, prefetch=4), paginate_links(server.url + "/links")):
+        assert next(gen) in (list(range(10)), [0])
+        started = time.time()
+        # prefetched pages in flight are not waited for
+        gen.close()
+        assert time.time() - started < 0.5
+
+
+def test_paginate_page_size(server: _Server) -> None:
+    select_items = lambda r: r.json()["items"]
+    # stops on the page with less than page_size items, no page past it is requested
+    pages = list(paginate_page_number(server.url + "/page", prefetch=1, page_size=10, data_selector=select_items))
+    assert [item for page in pages for item in page] == list(range(TOTAL_ITEMS))
+    assert len(server.requests) == 10
+    # otherwise the empty page stops the pagination
+    server.requests.clear()
+    pages = list(paginate_page_number(server.url + "/page", prefetch=1, data_selector=select_items))
+    assert len(pages) == 10
+    assert len(server.requests) == 11
+
+
+def test_paginate_links(server: _Server) -> None:
+    server.delay = 0.05
+    requested_while_processing = []
+
+    started = time.time()
+    for page in paginate_links(server.url + "/links"):
+        # the next page is being fetched while the current one is processed
+        time.sleep(0.05)
+        requested_while_processing.append(len(server.requests))
+    assert requested_while_processing == [2, 3, 4, 5, 5]
+    assert time.time() - started < 10 * 0.05
+
+
+def test_paginate_cursor(server: _Server) -> None:
+    def next_cursor(response: Any) -> Any:
+        cursor = response.json()["next_cursor"]
+        return {"cursor": cursor} if cursor is not None else None
+
+    pages = list(paginate_links(server.url + "/cursor", next_page=next_cursor, data_selector=lambda r: r.json()["items"], params={"filter": "all"}))
+    assert pages == [[0], [1], [2], [3], [4]]
+    assert all("filter=all" in r for r in server.requests)
+
+
+def test_paginate_in_resource(server: _Server) -> None:
+
+    @dlt.resource(parallelized=True)
+    def offset_items():
+        yield from paginate_offset(server.url + "/offset", limit=10)
+
+    @dlt.resource(parallelized=True)
+    def link_items():
+        yield from paginate_links(server.url + "/links")
+
+    assert sorted(offset_items()) == list(range(TOTAL_ITEMS))
+    assert sorted(list(offset_items()) + list(link_items())) == sorted(list(range(TOTAL_ITEMS)) + list(range(5)))
@@ -10,10 +10,12 @@ import requests
 import requests_mock
 from tenacity import wait_exponential, RetryCallState, RetryError
 
-from tests.utils import preserve_environ
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage, preserve_environ
+from dlt.common.utils import uniq_id
 import dlt
 from dlt.common.configuration.specs import RunConfiguration
 from dlt.sources.helpers.requests import Session, Client, client as default_client
+from dlt.sources.helpers.requests.cache import RequestsCache, CACHE_FOLDER
 from dlt.sources.helpers.requests.retry import (
     DEFAULT_RETRY_EXCEPTIONS, DEFAULT_RETRY_STATUS, retry_if_status, retry_any, Retrying, wait_exponential_retry_after
 )
@@ -198,3 +200,106 @@ def test_client_instance_with_config(existing_session: bool) -> None:
     assert retry.wait.multiplier == cfg['RUNTIME__REQUEST_BACKOFF_FACTOR']
     assert retry.stop.max_attempt_number == cfg['RUNTIME__REQUEST_MAX_ATTEMPTS']
     assert retry.wait.max == cfg['RUNTIME__REQUEST_MAX_RETRY_DELAY']
+
+
+def test_cache_revalidation() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    session = Session(cache=RequestsCache(cache_dir))
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, [
+            dict(json={"v": 1}, headers={"ETag": "etag_1"}),
+            dict(status_code=304, headers={"ETag": "etag_1"}),
+            dict(json={"v": 2}, headers={"ETag": "etag_2"}),
+        ])
+        assert session.get(url).json() == {"v": 1}
+        # not modified response is returned from cache
+        response = session.get(url)
+        assert response.status_code == 200
+        assert response.json() == {"v": 1}
+        assert response.from_cache is True  # type: ignore[attr-defined]
+        assert m.request_history[1].headers["If-None-Match"] == "etag_1"
+        # modified response replaces the cached one
+        assert session.get(url).json() == {"v": 2}
+        assert m.call_count == 3
+        # params are part of the key
+        m.get(url + "?page=2", json={"page": 2}, headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert session.get(url, params={"page": 2}).json() == {"page": 2}
+        session.get(url, params={"page": 2})
+        assert m.request_history[-1].headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+        # post requests are not cached by default
+        m.post(url, json={"posted": True})
+        session.post(url, json={"q": 1})
+        session.post(url, json={"q": 1})
+        assert m.request_history[-1].method == "POST"
+        assert m.call_count == 7
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_cache_key_headers() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    session = Session(cache=RequestsCache(cache_dir, ttl=3600))
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, [dict(json={"user": "a"}), dict(json={"user": "b"}), dict(json={"user": "anonymous"})])
+        assert session.get(url, headers={"Authorization": "Bearer a"}).json() == {"user": "a"}
+        # responses are not shared between credentials
+        assert session.get(url, headers={"Authorization": "Bearer b"}).json() == {"user": "b"}
+        assert session.get(url, auth=("user", "pass")).json() == {"user": "anonymous"}
+        assert session.get(url, headers={"Authorization": "Bearer a"}).json() == {"user": "a"}
+        # other headers are not part of the key
+        assert session.get(url, headers={"Authorization": "Bearer b", "User-Agent": "dlt"}).json() == {"user": "b"}
+        assert m.call_count == 3
+
+    # custom headers may be added to the key
+    session = Session(cache=RequestsCache(cache_dir, ttl=3600, key_headers=("X-Api-Key",)))
+    with requests_mock.mock(session=session) as m:
+        m.get(url, [dict(json={"key": 1}), dict(json={"key": 2})])
+        assert session.get(url, headers={"X-Api-Key": "1"}).json() == {"key": 1}
+        assert session.get(url, headers={"X-Api-Key": "2"}).json() == {"key": 2}
+        assert session.get(url, headers={"X-Api-Key": "1"}).json() == {"key": 1}
+        assert m.call_count == 2
+
+
+def test_cache_ttl_and_eviction() -> None:
+    cache_dir = os.path.join(TEST_STORAGE_ROOT, "http_cache")
+    session = Session(cache=RequestsCache(cache_dir, ttl=3600, max_bytes=2000, methods=("GET", "POST")))
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=session) as m:
+        m.get(url, text="x" * 500)
+        m.post(url, text="y" * 500)
+        for _ in range(3):
+            assert session.get(url).text == "x" * 500
+        # fresh response is not revalidated
+        assert m.call_count == 1
+        # body is a part of the key
+        session.post(url, json={"q": 1})
+        session.post(url, json={"q": 1})
+        session.post(url, json={"q": 2})
+        assert m.call_count == 3
+        # error responses are not cached
+        m.get(url + "/error", status_code=404)
+        with pytest.raises(requests.HTTPError):
+            session.get(url + "/error")
+        assert m.call_count == 4
+        # least recently used responses are evicted
+        for page in range(5):
+            session.get(url, params={"page": page})
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_cache_in_pipeline_working_dir() -> None:
+    os.environ["RUNTIME__REQUEST_CACHE"] = "true"
+    client = Client()
+    url = 'https://example.com/data'
+
+    with requests_mock.mock(session=client.session) as m:
+        m.get(url, json={"v": 1}, headers={"ETag": "etag_1"})
+        # no active pipeline, cache is bypassed
+        client.get(url)
+        pipeline = dlt.pipeline(pipeline_name="http_cache_" + uniq_id())
+        client.get(url)
+        assert os.listdir(os.path.join(pipeline.working_dir, CACHE_FOLDER))
@@ -174,3 +174,7 @@ skipifnotwindows = pytest.mark.skipif(
 skipifwindows = pytest.mark.skipif(
     platform.system() == "Windows", reason="does not runs on windows"
 )
+
+skipifnotbenchmark = pytest.mark.skipif(
+    not os.environ.get("DLT_RUN_BENCHMARKS"), reason="benchmarks run only when DLT_RUN_BENCHMARKS is set"
+)